@@ -16,7 +16,12 @@ from werkzeug.exceptions import RequestEntityTooLarge
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from payroll_generator.calculator import PayrollCalculator
+from payroll_generator.proration import prorate_roster
+from payroll_generator.validation import validate_roster
+from payroll_generator.compliance import scan_compliance
 from payroll_generator.excel_handler import ExcelHandler
+from payroll_generator.parse_cache import RosterParseCache
+from payroll_generator.config import ROSTER_CACHE_MAX_BYTES
 from payroll_generator.pdf_generator import PDFGenerator
 from payroll_generator.logger import setup_logger
 from flask_login import current_user
@@ -29,13 +34,16 @@ from app.utils.analytics import (
 
 logger = setup_logger()
 
+# 응답에 포함할 명부 검증 항목 수
+VALIDATION_ISSUE_LIMIT = 100
+
 # Blueprint 생성
 main_bp = Blueprint('main', __name__)
 
 
 def allowed_file(filename):
     """파일 확장자 검증"""
-    allowed_extensions = current_app.config.get('ALLOWED_EXTENSIONS', {'xlsx', 'xls'})
+    allowed_extensions = current_app.config.get('ALLOWED_EXTENSIONS', {'xlsx', 'xls', 'csv', 'parquet', 'arrow', 'feather'})
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in allowed_extensions
 
@@ -77,7 +85,7 @@ def upload_file():
             return jsonify({'error': '파일을 선택해주세요.'}), 400
         
         if not allowed_file(file.filename):
-            return jsonify({'error': '엑셀 파일(.xlsx, .xls)만 업로드 가능합니다.'}), 400
+            return jsonify({'error': '엑셀(.xlsx, .xls), CSV, Parquet, Arrow 파일만 업로드 가능합니다.'}), 400
         
         # 세션 ID 생성
         session_id = str(uuid.uuid4())
@@ -89,8 +97,14 @@ def upload_file():
         filepath = os.path.join(upload_folder, f"{session_id}_{filename}")
         file.save(filepath)
         
-        # 엑셀 파일 읽기
-        excel_handler = ExcelHandler()
+        # 엑셀 파일 읽기 (같은 내용의 재업로드는 파싱 캐시 사용)
+        try:
+            roster_cache = RosterParseCache(current_app.config.get('ROSTER_CACHE_FOLDER'),
+                                            current_app.config.get('ROSTER_CACHE_MAX_BYTES', ROSTER_CACHE_MAX_BYTES))
+        except OSError as e:
+            logger.warning(f"명부 캐시 폴더를 만들 수 없어 캐시 없이 읽습니다: {str(e)}")
+            roster_cache = None
+        excel_handler = ExcelHandler(cache=roster_cache)
         try:
             df = excel_handler.read_employee_data(filepath)
         except FileNotFoundError as e:
@@ -106,21 +120,59 @@ def upload_file():
             logger.exception(f"엑셀 파일 읽기 오류: {str(e)}")
             return jsonify({'error': f'엑셀 파일을 읽는 중 오류가 발생했습니다: {str(e)}'}), 400
         
-        # 급여 계산
-        calculator = PayrollCalculator()
+        # 명부 값 검증 (오류 행은 계산에서 제외하고 검증 결과를 응답에 포함)
+        report = validate_roster(df)
+        if not report.ok:
+            logger.warning(f"명부 검증 오류 행을 제외합니다: {report.summary()}")
+            df = report.valid_rows(df)
+            if df.empty:
+                return jsonify({
+                    'error': f'계산할 수 있는 직원 데이터가 없습니다: {report.summary()}',
+                    'validation': report.to_dict(VALIDATION_ISSUE_LIMIT)
+                }), 400
+        
+        # 법정 기준 점검 (최저임금/연장근무 한도/보험료 상한 - 일할 계산 전 월 기준, 명세서 발행은 계속)
+        try:
+            compliance = scan_compliance(df, period).to_dict(VALIDATION_ISSUE_LIMIT)
+        except Exception as e:
+            logger.warning(f"법정 기준 점검 실패: {str(e)}")
+            compliance = None
+        
+        # 급여 기간 중 입사/퇴사자 일할 계산 (실패 시 전체 월 기준으로 계산)
+        try:
+            df = prorate_roster(df, period)
+        except ValueError as e:
+            logger.warning(f"일할 계산 실패, 전체 월 기준으로 계산합니다: {e}")
+        
+        # 급여 계산 (급여 기간의 요율 적용)
+        calculator = PayrollCalculator(period)
         results = []
         
-        for idx, row in df.iterrows():
-            try:
-                payroll_data = calculator.calculate_deductions(row.to_dict())
+        try:
+            # 명부 전체를 한 번에 계산 (벡터 연산)
+            payroll_records = calculator.calculate_batch_records(df)
+            employee_records = df.to_dict('records')
+            for idx, employee_data, payroll_data in zip(df.index, employee_records, payroll_records):
                 results.append({
-                    'employee_name': row.get('이름', f'직원{idx+1}'),
+                    'employee_name': employee_data.get('이름', f'직원{idx+1}'),
                     'payroll_data': payroll_data,
-                    'employee_data': row.to_dict()
+                    'employee_data': employee_data
                 })
-            except Exception as e:
-                logger.exception(f"급여 계산 오류: {row.get('이름', '')} - {str(e)}")
-                continue
+        except Exception as e:
+            # 잘못된 값이 섞여 있으면 행 단위 계산으로 폴백 (오류 행만 건너뜀)
+            logger.warning(f"일괄 계산 실패, 행 단위 계산으로 전환: {str(e)}")
+            results = []
+            for idx, row in df.iterrows():
+                try:
+                    payroll_data = calculator.calculate_deductions(row.to_dict())
+                    results.append({
+                        'employee_name': row.get('이름', f'직원{idx+1}'),
+                        'payroll_data': payroll_data,
+                        'employee_data': row.to_dict()
+                    })
+                except Exception as e:
+                    logger.exception(f"급여 계산 오류: {row.get('이름', '')} - {str(e)}")
+                    continue
         
         # 세션에 결과 저장
         session['results'] = results
@@ -161,6 +213,8 @@ def upload_file():
             'success': True,
             'session_id': session_id,
             'count': len(results),
+            'validation': report.to_dict(VALIDATION_ISSUE_LIMIT),
+            'compliance': compliance,
             'redirect': f'/result/{session_id}'
         })
         
@@ -346,9 +400,58 @@ def download_file(format, employee_name):
         return jsonify({'error': f'파일 생성 오류: {str(e)}'}), 500
 
 
+def _batch_design_name():
+    """세션의 디자인 이름 ('default'이거나 사용할 수 없는 디자인이면 None)"""
+    design_name = session.get('design_name', None)
+    logger.info(f"[일괄 다운로드] 세션에서 읽은 design_name: '{design_name}'")
+    
+    if design_name == 'default':
+        design_name = None
+        logger.info("[일괄 다운로드] 'default'를 None으로 변환")
+    
+    if design_name:
+        # 디자인 사용 가능 여부 확인
+        try:
+            from payroll_generator.templates.designs.design_factory import DesignFactory
+            if not DesignFactory.is_design_available(design_name):
+                logger.warning(f"[일괄 다운로드] 사용 불가능한 디자인: '{design_name}', 기본 방식 사용")
+                design_name = None
+            else:
+                logger.info(f"[일괄 다운로드] 디자인 '{design_name}' 사용 가능 확인")
+        except Exception as e:
+            logger.error(f"[일괄 다운로드] 디자인 검증 중 오류: {e}", exc_info=True)
+            design_name = None
+    
+    logger.info(f"[일괄 다운로드] 최종 사용할 design_name: '{design_name}'")
+    return design_name
+
+
+def _log_batch_download(file_type, file_name, file_path, format, results, period):
+    """일괄 다운로드 파일 생성 로그 저장"""
+    try:
+        user_id = current_user.id if current_user.is_authenticated else None
+        file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+        log_file_generation(
+            user_id=user_id,
+            file_type=file_type,
+            file_name=file_name,
+            file_size=file_size,
+            employee_count=len(results),
+            period=period,
+            file_path=file_path
+        )
+        log_activity(
+            user_id=user_id,
+            activity_type='file_download',
+            activity_data={'file_type': file_type, 'format': format, 'employee_count': len(results)}
+        )
+    except Exception as e:
+        logger.error(f'파일 생성 로그 저장 오류: {str(e)}')
+
+
 @main_bp.route('/batch_download/<format>')
 def batch_download(format):
-    """일괄 다운로드 (ZIP 파일)"""
+    """일괄 다운로드 (ZIP 파일, workbook이면 직원마다 시트 1개인 엑셀 파일 하나)"""
     if 'results' not in session:
         return jsonify({'error': '세션이 만료되었습니다.'}), 404
     
@@ -356,41 +459,41 @@ def batch_download(format):
     period = session.get('period', '')
     output_folder = current_app.config['OUTPUT_FOLDER']
     
-    if format not in ['excel', 'pdf', 'both']:
+    if format not in ['excel', 'pdf', 'both', 'workbook']:
         return jsonify({'error': '지원하지 않는 형식입니다.'}), 400
     
     try:
+        excel_handler = ExcelHandler()
+        # 디자인 선택: 'default'는 None으로 변환하여 기본 방식 사용
+        design_name = _batch_design_name()
+        
+        # 통합 엑셀 (만들 수 없는 디자인이면 엑셀 ZIP으로 생성)
+        if format == 'workbook':
+            temp_workbook = tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx')
+            workbook_path = temp_workbook.name
+            temp_workbook.close()
+            try:
+                with excel_handler.open_payroll_workbook(workbook_path, period, design_name=design_name) as workbook:
+                    for result_item in results:
+                        workbook.add(result_item['payroll_data'], result_item['employee_data'])
+            except ValueError as e:
+                logger.warning(f"[일괄 다운로드] 통합 엑셀을 만들 수 없어 엑셀 ZIP으로 생성합니다: {e}")
+                if os.path.exists(workbook_path):
+                    os.unlink(workbook_path)
+                format = 'excel'
+            else:
+                download_name = f'급여명세서_{period}.xlsx'
+                _log_batch_download('xlsx', download_name, workbook_path, format, results, period)
+                return send_file(workbook_path, as_attachment=True, download_name=download_name)
+        
         # 임시 ZIP 파일 생성
         temp_zip = tempfile.NamedTemporaryFile(delete=False, suffix='.zip')
         zip_path = temp_zip.name
         temp_zip.close()
         
         with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            excel_handler = ExcelHandler()
             pdf_generator = PDFGenerator()
-            # 디자인 선택: 'default'는 None으로 변환하여 기본 방식 사용
-            design_name = session.get('design_name', None)
-            logger.info(f"[일괄 다운로드] 세션에서 읽은 design_name: '{design_name}'")
-            
-            if design_name == 'default':
-                design_name = None
-                logger.info("[일괄 다운로드] 'default'를 None으로 변환")
             
-            if design_name:
-                # 디자인 사용 가능 여부 확인
-                try:
-                    from payroll_generator.templates.designs.design_factory import DesignFactory
-                    if not DesignFactory.is_design_available(design_name):
-                        logger.warning(f"[일괄 다운로드] 사용 불가능한 디자인: '{design_name}', 기본 방식 사용")
-                        design_name = None
-                    else:
-                        logger.info(f"[일괄 다운로드] 디자인 '{design_name}' 사용 가능 확인")
-                except Exception as e:
-                    logger.error(f"[일괄 다운로드] 디자인 검증 중 오류: {e}", exc_info=True)
-                    design_name = None
-            
-            logger.info(f"[일괄 다운로드] 최종 사용할 design_name: '{design_name}'")
-
             # 출력 디렉토리 생성 확인
             excel_dir = os.path.join(output_folder, 'excel')
             pdf_dir = os.path.join(output_folder, 'pdf')
@@ -427,25 +530,7 @@ def batch_download(format):
                     zipf.write(pdf_path, f"{employee_name}_급여명세서.pdf")
         
         # Phase 4: 파일 생성 로그 저장
-        try:
-            user_id = current_user.id if current_user.is_authenticated else None
-            file_size = os.path.getsize(zip_path) if os.path.exists(zip_path) else 0
-            log_file_generation(
-                user_id=user_id,
-                file_type='zip',
-                file_name=f'급여명세서_{period}_{format}.zip',
-                file_size=file_size,
-                employee_count=len(results),
-                period=period,
-                file_path=zip_path
-            )
-            log_activity(
-                user_id=user_id,
-                activity_type='file_download',
-                activity_data={'file_type': 'zip', 'format': format, 'employee_count': len(results)}
-            )
-        except Exception as e:
-            logger.error(f'파일 생성 로그 저장 오류: {str(e)}')
+        _log_batch_download('zip', f'급여명세서_{period}_{format}.zip', zip_path, format, results, period)
         
         return send_file(zip_path, as_attachment=True, 
                         download_name=f'급여명세서_{period}_{format}.zip')
@@ -18,6 +18,8 @@ from app.utils.analytics import (
     log_payroll_calculation, 
     calculate_totals_from_results
 )
+from app.utils.preview_cache import get_preview_cache
+from payroll_generator.incremental import IncrementalPayrollSession
 
 # Blueprint 생성
 payroll_bp = Blueprint('payroll', __name__, url_prefix='/input')
@@ -46,8 +48,8 @@ def input_form():
             '공제사항': form.deduction_note.data or ''
         }
         
-        # 급여 계산 (기존 계산 로직 재사용)
-        calculator = PayrollCalculator()
+        # 급여 계산 (기존 계산 로직 재사용, 급여 기간의 요율 적용)
+        calculator = PayrollCalculator(form.period.data)
         payroll_data = calculator.calculate_deductions(employee_data)
         
         # 결과를 세션에 저장 (기존 결과 페이지와 호환)
@@ -176,21 +178,53 @@ def multiple_input_form():
                 flash('최소 1명의 직원 정보를 입력해주세요.', 'danger')
                 return render_template('payroll/multiple_input.html')
             
-            # 각 직원별 급여 계산
-            calculator = PayrollCalculator()
+            # 각 직원별 급여 계산 (급여 기간의 요율 적용)
+            calculator = PayrollCalculator(period)
             results = []
+            totals = None
             
-            for emp_data in employees:
-                try:
-                    payroll_data = calculator.calculate_deductions(emp_data)
+            try:
+                # 같은 기간의 직전 입력 결과가 있으면 바뀐 직원만 재계산하고 집계는 차이만 반영
+                calc_session = IncrementalPayrollSession(calculator)
+                # (집계는 저장 당시 session_id와 함께 보관하므로 다른 입력 방식의 결과와 섞이지 않음)
+                previous_totals = session.get('multiple_totals') or {}
+                previous = session.get('results') if (
+                    previous_totals.get('session_id') == session.get('session_id') and
+                    session.get('period') == period
+                ) else None
+                if previous:
+                    calc_session.load([r['employee_data'] for r in previous],
+                                      [r['payroll_data'] for r in previous],
+                                      previous_totals['totals'])
+                    changed = calc_session.sync(employees)
+                    current_app.logger.info(f'증분 재계산: {len(changed)}/{len(employees)}명')
+                else:
+                    calc_session.load(employees)
+                
+                for emp_data, payroll_data in zip(calc_session.employees, calc_session.results):
                     results.append({
                         'employee_name': emp_data['이름'],
                         'payroll_data': payroll_data,
                         'employee_data': emp_data
                     })
-                except Exception as e:
-                    current_app.logger.error(f"급여 계산 오류: {emp_data.get('이름', '')} - {str(e)}")
-                    continue
+                totals = dict(calc_session.totals)
+            except Exception as e:
+                current_app.logger.warning(f'증분 계산 실패, 행 단위 계산으로 전환: {str(e)}')
+                results = []
+                for emp_data in employees:
+                    try:
+                        payroll_data = calculator.calculate_deductions(emp_data)
+                        results.append({
+                            'employee_name': emp_data['이름'],
+                            'payroll_data': payroll_data,
+                            'employee_data': emp_data
+                        })
+                    except Exception as e:
+                        current_app.logger.error(f"급여 계산 오류: {emp_data.get('이름', '')} - {str(e)}")
+                        continue
+            
+            if totals is None:
+                totals = calculate_totals_from_results(results)
             
             if not results:
                 flash('급여 계산 중 오류가 발생했습니다.', 'danger')
@@ -201,6 +235,7 @@ def multiple_input_form():
             session['session_id'] = session_id
             session['results'] = results
             session['period'] = period
+            session['multiple_totals'] = {'session_id': session_id, 'totals': totals}
             session['output_format'] = output_format
             # 디자인 선택: 'default'는 None으로 변환하여 기본 방식 사용
             design_name_value = request.form.get('design_name', None)
@@ -237,7 +272,6 @@ def multiple_input_form():
             # Phase 4: 데이터 수집
             try:
                 user_id = current_user.id if current_user.is_authenticated else None
-                totals = calculate_totals_from_results(results)
                 calculation_data = {
                     'employee_count': len(results),
                     'period': period,
@@ -275,18 +309,9 @@ def preview_calculation():
     try:
         data = request.get_json()
         
-        # 입력 데이터 검증 및 변환
-        employee_data = {
-            '기본급': data.get('base_salary', 0) or 0,
-            '연장근무시간': data.get('overtime_hours', 0) or 0,
-            '연장근무단가': data.get('overtime_rate', 0) or 0,
-            '상여금': data.get('bonus', 0) or 0,
-            '부양가족수': data.get('dependents', 0) or 0
-        }
-        
-        # 급여 계산 (기존 계산 로직 재사용)
-        calculator = PayrollCalculator()
-        payroll_data = calculator.calculate_deductions(employee_data)
+        # 급여 계산 (입력값/기간이 같으면 워커 공유 캐시 결과 재사용)
+        cache = get_preview_cache(current_app.config.get('PREVIEW_CACHE_SIZE', 1024))
+        payroll_data = cache.calculate(data)
         
         return jsonify({
             'success': True,
@@ -299,3 +324,12 @@ def preview_calculation():
             'error': str(e)
         }), 400
 
+
+@payroll_bp.route('/preview/stats', methods=['GET'])
+def preview_cache_stats():
+    """미리보기 캐시 통계 (현재 워커 프로세스 기준)"""
+    cache = get_preview_cache(current_app.config.get('PREVIEW_CACHE_SIZE', 1024))
+    return jsonify({
+        'success': True,
+        'stats': cache.stats()
+    })
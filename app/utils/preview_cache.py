@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""실시간 미리보기 계산 캐시 - 워커 프로세스 단위 LRU 캐시"""
+
+import threading
+from collections import OrderedDict
+
+from payroll_generator.calculator import PayrollCalculator
+from payroll_generator.rules import resolve_effective_date
+
+# 미리보기 입력 필드 (요청 JSON 키, 계산기 입력 키)
+PREVIEW_FIELDS = [
+    ('base_salary', '기본급'),
+    ('overtime_hours', '연장근무시간'),
+    ('overtime_rate', '연장근무단가'),
+    ('bonus', '상여금'),
+    ('dependents', '부양가족수'),
+]
+
+
+def _to_number(value):
+    """입력값을 숫자로 변환 (빈 값은 0, 정수로 표현되는 값은 int)"""
+    if value is None or value == '':
+        return 0
+    if isinstance(value, bool):
+        raise ValueError(f"숫자가 아닌 입력값입니다: {value}")
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def normalize_preview_input(data):
+    """
+    미리보기 요청을 캐시 키로 정규화
+    
+    같은 시행일의 기간은 같은 요율을 쓰므로 기간은 시행일로 정규화합니다.
+    잘못된 기간은 계산기와 동일하게 현재 요율로 처리합니다.
+    
+    Returns:
+        tuple: (기본급, 연장근무시간, 연장근무단가, 상여금, 부양가족수, 시행일)
+    
+    Raises:
+        ValueError: 숫자로 변환할 수 없는 입력값이 있는 경우
+    """
+    data = data or {}
+    values = [_to_number(data.get(field)) for field, _ in PREVIEW_FIELDS]
+    try:
+        effective_date = resolve_effective_date(data.get('period'))
+    except ValueError:
+        effective_date = resolve_effective_date()
+    return tuple(values) + (effective_date,)
+
+
+class PreviewCache:
+    """미리보기 계산 결과 LRU 캐시 (스레드 안전, 적중/미적중 카운터 포함)"""
+    
+    def __init__(self, maxsize=1024):
+        """
+        Args:
+            maxsize (int): 최대 항목 수 (1 이상)
+        
+        Raises:
+            ValueError: maxsize가 1보다 작은 경우
+        """
+        if maxsize < 1:
+            raise ValueError(f"미리보기 캐시 크기는 1 이상이어야 합니다: {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def calculate(self, data):
+        """
+        미리보기 계산 (캐시 적중 시 저장된 결과 반환)
+        
+        Args:
+            data: 미리보기 요청 JSON 딕셔너리
+        
+        Returns:
+            dict: 급여 계산 결과 (호출자가 수정해도 캐시에 영향 없도록 복사본)
+        """
+        key = normalize_preview_input(data)
+        with self._lock:
+            payroll_data = self._entries.get(key)
+            if payroll_data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return dict(payroll_data)
+            self.misses += 1
+        
+        # 계산은 잠금 밖에서 수행 (같은 키가 동시에 계산되어도 결과는 동일)
+        employee_data = {column: value for (_, column), value in zip(PREVIEW_FIELDS, key)}
+        payroll_data = PayrollCalculator(key[-1]).calculate_deductions(employee_data)
+        
+        with self._lock:
+            self._entries[key] = payroll_data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return dict(payroll_data)
+    
+    def stats(self):
+        """캐시 통계 반환"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 4) if total else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize
+            }
+    
+    def clear(self):
+        """캐시 및 카운터 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_preview_cache = None
+_preview_cache_lock = threading.Lock()
+
+
+def get_preview_cache(maxsize=1024):
+    """워커 프로세스 공유 미리보기 캐시 반환 (최초 호출 시 생성)"""
+    global _preview_cache
+    if _preview_cache is None:
+        with _preview_cache_lock:
+            if _preview_cache is None:
+                _preview_cache = PreviewCache(maxsize)
+    return _preview_cache
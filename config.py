@@ -5,6 +5,8 @@
 import os
 from pathlib import Path
 
+from payroll_generator.config import ROSTER_CACHE_MAX_BYTES as DEFAULT_ROSTER_CACHE_MAX_BYTES, env_int
+
 # 프로젝트 루트 경로
 basedir = Path(__file__).parent.absolute()
 
@@ -31,8 +33,15 @@ class Config:
     UPLOAD_FOLDER = os.path.join(basedir, 'web', 'uploads')
     OUTPUT_FOLDER = os.path.join(basedir, 'outputs')
     
+    # 명부 파싱 캐시 (같은 내용의 파일을 다시 업로드하면 캐시 사용)
+    ROSTER_CACHE_FOLDER = os.path.join(basedir, 'web', 'roster_cache')
+    ROSTER_CACHE_MAX_BYTES = env_int('ROSTER_CACHE_MAX_BYTES', DEFAULT_ROSTER_CACHE_MAX_BYTES)
+    
     # 허용된 파일 확장자
-    ALLOWED_EXTENSIONS = {'xlsx', 'xls'}
+    ALLOWED_EXTENSIONS = {'xlsx', 'xls', 'csv', 'parquet', 'arrow', 'feather'}
+    
+    # 실시간 미리보기 계산 캐시 크기 (워커 프로세스당 항목 수)
+    PREVIEW_CACHE_SIZE = env_int('PREVIEW_CACHE_SIZE', 1024, minimum=1)
     
     # Flask 설정
     TEMPLATE_FOLDER = os.path.join(basedir, 'web', 'templates')
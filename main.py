@@ -7,6 +7,8 @@ import os
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
+from contextlib import nullcontext
+import multiprocessing
 import subprocess
 import platform
 import matplotlib.pyplot as plt
@@ -18,7 +20,13 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'payroll_generator'))
 
 try:
     from payroll_generator.calculator import PayrollCalculator
+    from payroll_generator.parallel import ParallelPayrollCalculator
+    from payroll_generator.proration import prorate_roster
+    from payroll_generator.validation import validate_roster
+    from payroll_generator.compliance import scan_compliance
+    from payroll_generator.audit import TracingPayrollCalculator, trace_path, write_trace
     from payroll_generator.excel_handler import ExcelHandler
+    from payroll_generator.parse_cache import RosterParseCache
     from payroll_generator.dashboard import Dashboard
     from payroll_generator.pdf_generator import PDFGenerator
     from payroll_generator.settings import SettingsManager
@@ -26,7 +34,13 @@ try:
     from payroll_generator.utils import resource_path
 except ImportError:
     from calculator import PayrollCalculator
+    from parallel import ParallelPayrollCalculator
+    from proration import prorate_roster
+    from validation import validate_roster
+    from compliance import scan_compliance
+    from audit import TracingPayrollCalculator, trace_path, write_trace
     from excel_handler import ExcelHandler
+    from parse_cache import RosterParseCache
     from dashboard import Dashboard
     from pdf_generator import PDFGenerator
     from settings import SettingsManager
@@ -35,6 +49,13 @@ except ImportError:
 
 logger = setup_logger()
 
+# 직원 명부 파일 선택 다이얼로그 형식 (엑셀 외 인사 시스템 내보내기 형식 포함)
+ROSTER_FILETYPES = [
+    ("직원 명부", "*.xlsx *.xls *.csv *.parquet *.arrow *.feather"),
+    ("Excel files", "*.xlsx *.xls"),
+    ("All files", "*.*")
+]
+
 # 모던 색상 팔레트
 MODERN_COLORS = {
     'primary': {
@@ -112,7 +133,13 @@ class PayrollApp:
         
         # 모듈 초기화
         self.calculator = PayrollCalculator()
-        self.excel_handler = ExcelHandler()
+        # 같은 명부를 미리보기/대시보드/급여 생성에서 다시 읽지 않도록 파싱 결과 캐시
+        try:
+            roster_cache = RosterParseCache()
+        except OSError as e:
+            logger.warning(f"명부 캐시 폴더를 만들 수 없어 캐시 없이 읽습니다: {e}")
+            roster_cache = None
+        self.excel_handler = ExcelHandler(cache=roster_cache)
         self.dashboard = Dashboard()
         self.pdf_generator = PDFGenerator()
         self.settings_manager = SettingsManager()
@@ -377,6 +404,7 @@ class PayrollApp:
         ttk.Radiobutton(settings_frame, text="엑셀", variable=self.output_format, value="excel").grid(row=1, column=1, padx=5)
         ttk.Radiobutton(settings_frame, text="PDF", variable=self.output_format, value="pdf").grid(row=1, column=2, padx=5)
         ttk.Radiobutton(settings_frame, text="둘 다", variable=self.output_format, value="both").grid(row=1, column=3, padx=5)
+        ttk.Radiobutton(settings_frame, text="엑셀 한 파일", variable=self.output_format, value="workbook").grid(row=1, column=4, padx=5)
         
         ttk.Label(settings_frame, text="디자인 선택:").grid(row=2, column=0, sticky=tk.W, pady=5)
         design_combo = ttk.Combobox(settings_frame, textvariable=self.design_name, width=20, state="readonly")
@@ -578,7 +606,7 @@ class PayrollApp:
             # 알림창 확인 후 파일 선택 다이얼로그 표시
             filename = filedialog.askopenfilename(
                 title="직원 정보 엑셀 파일 선택",
-                filetypes=[("Excel files", "*.xlsx *.xls"), ("All files", "*.*")]
+                filetypes=ROSTER_FILETYPES
             )
             if filename:
                 # 파일 경로 저장
@@ -618,7 +646,7 @@ class PayrollApp:
                 # 알림창 확인 후 파일 선택 다이얼로그 표시
                 filename = filedialog.askopenfilename(
                     title="직원 정보 엑셀 파일 선택",
-                    filetypes=[("Excel files", "*.xlsx *.xls"), ("All files", "*.*")]
+                    filetypes=ROSTER_FILETYPES
                 )
                 if filename:
                     self.settings_manager.set_last_employee_file(filename)
@@ -642,7 +670,7 @@ class PayrollApp:
         """대시보드용 파일 선택"""
         filename = filedialog.askopenfilename(
             title="직원 정보 엑셀 파일 선택",
-            filetypes=[("Excel files", "*.xlsx *.xls"), ("All files", "*.*")]
+            filetypes=ROSTER_FILETYPES
         )
         if filename:
             # 파일 경로 저장
@@ -832,7 +860,7 @@ class PayrollApp:
         """직원 정보 파일 선택"""
         filename = filedialog.askopenfilename(
             title="직원 정보 엑셀 파일 선택",
-            filetypes=[("Excel files", "*.xlsx *.xls"), ("All files", "*.*")]
+            filetypes=ROSTER_FILETYPES
         )
         if filename:
             self.employee_file_path.set(filename)
@@ -1017,12 +1045,12 @@ class PayrollApp:
         self.on_selection_change()
         logger.info("전체 선택 해제")
     
-    def save_monthly_history(self, df, period):
-        """월별 급여 이력 데이터 저장"""
+    def save_monthly_history(self, df, period, calculator=None):
+        """월별 급여 이력 데이터 저장 (calculator가 없으면 급여 기간 요율 계산기로 계산)"""
         try:
-            from payroll_generator.history_manager import HistoryManager
+            from payroll_generator.history_manager import HistoryManager, EmployeeHistoryManager
         except ImportError:
-            from history_manager import HistoryManager
+            from history_manager import HistoryManager, EmployeeHistoryManager
         
         history_manager = HistoryManager()
         
@@ -1032,10 +1060,13 @@ class PayrollApp:
         regular_count = 0
         contract_count = 0
         
-        for idx, row in df.iterrows():
-            payroll_data = self.calculator.calculate_deductions(row.to_dict())
-            total_payment = payroll_data['총지급액']
-            
+        # 명부 전체 일괄 계산 후 행별 총지급액 사용
+        if calculator is None:
+            calculator = PayrollCalculator(period)
+        results = calculator.calculate_batch(df)
+        total_payments = results['총지급액'].tolist()
+        
+        for (idx, row), total_payment in zip(df.iterrows(), total_payments):
             # 정규직/계약직 구분
             is_regular = self._is_regular_employee(row)
             
@@ -1056,6 +1087,13 @@ class PayrollApp:
         
         history_manager.save_monthly_data(period, data)
         logger.info(f"월별 이력 데이터 저장 완료: {period}")
+        
+        # 직원별 이력 저장 (퇴직금 평균임금 산정용)
+        if '이름' in df.columns:
+            try:
+                EmployeeHistoryManager().save_period(period, df, results)
+            except ValueError as employee_history_error:
+                logger.warning(f"직원별 이력 저장 건너뜀: {employee_history_error}")
     
     def _is_regular_employee(self, row):
         """정규직 여부 판단"""
@@ -1172,9 +1210,26 @@ class PayrollApp:
                 total_employees = len(df)
                 logger.info(f"전체 직원 처리: {total_employees}명")
             
+            # 명부 값 검증 (오류 행은 건너뜀)
+            report = validate_roster(df)
+            if not report.ok:
+                logger.warning(f"명부 검증 오류 행을 제외합니다: {report.summary()}")
+                for issue in report.errors.itertuples():
+                    logger.warning(f"  행 {issue.row} {issue.column}: {issue.message} ({issue.value})")
+                df = report.valid_rows(df)
+                total_employees = len(df)
+            
             if total_employees == 0:
                 raise ValueError("처리할 직원 데이터가 없습니다.")
             
+            # 법정 기준 점검 (위반 항목은 로그로 알리고 명세서 발행은 계속)
+            try:
+                compliance = scan_compliance(df, self.period.get())
+                for issue in compliance.errors.itertuples():
+                    logger.warning(f"  행 {issue.row} {issue.column}: {issue.message} ({issue.value})")
+            except Exception as compliance_error:
+                logger.warning(f"법정 기준 점검 실패: {compliance_error}")
+            
             # 출력 폴더 생성
             output_folder = self.output_folder_path.get()
             try:
@@ -1186,51 +1241,117 @@ class PayrollApp:
             if not os.access(output_folder, os.W_OK):
                 raise PermissionError(f"출력 폴더에 쓸 권한이 없습니다: {output_folder}")
             
-            # 각 직원별 처리
-            for idx, row in df.iterrows():
-                employee_name = row.get('이름', f'직원{idx+1}')
-                self.status_label.config(text=f"처리 중: {employee_name} ({idx+1}/{total_employees})")
-                
+            # 급여 기간 중 입사/퇴사자 일할 계산 (실패 시 전체 월 기준으로 계산)
+            try:
+                df = prorate_roster(df, self.period.get())
+            except ValueError as prorate_error:
+                logger.warning(f"일할 계산 실패, 전체 월 기준으로 계산합니다: {prorate_error}")
+            
+            # 급여 기간의 요율로 계산기 준비 (대용량 명부는 다중 프로세스 일괄 계산,
+            # 계산 내역 저장 설정이면 중간값을 기록하는 추적 계산기)
+            export_trace = self.settings_manager.get_export_trace()
+            if export_trace:
+                calculator = TracingPayrollCalculator(self.period.get())
+            else:
+                calculator = ParallelPayrollCalculator(self.period.get())
+            
+            # 급여 계산 (명부 전체 일괄 계산, 실패 시 행 단위 계산)
+            traces = {}
+            try:
+                if export_trace:
+                    result_df, trace_df = calculator.calculate_trace(df)
+                    batch_records = dict(zip(df.index, result_df.to_dict('records')))
+                    traces = dict(zip(df.index, trace_df.to_dict('records')))
+                else:
+                    batch_records = dict(zip(df.index, calculator.calculate_batch_results(df)))
+            except Exception as batch_error:
+                logger.warning(f"일괄 계산 실패, 행 단위 계산으로 전환: {batch_error}")
+                batch_records = {}
+            
+            # 통합 엑셀 (직원마다 시트 1개, 만들 수 없는 디자인이면 직원별 파일로 생성)
+            output_format = self.output_format.get()
+            payroll_workbook = None
+            if output_format == 'workbook':
+                workbook_path = os.path.join(output_folder, f"급여명세서_{self.period.get()}.xlsx")
+                design_name_value = self.design_name.get() if self.design_name.get() != 'default' else None
                 try:
-                    # 급여 계산
-                    payroll_data = self.calculator.calculate_deductions(row.to_dict())
-                    
-                    # 엑셀 출력
-                    if self.output_format.get() in ['excel', 'both']:
-                        try:
-                            excel_path = os.path.join(output_folder, f"{employee_name}_급여명세서.xlsx")
-                            design_name_value = self.design_name.get() if self.design_name.get() != 'default' else None
-                            self.excel_handler.write_payroll(payroll_data, excel_path, row.to_dict(), self.period.get(), design_name=design_name_value)
-                            self.generated_files.append(excel_path)
-                        except Exception as excel_error:
-                            logger.error(f"엑셀 생성 실패: {employee_name} - {str(excel_error)}")
-                            # 계속 진행 (다음 직원 처리)
+                    payroll_workbook = self.excel_handler.open_payroll_workbook(
+                        workbook_path, self.period.get(), design_name=design_name_value)
+                except ValueError as workbook_error:
+                    logger.warning(f"통합 엑셀을 만들 수 없어 직원별 파일로 생성합니다: {workbook_error}")
+                    output_format = 'excel'
+            
+            # 각 직원별 처리 (통합 엑셀은 블록을 마치면 저장, 예외가 나면 쓰던 파일 삭제)
+            with payroll_workbook if payroll_workbook is not None else nullcontext():
+                for position, (idx, row) in enumerate(df.iterrows(), 1):
+                    employee_name = row.get('이름', f'직원{idx+1}')
+                    self.status_label.config(text=f"처리 중: {employee_name} ({position}/{total_employees})")
                     
-                    # PDF 출력
-                    if self.output_format.get() in ['pdf', 'both']:
-                        try:
-                            pdf_path = os.path.join(output_folder, f"{employee_name}_급여명세서.pdf")
-                            design_name_value = self.design_name.get() if self.design_name.get() != 'default' else None
-                            self.pdf_generator.generate_payslip(payroll_data, row.to_dict(), pdf_path, self.period.get(), design_name=design_name_value)
-                            self.generated_files.append(pdf_path)
-                        except Exception as pdf_error:
-                            logger.warning(f"PDF 생성 실패 (엑셀은 생성됨): {employee_name} - {str(pdf_error)}")
-                            # 계속 진행 (엑셀은 생성됨)
+                    try:
+                        # 급여 계산
+                        payroll_data = batch_records.get(idx)
+                        if payroll_data is None:
+                            payroll_data = calculator.calculate_result(row.to_dict())
+                        
+                        # 통합 엑셀 시트 추가 (시트로 쓸 수 없으면 직원별 파일로 생성)
+                        excel_fallback = False
+                        if payroll_workbook is not None:
+                            try:
+                                payroll_workbook.add(payroll_data, row.to_dict())
+                            except Exception as excel_error:
+                                logger.warning(f"통합 엑셀 시트 추가 실패, 직원별 파일로 생성합니다: {employee_name} - {str(excel_error)}")
+                                excel_fallback = True
+                        
+                        # 엑셀 출력
+                        if output_format in ['excel', 'both'] or excel_fallback:
+                            try:
+                                excel_path = os.path.join(output_folder, f"{employee_name}_급여명세서.xlsx")
+                                design_name_value = self.design_name.get() if self.design_name.get() != 'default' else None
+                                self.excel_handler.write_payroll(payroll_data, excel_path, row.to_dict(), self.period.get(), design_name=design_name_value)
+                                self.generated_files.append(excel_path)
+                            except Exception as excel_error:
+                                logger.error(f"엑셀 생성 실패: {employee_name} - {str(excel_error)}")
+                                # 계속 진행 (다음 직원 처리)
+                        
+                        # PDF 출력
+                        if self.output_format.get() in ['pdf', 'both']:
+                            try:
+                                pdf_path = os.path.join(output_folder, f"{employee_name}_급여명세서.pdf")
+                                design_name_value = self.design_name.get() if self.design_name.get() != 'default' else None
+                                self.pdf_generator.generate_payslip(payroll_data, row.to_dict(), pdf_path, self.period.get(), design_name=design_name_value)
+                                self.generated_files.append(pdf_path)
+                            except Exception as pdf_error:
+                                logger.warning(f"PDF 생성 실패 (엑셀은 생성됨): {employee_name} - {str(pdf_error)}")
+                                # 계속 진행 (엑셀은 생성됨)
+                        
+                        # 계산 내역 (JSON, 급여명세서 옆)
+                        if idx in traces:
+                            try:
+                                payslip_path = os.path.join(output_folder, f"{employee_name}_급여명세서.xlsx")
+                                write_trace(traces[idx], payroll_data, trace_path(payslip_path), row.to_dict())
+                            except Exception as trace_error:
+                                logger.warning(f"계산 내역 저장 실패: {employee_name} - {str(trace_error)}")
+                        
+                    except Exception as emp_error:
+                        logger.error(f"직원 처리 오류: {employee_name} - {str(emp_error)}")
+                        # 계속 진행 (다음 직원 처리)
                     
-                except Exception as emp_error:
-                    logger.error(f"직원 처리 오류: {employee_name} - {str(emp_error)}")
-                    # 계속 진행 (다음 직원 처리)
-                
-                # 진행률 업데이트
-                progress = 10 + int((idx + 1) / total_employees * 90)
-                self.progress_var.set(progress)
+                    # 진행률 업데이트
+                    progress = 10 + int(position / total_employees * 90)
+                    self.progress_var.set(progress)
+            
+            if payroll_workbook is not None:
+                sheet_count = payroll_workbook.sheet_count
+                if sheet_count:
+                    self.generated_files.append(payroll_workbook.path)
+                    logger.info(f"통합 엑셀 생성 완료: {payroll_workbook.path} ({sheet_count}명)")
             
             self.status_label.config(text=f"✅ 완료! {total_employees}명 처리됨")
             self.open_folder_btn.config(state=tk.NORMAL)
             
             # 월별 이력 데이터 저장
             try:
-                self.save_monthly_history(df, self.period.get())
+                self.save_monthly_history(df, self.period.get(), calculator)
             except Exception as history_error:
                 logger.warning(f"월별 이력 데이터 저장 실패 (급여명세서는 생성됨): {history_error}")
                 # 이력 저장 실패해도 급여명세서 생성은 완료된 것으로 처리
@@ -1534,5 +1655,6 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # PyInstaller 빌드에서 병렬 계산 워커 실행
     main()
 
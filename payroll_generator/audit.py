@@ -0,0 +1,217 @@
+# audit.py
+"""급여 계산 추적(감사) 모듈
+
+TracingPayrollCalculator는 PayrollCalculator와 같은 결과를 계산하면서 중간값
+(보험 기준 금액과 상한 적용, 절사 전 금액, 부양가족 공제, 세액 구간)을
+직원별 int64 구조화 배열(TRACE_DTYPE)에 함께 기록합니다.
+추적은 별도 하위 클래스의 커널에서만 계산하므로 일반 PayrollCalculator 계산 경로에는
+분기나 추가 비용이 없습니다.
+
+직원별 추적 내역은 write_trace()로 급여명세서 옆에 JSON 파일로 내보낼 수 있습니다.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .calculator import PayrollCalculator, RESULT_COLUMNS, payment_arrays, insurance_inputs, dependent_deduction_array
+    from .config import RATE_SCALE, WITHHOLDING_MAX_DEPENDENTS
+    from .logger import setup_logger
+except ImportError:
+    from calculator import PayrollCalculator, RESULT_COLUMNS, payment_arrays, insurance_inputs, dependent_deduction_array
+    from config import RATE_SCALE, WITHHOLDING_MAX_DEPENDENTS
+    from logger import setup_logger
+
+logger = setup_logger()
+
+# 세액 산정 방식 (tax_method 필드)
+TAX_METHOD_PROGRESSIVE = 0  # 누진세율 (과세표준 구간)
+TAX_METHOD_WITHHOLDING = 1  # 국세청 간이세액표 (월급여액 구간 × 공제대상가족 수)
+
+# (필드명, 추적 내역 키) - 보험 종류별 필드는 RuleSet.insurance_types 순서
+TRACE_FIELD_KEYS = (
+    ('insurable_pay', '보험기준금액'),
+    ('taxable_payment', '과세급여'),
+    ('national_pension_base', '국민연금_기준금액'),
+    ('national_pension_capped', '국민연금_상한적용금액'),
+    ('national_pension_charged', '국민연금_부과'),
+    ('national_pension_raw', '국민연금_절사전'),
+    ('health_insurance_base', '건강보험_기준금액'),
+    ('health_insurance_capped', '건강보험_상한적용금액'),
+    ('health_insurance_charged', '건강보험_부과'),
+    ('health_insurance_raw', '건강보험_절사전'),
+    ('long_term_care_raw', '장기요양_절사전'),
+    ('employment_insurance_base', '고용보험_기준금액'),
+    ('employment_insurance_capped', '고용보험_상한적용금액'),
+    ('employment_insurance_charged', '고용보험_부과'),
+    ('employment_insurance_raw', '고용보험_절사전'),
+    ('dependent_deduction', '부양가족공제'),
+    ('taxable_income', '과세표준'),
+    ('tax_method', '세액산정방식'),
+    ('tax_bracket', '세액구간'),
+    ('tax_column', '공제대상가족수'),
+    ('income_tax_raw', '소득세_절사전'),
+    ('local_tax_raw', '지방소득세_절사전'),
+    ('truncated', '절사합계'),
+)
+TRACE_FIELDS = tuple(field for field, _ in TRACE_FIELD_KEYS)
+TRACE_KEYS = tuple(key for _, key in TRACE_FIELD_KEYS)
+
+# 추적 구조화 배열 dtype (시행일 + 정수 필드)
+TRACE_DTYPE = np.dtype([('effective_date', 'datetime64[D]')] + [(field, np.int64) for field in TRACE_FIELDS])
+
+# 커널 결과 딕셔너리에서 추적 배열 키 (RESULT_COLUMNS와 겹치지 않도록 접두사)
+_TRACE_PREFIX = 'trace.'
+
+
+def _withholding_bracket(table, monthly_salary, dependents):
+    """간이세액표 구간 번호/공제대상가족 수 (하한 미만 -1, 상한 이상은 마지막 구간 + 1)"""
+    in_table = (monthly_salary >= table.min_salary) & (monthly_salary < table.max_salary)
+    band = table.band_lookup[np.where(in_table, monthly_salary // table.unit, 0)].astype(np.int64)
+    band = np.where(monthly_salary < table.min_salary, -1, np.where(in_table, band, len(table)))
+    columns = np.clip(np.asarray(dependents, dtype=np.float64).astype(np.int64) + 1, 1,
+                      min(WITHHOLDING_MAX_DEPENDENTS, table.max_dependents))
+    return band, columns
+
+
+class TracingPayrollCalculator(PayrollCalculator):
+    """계산 중간값을 함께 기록하는 계산기 (결과는 PayrollCalculator와 동일)"""
+    
+    def _batch_kernel(self, rules, inputs):
+        """일괄 계산 커널 + 추적 배열 ('trace.' 접두사 키로 결과 딕셔너리에 추가)"""
+        result = super()._batch_kernel(rules, inputs)
+        for field, values in self._trace_kernel(rules, inputs, result).items():
+            result[_TRACE_PREFIX + field] = values
+        return result
+    
+    def _trace_kernel(self, rules, inputs, result):
+        """
+        추적 커널 (일괄 계산 커널과 같은 보조 함수로 중간값 재계산)
+        
+        Returns:
+            dict: TRACE_DTYPE 필드별 배열
+        """
+        payments = payment_arrays(rules, inputs)
+        size = len(payments.base_salary)
+        trace = {
+            'effective_date': np.full(size, np.datetime64(rules.effective_date, 'D')),
+            'insurable_pay': payments.insurable_pay,
+            'taxable_payment': payments.taxable_payment,
+        }
+        
+        # 보험 종류별 기준 금액 -> 상한 적용 -> 절사 전 보험료
+        bases, charged = insurance_inputs(rules.insurance_types, inputs, payments.insurable_pay)
+        bases = np.broadcast_to(bases, (len(rules.insurance_types), size))
+        capped = np.minimum(bases, rules.limits[:, np.newaxis])
+        raw = capped * rules.rates[:, np.newaxis] // RATE_SCALE
+        if charged is None:
+            charged = np.ones_like(raw)
+        for i, name in enumerate(rules.insurance_types):
+            trace[f'{name}_base'] = bases[i]
+            trace[f'{name}_capped'] = capped[i]
+            trace[f'{name}_charged'] = charged[i]
+            trace[f'{name}_raw'] = raw[i] * charged[i]
+        trace['long_term_care_raw'] = result['건강보험'] * rules.long_term_care_scaled // RATE_SCALE
+        
+        # 부양가족 공제 / 과세표준
+        trace['dependent_deduction'] = dependent_deduction_array(rules, payments.dependents)
+        insurance_total = result['국민연금'] + result['건강보험'] + result['장기요양'] + result['고용보험']
+        taxable_income = payments.taxable_payment - insurance_total - trace['dependent_deduction']
+        trace['taxable_income'] = taxable_income
+        
+        # 세액 구간 (간이세액표 또는 누진세율)
+        if self.withholding is not None:
+            trace['tax_method'] = np.full(size, TAX_METHOD_WITHHOLDING)
+            trace['tax_bracket'], trace['tax_column'] = _withholding_bracket(
+                self.withholding, payments.taxable_payment, payments.dependents)
+            income_tax_raw = self.withholding.tax_array(payments.taxable_payment, payments.dependents)
+        else:
+            trace['tax_method'] = np.full(size, TAX_METHOD_PROGRESSIVE)
+            bracket = np.searchsorted(rules.tax_index.starts, np.maximum(taxable_income, 0), side='right') - 1
+            trace['tax_bracket'] = np.where(taxable_income > 0, bracket, -1)
+            trace['tax_column'] = np.full(size, -1)
+            income_tax_raw = rules.tax_index.tax_array(np.maximum(taxable_income, 0))
+        trace['income_tax_raw'] = income_tax_raw
+        trace['local_tax_raw'] = result['소득세'] * rules.local_tax_scaled // RATE_SCALE
+        
+        # 10원 미만 절사로 줄어든 금액 합계
+        trace['truncated'] = (sum(trace[f'{name}_raw'] for name in rules.insurance_types) - (
+            result['국민연금'] + result['건강보험'] + result['고용보험']) +
+            trace['long_term_care_raw'] - result['장기요양'] +
+            income_tax_raw - result['소득세'] +
+            trace['local_tax_raw'] - result['지방소득세'])
+        return {field: np.asarray(trace[field]) for field in TRACE_DTYPE.names}
+    
+    def calculate_trace_array(self, df):
+        """
+        일괄 계산 + 추적
+        
+        Returns:
+            tuple: (RESULT_COLUMNS DataFrame, TRACE_DTYPE 구조화 배열) - 입력 행 순서
+        """
+        arrays = self._batch_arrays(df)
+        result = pd.DataFrame({col: arrays[col] for col in RESULT_COLUMNS}, index=df.index, columns=RESULT_COLUMNS)
+        trace = np.zeros(len(df), dtype=TRACE_DTYPE)
+        for field in TRACE_DTYPE.names:
+            if _TRACE_PREFIX + field in arrays:  # 빈 명부는 커널을 거치지 않음
+                trace[field] = arrays[_TRACE_PREFIX + field]
+        logger.info(f"추적 계산 완료: {len(result)}명")
+        return result, trace
+    
+    def calculate_trace(self, df):
+        """
+        일괄 계산 + 추적 (추적 내역은 한글 키 DataFrame)
+        
+        Returns:
+            tuple: (RESULT_COLUMNS DataFrame, '시행일' + TRACE_KEYS DataFrame) - 입력과 같은 인덱스
+        """
+        result, trace = self.calculate_trace_array(df)
+        return result, trace_frame(trace, index=df.index)
+    
+    def trace_deductions(self, employee_data):
+        """
+        직원 1명 계산 + 추적 (calculate_deductions()와 같은 결과)
+        
+        Returns:
+            tuple: (결과 딕셔너리, 추적 내역 딕셔너리)
+        """
+        result, trace = self.calculate_trace(pd.DataFrame([employee_data]))
+        return result.to_dict('records')[0], trace.to_dict('records')[0]
+
+
+def trace_frame(trace, index=None):
+    """TRACE_DTYPE 구조화 배열 -> 한글 키 DataFrame"""
+    frame = pd.DataFrame({key: trace[field] for field, key in TRACE_FIELD_KEYS}, index=index)
+    frame.insert(0, '시행일', trace['effective_date'].astype(str))
+    return frame
+
+
+def trace_path(payslip_path):
+    """급여명세서 경로 옆 추적 내역 경로 (예: 홍길동_급여명세서_계산내역.json)"""
+    return f"{os.path.splitext(payslip_path)[0]}_계산내역.json"
+
+
+def write_trace(trace, result, output_path, employee_data=None):
+    """
+    직원 1명의 계산 결과와 추적 내역을 JSON 파일로 저장
+    
+    Args:
+        trace (Mapping): 추적 내역 (trace_frame() 행 또는 trace_deductions() 반환값)
+        result (Mapping): 계산 결과 (calculate_deductions() 형식)
+        output_path (str): 저장 경로 (trace_path() 참고)
+        employee_data (Mapping, optional): 직원 정보 (이름만 기록)
+    """
+    def plain(mapping):
+        return {key: value.item() if isinstance(value, np.generic) else value for key, value in dict(mapping).items()}
+    
+    document = {
+        '이름': (employee_data or {}).get('이름'),
+        '계산결과': plain(result),
+        '계산내역': plain(trace),
+    }
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+    logger.info(f"계산 내역 저장: {output_path}")
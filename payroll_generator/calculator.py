@@ -1,77 +1,273 @@
 # calculator.py
+import math
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
 try:
-    from .config import (
-        INSURANCE_RATES, 
-        INSURANCE_LIMITS, 
-        INCOME_TAX_TABLE, 
-        LOCAL_TAX_RATE,
-        DEPENDENT_DEDUCTION
-    )
+    from .config import RATE_SCALE, ALLOWANCE_SCHEMA
+    from .rules import get_rule_set, compile_rule_set, resolve_effective_date
+    from .tax_table import load_withholding_table
+    from .result import PayrollResult, RESULT_KEYS, RESULT_FIELD_KEYS, RESULT_DTYPE, results_from_array
     from .logger import setup_logger
 except ImportError:
-    from config import (
-        INSURANCE_RATES, 
-        INSURANCE_LIMITS, 
-        INCOME_TAX_TABLE, 
-        LOCAL_TAX_RATE,
-        DEPENDENT_DEDUCTION
-    )
+    from config import RATE_SCALE, ALLOWANCE_SCHEMA
+    from rules import get_rule_set, compile_rule_set, resolve_effective_date
+    from tax_table import load_withholding_table
+    from result import PayrollResult, RESULT_KEYS, RESULT_FIELD_KEYS, RESULT_DTYPE, results_from_array
     from logger import setup_logger
 
 logger = setup_logger()
 
+# calculate_deductions() 반환 딕셔너리와 동일한 키 순서
+RESULT_COLUMNS = list(RESULT_KEYS)
+
+# 일괄 계산 입력 컬럼 (없으면 0으로 처리)
+BATCH_INPUT_COLUMNS = ['기본급', '연장근무시간', '연장근무단가', '상여금', '부양가족수']
+
+# 수당 입력 컬럼 (비과세 한도/고정 수당 여부는 RuleSet 참고)
+ALLOWANCE_COLUMNS = list(ALLOWANCE_SCHEMA)
+
+# 보수월액 컬럼 (있으면 국민연금/건강보험 기준 금액, 없거나 0이면 기본급 + 고정 수당) - 일할 계산 월에 사용
+STANDARD_WAGE_COLUMN = '보수월액'
+STANDARD_WAGE_INSURANCE = ('national_pension', 'health_insurance')
+
+# 보험 종류별 부과 여부 컬럼 (0이면 미부과, 없거나 빈 값이면 부과) - 입사/퇴사 월 자격 판정에 사용
+INSURANCE_FLAG_COLUMNS = {
+    'national_pension': '국민연금부과',
+    'health_insurance': '건강보험부과',
+    'employment_insurance': '고용보험부과',
+}
+
+# 일괄 계산 선택 입력 컬럼 (없으면 수당 0, 기본급 + 고정 수당 기준으로 모두 부과)
+OPTIONAL_INPUT_COLUMNS = ALLOWANCE_COLUMNS + [STANDARD_WAGE_COLUMN] + list(INSURANCE_FLAG_COLUMNS.values())
+
+# 일괄 계산 시 행별 급여 기간 컬럼 (있으면 행마다 해당 기간의 요율 적용)
+PERIOD_COLUMN = '기간'
+
+# 연장근무시간 정수 변환 배율 (1/1000시간 단위)
+HOURS_SCALE = 1000
+
+# 지급액 배열 (payment_arrays() 반환, 금액은 int64)
+PaymentArrays = namedtuple('PaymentArrays', [
+    'base_salary',      # 기본급
+    'overtime_pay',     # 연장근무수당
+    'bonus',            # 상여금
+    'allowances',       # 수당합계
+    'total_payment',    # 총지급액
+    'non_taxable',      # 비과세액
+    'insurable_pay',    # 4대보험 기준 금액 (기본급 + 고정 수당 과세분)
+    'taxable_payment',  # 과세 급여 (총지급액 - 비과세액)
+    'dependents',       # 부양가족수 (입력 그대로)
+])
+
+
+def _to_won(value):
+    """금액 입력을 원 단위 정수로 변환 (빈 값은 0, 소수점 이하 버림)"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return 0
+    return int(value)
+
+
+def _to_milli_hours(hours):
+    """근무시간을 1/1000시간 단위 정수로 변환 (빈 값은 0)"""
+    if hours is None or (isinstance(hours, float) and math.isnan(hours)):
+        return 0
+    return int(round(float(hours) * HOURS_SCALE))
+
+
+def _is_charged(value):
+    """부과 여부 입력 해석 (빈 값은 부과)"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return True
+    return bool(value)
+
+
+def batch_inputs(df):
+    """직원 명부를 일괄 계산 입력 배열로 변환
+    
+    BATCH_INPUT_COLUMNS는 없으면 0, OPTIONAL_INPUT_COLUMNS는 있을 때만 포함합니다.
+    빈 부양가족수는 calculate_deductions()와 같게 NaN으로 남겨 기본 공제액을 적용합니다.
+    
+    Raises:
+        ValueError: 숫자로 변환할 수 없는 값이 있는 경우
+    """
+    inputs = {}
+    for col in BATCH_INPUT_COLUMNS:
+        if col == '부양가족수' and col in df.columns:
+            inputs[col] = pd.to_numeric(df[col], errors='raise').to_numpy(dtype=np.float64)
+        elif col in df.columns:
+            inputs[col] = pd.to_numeric(df[col], errors='raise').fillna(0).to_numpy()
+        else:
+            inputs[col] = np.zeros(len(df), dtype=np.int64)
+    for col in OPTIONAL_INPUT_COLUMNS:
+        if col in df.columns:
+            inputs[col] = pd.to_numeric(df[col], errors='raise').to_numpy(dtype=np.float64)
+    return inputs
+
+
+def insurance_inputs(insurance_types, inputs, insurable_pay):
+    """보험 종류별 기준 금액과 부과 여부 (보험 종류 × 직원)
+    
+    Returns:
+        tuple: (기준 금액 int64 배열, 부과 여부 int64 배열 또는 None(전원 부과))
+            - 보수월액 입력이 없으면 기준 금액은 (1, 직원 수) 배열 (브로드캐스트)
+    """
+    bases = insurable_pay[np.newaxis, :]
+    standard_wage = inputs.get(STANDARD_WAGE_COLUMN)
+    if standard_wage is not None:
+        standard_wage = np.nan_to_num(standard_wage).astype(np.int64)
+        standard_wage = np.where(standard_wage > 0, standard_wage, insurable_pay)
+        bases = np.stack([standard_wage if name in STANDARD_WAGE_INSURANCE else insurable_pay
+                          for name in insurance_types])
+    
+    charged = None
+    if any(INSURANCE_FLAG_COLUMNS.get(name) in inputs for name in insurance_types):
+        charged = np.ones((len(insurance_types), len(insurable_pay)), dtype=np.int64)
+        for i, name in enumerate(insurance_types):
+            flags = inputs.get(INSURANCE_FLAG_COLUMNS.get(name))
+            if flags is not None:
+                charged[i] = np.isnan(flags) | (flags != 0)
+    return bases, charged
+
+
+def payment_arrays(rules, inputs):
+    """일괄 계산 입력을 정수 지급 배열로 변환 (보험료/세액 계산 전 단계)
+    
+    Args:
+        rules (RuleSet): 수당 비과세 한도/고정 수당 여부
+        inputs (dict): batch_inputs() 배열
+    
+    Returns:
+        PaymentArrays: 지급액 배열
+    """
+    base_salary = np.asarray(inputs['기본급']).astype(np.int64)
+    overtime_hours = np.round(np.asarray(inputs['연장근무시간'], dtype=np.float64) * HOURS_SCALE).astype(np.int64)
+    overtime_rate = np.asarray(inputs['연장근무단가']).astype(np.int64)
+    bonus = np.asarray(inputs['상여금']).astype(np.int64)
+    
+    # 연장근무수당 계산 (원 미만 절사)
+    overtime_pay = np.where(overtime_rate > 0, overtime_hours * overtime_rate // HOURS_SCALE, 0)
+    
+    # 수당 (항목별 월 비과세 한도까지 비과세, 고정 수당 과세분은 4대보험 기준 금액에 포함)
+    allowances = np.zeros(len(base_salary), dtype=np.int64)
+    non_taxable = np.zeros(len(base_salary), dtype=np.int64)
+    fixed_pay = np.zeros(len(base_salary), dtype=np.int64)
+    for i, name in enumerate(rules.allowance_names):
+        values = inputs.get(name)
+        if values is None:
+            continue
+        amount = np.nan_to_num(np.asarray(values, dtype=np.float64)).astype(np.int64)
+        exempt = np.clip(amount, 0, rules.allowance_limits[i])
+        allowances += amount
+        non_taxable += exempt
+        if rules.allowance_fixed[i]:
+            fixed_pay += amount - exempt
+    
+    # 총 지급액
+    total_payment = base_salary + overtime_pay + bonus + allowances
+    return PaymentArrays(base_salary, overtime_pay, bonus, allowances, total_payment, non_taxable,
+                         base_salary + fixed_pay, total_payment - non_taxable, inputs['부양가족수'])
+
+
+def dependent_deduction_array(rules, dependents):
+    """부양가족 공제액 배열 (0~최대 인원 이외의 값(음수, 소수, 빈 값)은 calculate_deductions()와 동일하게 기본값)"""
+    max_dependents = len(rules.dependent_lookup) - 1
+    capped = np.minimum(dependents, max_dependents)
+    valid = (capped >= 0) & (capped == np.floor(capped))
+    return np.where(valid, rules.dependent_lookup[np.where(valid, capped, 0).astype(np.int64)],
+                    rules.dependent_default)
+
+
 class PayrollCalculator:
-    def __init__(self):
-        self.rates = INSURANCE_RATES
-        self.limits = INSURANCE_LIMITS
+    def __init__(self, period=None):
+        """
+        Args:
+            period (str, optional): 급여 기간 (예: "2025-01")
+                - 해당 기간에 시행 중인 요율을 적용 (None이면 현재 기준)
+        """
+        try:
+            self.rules = get_rule_set(period)
+        except ValueError as e:
+            logger.warning(f"{e}. 현재 기준 요율을 사용합니다.")
+            self.rules = get_rule_set()
+        self.rates = self.rules.insurance_rates
+        self.limits = self.rules.insurance_limits
+        self.tax_index = self.rules.tax_index
+        # 국세청 간이세액표 (CSV가 없으면 None -> 누진세율 근사치 사용)
+        self.withholding = load_withholding_table()
     
     def calculate_insurance(self, base_salary, insurance_type):
-        """4대보험 계산"""
+        """4대보험 계산 (정수 연산, 10원 미만 절사)"""
         # 상한액 적용
-        taxable_amount = min(base_salary, self.limits[insurance_type])
-        return int(taxable_amount * self.rates[insurance_type])
+        taxable_amount = min(_to_won(base_salary), self.limits[insurance_type])
+        rate = int(self.rules.rates[self.rules.insurance_types.index(insurance_type)])
+        return self._truncate(taxable_amount * rate // RATE_SCALE)
+    
+    def _truncate(self, amount):
+        """원 단위 절사 (기본 10원 미만)"""
+        unit = self.rules.truncation_unit
+        return amount // unit * unit
     
     def calculate_income_tax(self, taxable_income):
-        """소득세 계산 (간이세액표 기반)"""
-        if taxable_income <= 0:
-            return 0
-        
-        for start, end, rate, deduction in INCOME_TAX_TABLE:
-            if start <= taxable_income < end:
-                income_tax = int(taxable_income * rate - deduction)
-                return max(0, income_tax)  # 음수 방지
-        
-        # 마지막 구간 (15,000,000 이상)
-        return int(taxable_income * 0.38 - 1_940_000)
+        """소득세 계산 (간이세액표 기반, 구간 이진 탐색)"""
+        return self.tax_index.tax(taxable_income)
     
     def calculate_deductions(self, employee_data):
-        """전체 공제액 계산"""
-        base_salary = employee_data.get('기본급', 0)
-        overtime_hours = employee_data.get('연장근무시간', 0)
-        overtime_rate = employee_data.get('연장근무단가', 0)
-        bonus = employee_data.get('상여금', 0)
+        """전체 공제액 계산 (정수 연산, 보험료/세액 10원 미만 절사)"""
+        base_salary = _to_won(employee_data.get('기본급', 0))
+        overtime_hours = _to_milli_hours(employee_data.get('연장근무시간', 0))
+        overtime_rate = _to_won(employee_data.get('연장근무단가', 0))
+        bonus = _to_won(employee_data.get('상여금', 0))
         dependents = employee_data.get('부양가족수', 0)
         
-        # 연장근무수당 계산
-        overtime_pay = overtime_hours * overtime_rate if overtime_rate > 0 else 0
+        # 연장근무수당 계산 (원 미만 절사)
+        overtime_pay = overtime_hours * overtime_rate // HOURS_SCALE if overtime_rate > 0 else 0
+        
+        # 수당 (항목별 월 비과세 한도까지 비과세, 고정 수당 과세분은 4대보험 기준 금액에 포함)
+        allowances = non_taxable = fixed_pay = 0
+        for name, limit, fixed in zip(self.rules.allowance_names, self.rules.allowance_limits.tolist(),
+                                      self.rules.allowance_fixed.tolist()):
+            amount = _to_won(employee_data.get(name, 0))
+            exempt = min(max(amount, 0), limit)
+            allowances += amount
+            non_taxable += exempt
+            if fixed:
+                fixed_pay += amount - exempt
         
         # 총 지급액
-        total_payment = base_salary + overtime_pay + bonus
+        total_payment = base_salary + overtime_pay + bonus + allowances
+        taxable_payment = total_payment - non_taxable
         
-        # 4대보험 계산 (기본급 기준)
-        national_pension = self.calculate_insurance(base_salary, 'national_pension')
-        health_insurance = self.calculate_insurance(base_salary, 'health_insurance')
-        long_term_care = int(health_insurance * 0.1295)  # 건강보험의 12.95%
-        employment_insurance = self.calculate_insurance(base_salary, 'employment_insurance')
+        # 4대보험 계산 (기본급 + 고정 수당 기준, 보수월액이 있으면 국민연금/건강보험은 보수월액 기준)
+        insurable_pay = base_salary + fixed_pay
+        standard_wage = _to_won(employee_data.get(STANDARD_WAGE_COLUMN, 0))
+        standard_wage = standard_wage if standard_wage > 0 else insurable_pay
+        insurance = {}
+        for insurance_type in ('national_pension', 'health_insurance', 'employment_insurance'):
+            amount = standard_wage if insurance_type in STANDARD_WAGE_INSURANCE else insurable_pay
+            charged = _is_charged(employee_data.get(INSURANCE_FLAG_COLUMNS[insurance_type]))
+            insurance[insurance_type] = self.calculate_insurance(amount, insurance_type) if charged else 0
+        national_pension = insurance['national_pension']
+        health_insurance = insurance['health_insurance']
+        long_term_care = self._truncate(health_insurance * self.rules.long_term_care_scaled // RATE_SCALE)  # 건강보험의 12.95%
+        employment_insurance = insurance['employment_insurance']
         
         # 부양가족 공제액 계산
-        dependent_deduction = DEPENDENT_DEDUCTION.get(min(dependents, 4), 600_000)
+        max_dependents = len(self.rules.dependent_lookup) - 1
+        dependent_deduction = self.rules.dependent_deduction.get(min(dependents, max_dependents),
+                                                                 self.rules.dependent_default)
         
-        # 소득세 계산 (과세표준 = 총 지급액 - 4대보험 - 부양가족공제)
-        taxable_income = total_payment - (national_pension + health_insurance + 
-                                          long_term_care + employment_insurance) - dependent_deduction
-        income_tax = self.calculate_income_tax(max(0, taxable_income))
-        local_tax = int(income_tax * LOCAL_TAX_RATE)
+        # 소득세 계산 (과세표준 = 총 지급액 - 비과세액 - 4대보험 - 부양가족공제)
+        taxable_income = taxable_payment - (national_pension + health_insurance + 
+                                            long_term_care + employment_insurance) - dependent_deduction
+        if self.withholding is not None:
+            # 간이세액표: 월급여액(비과세 제외)과 공제대상가족 수로 직접 조회
+            income_tax = self.withholding.tax(taxable_payment, dependents)
+        else:
+            income_tax = self.calculate_income_tax(max(0, taxable_income))
+        income_tax = self._truncate(income_tax)
+        local_tax = self._truncate(income_tax * self.rules.local_tax_scaled // RATE_SCALE)
         
         total_deduction = (national_pension + health_insurance + long_term_care + 
                           employment_insurance + income_tax + local_tax)
@@ -80,7 +276,9 @@ class PayrollCalculator:
             '기본급': base_salary,
             '연장근무수당': overtime_pay,
             '상여금': bonus,
+            '수당합계': allowances,
             '총지급액': total_payment,
+            '비과세액': non_taxable,
             '국민연금': national_pension,
             '건강보험': health_insurance,
             '장기요양': long_term_care,
@@ -92,8 +290,153 @@ class PayrollCalculator:
             '실수령액': total_payment - total_deduction
         }
     
+    def calculate_result(self, employee_data):
+        """전체 공제액 계산 (PayrollResult 반환, 딕셔너리처럼 한글 키로 조회 가능)"""
+        return PayrollResult.from_mapping(self.calculate_deductions(employee_data))
+    
     def calculate_net_pay(self, employee_data):
         """실수령액 계산 (간편 메서드)"""
         result = self.calculate_deductions(employee_data)
         return result['실수령액']
-
+    
+    def calculate_batch(self, df):
+        """직원 명부 전체 일괄 계산 (컬럼 단위 벡터 연산)
+        
+        calculate_deductions()와 같은 규칙을 행 반복 없이 NumPy 배열 연산으로
+        적용합니다. 결과는 행별로 calculate_deductions()와 동일합니다.
+        
+        Args:
+            df (DataFrame): 직원 명부 (기본급, 연장근무시간, 연장근무단가, 상여금, 부양가족수)
+                - 없는 컬럼과 빈 값은 0으로 처리
+                - '기간' 컬럼이 있으면 행마다 해당 기간의 요율 적용 (시행일별로 묶어 계산)
+        
+        Returns:
+            DataFrame: RESULT_COLUMNS 컬럼을 가진 결과 (입력과 같은 인덱스)
+        
+        Raises:
+            ValueError: 숫자로 변환할 수 없는 값이나 잘못된 기간이 있는 경우
+        """
+        result = pd.DataFrame(self._batch_arrays(df), index=df.index, columns=RESULT_COLUMNS)
+        logger.info(f"일괄 급여 계산 완료: {len(result)}명")
+        return result
+    
+    def calculate_batch_records(self, df):
+        """일괄 계산 후 calculate_deductions()와 같은 딕셔너리 리스트로 반환 (입력 행 순서)"""
+        return self.calculate_batch(df).to_dict('records')
+    
+    def calculate_batch_array(self, df):
+        """일괄 계산 후 RESULT_DTYPE 구조화 배열(np.recarray)로 반환 (입력 행 순서)
+        
+        13개 결과를 원 단위 int64 필드 하나의 연속 버퍼에 담으므로
+        직원별 딕셔너리보다 메모리를 적게 쓰고 result.net_pay처럼 컬럼 단위로 접근할 수 있습니다.
+        """
+        arrays = self._batch_arrays(df)
+        records = np.empty(len(df), dtype=RESULT_DTYPE)
+        for field, key in RESULT_FIELD_KEYS:
+            records[field] = arrays[key]
+        logger.info(f"일괄 급여 계산 완료: {len(records)}명")
+        return records.view(np.recarray)
+    
+    def calculate_batch_results(self, df):
+        """일괄 계산 후 PayrollResult 리스트로 반환 (입력 행 순서)"""
+        return results_from_array(self.calculate_batch_array(df))
+    
+    def calculate_net_array(self, base_salary, overtime_hours=0, overtime_rate=0, bonus=0, dependents=0):
+        """기본급 배열에 대한 실수령액 배열 (calculate_deductions()와 같은 규칙, 계산기 기간 요율)
+        
+        나머지 입력은 스칼라 또는 base_salary와 같은 길이의 배열입니다.
+        """
+        base_salary = np.atleast_1d(np.asarray(base_salary))
+        inputs = {'기본급': base_salary}
+        for col, value in zip(BATCH_INPUT_COLUMNS[1:], (overtime_hours, overtime_rate, bonus, dependents)):
+            inputs[col] = np.broadcast_to(np.asarray(value), base_salary.shape)
+        return self._batch_kernel(self.rules, inputs)['실수령액']
+    
+    def _batch_arrays(self, df):
+        """일괄 계산 (RESULT_COLUMNS별 배열, 입력 행 순서)
+        
+        Raises:
+            ValueError: 숫자로 변환할 수 없는 값이나 잘못된 기간이 있는 경우
+        """
+        inputs = batch_inputs(df)
+        if PERIOD_COLUMN not in df.columns:
+            return self._batch_kernel(self.rules, inputs)
+        
+        # 고유 기간별로 시행일을 한 번만 조회하고, 같은 시행일의 행을 묶어 계산
+        codes, periods = pd.factorize(df[PERIOD_COLUMN].astype('string'))
+        effective_dates = np.array([resolve_effective_date(p) for p in periods] + [self.rules.effective_date])
+        row_dates = effective_dates[codes]  # 빈 기간(-1)은 계산기 기본 요율
+        parts = []
+        part_positions = []
+        for effective_date in np.unique(row_dates):
+            positions = np.flatnonzero(row_dates == effective_date)
+            part_inputs = {col: values[positions] for col, values in inputs.items()}
+            parts.append(self._batch_kernel(compile_rule_set(str(effective_date)), part_inputs))
+            part_positions.append(positions)
+        if not parts:
+            return {col: np.zeros(0, dtype=np.int64) for col in RESULT_COLUMNS}
+        
+        # 시행일별 결과를 입력 행 순서로 되돌림 (하위 클래스 커널이 추가한 배열 포함)
+        order = np.argsort(np.concatenate(part_positions), kind='stable')
+        return {col: np.concatenate([part[col] for part in parts])[order] for col in parts[0]}
+    
+    def _batch_kernel(self, rules, inputs):
+        """일괄 계산 커널 (한 시행일 규칙으로 배열 계산)
+        
+        Args:
+            rules (RuleSet): 적용할 계산 규칙
+            inputs (dict): batch_inputs() 배열
+        
+        Returns:
+            dict: RESULT_COLUMNS별 배열
+        """
+        unit = rules.truncation_unit
+        payments = payment_arrays(rules, inputs)
+        base_salary, overtime_pay, bonus, allowances, total_payment, non_taxable = payments[:6]
+        dependents = payments.dependents
+        
+        # 4대보험 계산 (기본급 + 고정 수당/보수월액 기준, 보험 종류 × 직원 배열로 한 번에 계산, 10원 미만 절사)
+        bases, charged = insurance_inputs(rules.insurance_types, inputs, payments.insurable_pay)
+        insurance = (np.minimum(bases, rules.limits[:, np.newaxis]) *
+                     rules.rates[:, np.newaxis]) // RATE_SCALE // unit * unit
+        if charged is not None:
+            insurance = insurance * charged
+        insurance = dict(zip(rules.insurance_types, insurance))
+        national_pension = insurance['national_pension']
+        health_insurance = insurance['health_insurance']
+        long_term_care = health_insurance * rules.long_term_care_scaled // RATE_SCALE // unit * unit  # 건강보험의 12.95%
+        employment_insurance = insurance['employment_insurance']
+        
+        # 부양가족 공제액 계산
+        dependent_deduction = dependent_deduction_array(rules, dependents)
+        
+        # 소득세 계산 (과세표준 = 총 지급액 - 비과세액 - 4대보험 - 부양가족공제)
+        taxable_income = payments.taxable_payment - (national_pension + health_insurance +
+                                                     long_term_care + employment_insurance) - dependent_deduction
+        if self.withholding is not None:
+            income_tax = self.withholding.tax_array(payments.taxable_payment, dependents)
+        else:
+            income_tax = rules.tax_index.tax_array(np.maximum(taxable_income, 0))
+        income_tax = income_tax // unit * unit
+        local_tax = income_tax * rules.local_tax_scaled // RATE_SCALE // unit * unit
+        
+        total_deduction = (national_pension + health_insurance + long_term_care +
+                           employment_insurance + income_tax + local_tax)
+        
+        return {
+            '기본급': base_salary,
+            '연장근무수당': overtime_pay,
+            '상여금': bonus,
+            '수당합계': allowances,
+            '총지급액': total_payment,
+            '비과세액': non_taxable,
+            '국민연금': national_pension,
+            '건강보험': health_insurance,
+            '장기요양': long_term_care,
+            '고용보험': employment_insurance,
+            '부양가족공제': dependent_deduction,
+            '소득세': income_tax,
+            '지방소득세': local_tax,
+            '총공제액': total_deduction,
+            '실수령액': total_payment - total_deduction
+        }
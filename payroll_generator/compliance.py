@@ -0,0 +1,152 @@
+# compliance.py
+"""법정 기준 점검 모듈
+
+명세서를 발행하기 전에 명부 전체를 컬럼 단위 벡터 연산으로 한 번에 점검해
+위반 항목을 행 번호와 함께 ValidationReport 형식으로 반환합니다.
+
+점검 항목 (모두 error):
+    minimum_wage: 시간급(월 통상임금 / 월 소정근로시간)이 최저임금 미만
+    overtime_limit: 월 연장근무시간이 주 12시간 한도(해당 월 일수 / 7주 환산) 초과
+    insurance_cap: 명부의 보험료가 상한액 기준 보험료(상한액 × 요율, 절사) 초과
+
+명부는 월 합계 연장근무시간만 있으므로 주 52시간 한도는 월 단위 환산값으로
+점검합니다 (특정 주에 몰린 연장근무는 근태 기록으로 확인해야 합니다).
+보험료는 명부에 보험료 컬럼이 있을 때(직접 작성한 급여대장)만 점검합니다
+(계산 결과는 항상 상한액을 적용하므로 점검하지 않습니다).
+"""
+
+from bisect import bisect_right
+import calendar
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .calculator import PayrollCalculator, ALLOWANCE_COLUMNS, STANDARD_WAGE_COLUMN
+    from .config import (
+        ALLOWANCE_SCHEMA,
+        MINIMUM_HOURLY_WAGE,
+        MONTHLY_STANDARD_HOURS,
+        RATE_SCALE,
+        WEEKLY_OVERTIME_LIMIT_HOURS
+    )
+    from .result import RESULT_FIELD_KEYS
+    from .rules import normalize_period
+    from .validation import ERROR, ISSUE_COLUMNS, ValidationReport
+    from .logger import setup_logger
+except ImportError:
+    from calculator import PayrollCalculator, ALLOWANCE_COLUMNS, STANDARD_WAGE_COLUMN
+    from config import (
+        ALLOWANCE_SCHEMA,
+        MINIMUM_HOURLY_WAGE,
+        MONTHLY_STANDARD_HOURS,
+        RATE_SCALE,
+        WEEKLY_OVERTIME_LIMIT_HOURS
+    )
+    from result import RESULT_FIELD_KEYS
+    from rules import normalize_period
+    from validation import ERROR, ISSUE_COLUMNS, ValidationReport
+    from logger import setup_logger
+
+logger = setup_logger()
+
+# 월 소정근로시간 컬럼 (없거나 0이면 MONTHLY_STANDARD_HOURS)
+CONTRACT_HOURS_COLUMN = '월소정근로시간'
+
+# 통상임금에 포함하는 고정 수당
+FIXED_ALLOWANCE_COLUMNS = [col for col in ALLOWANCE_COLUMNS if ALLOWANCE_SCHEMA[col].get('fixed')]
+
+# 보험 종류 -> 결과 컬럼
+INSURANCE_RESULT_COLUMNS = dict(RESULT_FIELD_KEYS)
+
+
+def minimum_hourly_wage(period=None):
+    """급여 기간에 적용할 최저임금 시간급"""
+    effective_dates = sorted(MINIMUM_HOURLY_WAGE)
+    i = bisect_right(effective_dates, normalize_period(period)) - 1
+    return MINIMUM_HOURLY_WAGE[effective_dates[max(i, 0)]]
+
+
+def monthly_overtime_limit(period=None):
+    """월 연장근무 한도 (주 한도 × 해당 월 일수 / 7, 시간)"""
+    day = normalize_period(period)
+    days = calendar.monthrange(int(day[:4]), int(day[5:7]))[1]
+    return WEEKLY_OVERTIME_LIMIT_HOURS * days / 7
+
+
+def _numbers(df, column):
+    """숫자 컬럼 float64 배열 (없거나 숫자가 아닌 값은 0 - 형식 오류는 validate_roster가 보고)"""
+    if column not in df.columns:
+        return np.zeros(len(df), dtype=np.float64)
+    return pd.to_numeric(df[column], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+
+
+def _violations(df, mask, column, code, message, values):
+    """mask 행에 대한 위반 항목 (value: 점검에 쓴 계산 값)"""
+    return pd.DataFrame({
+        'row': df.index[mask], 'column': column, 'code': code,
+        'severity': ERROR, 'message': message, 'value': values[mask].astype(str),
+    }, columns=ISSUE_COLUMNS)
+
+
+def scan_compliance(df, period=None):
+    """
+    명부 법정 기준 점검
+    
+    Args:
+        df (DataFrame): 직원 명부 (ExcelHandler.read_employee_data 결과)
+        period (str, optional): 급여 기간 (최저임금/요율/월 일수 기준, None이면 현재)
+    
+    Returns:
+        ValidationReport: 위반 항목 (명부 행 순서)
+    """
+    frames = []
+    positions = []
+    
+    def add(mask, column, code, message, values):
+        if mask.any():
+            frames.append(_violations(df, mask, column, code, message, values))
+            positions.append(np.flatnonzero(mask))
+    
+    # 최저임금: 월 통상임금(보수월액, 없으면 기본급 + 고정 수당) / 월 소정근로시간
+    minimum = minimum_hourly_wage(period)
+    monthly = sum(_numbers(df, col) for col in ['기본급'] + FIXED_ALLOWANCE_COLUMNS)
+    standard = _numbers(df, STANDARD_WAGE_COLUMN)
+    monthly = np.where(standard > 0, standard, monthly)
+    hours = _numbers(df, CONTRACT_HOURS_COLUMN)
+    hours = np.where(hours > 0, hours, MONTHLY_STANDARD_HOURS)
+    hourly = np.floor(monthly / hours).astype(np.int64)
+    # 기본급이 빈 행(휴직 등)은 validate_roster가 경고하므로 제외
+    add((monthly > 0) & (hourly < minimum), '기본급', 'minimum_wage',
+        f"시간급이 최저임금({minimum:,}원)보다 적습니다", hourly)
+    
+    # 연장근무 한도 (주 52시간 월 환산)
+    limit = monthly_overtime_limit(period)
+    overtime = _numbers(df, '연장근무시간')
+    add(overtime > limit, '연장근무시간', 'overtime_limit',
+        f"연장근무가 주 {WEEKLY_OVERTIME_LIMIT_HOURS}시간 한도(월 {limit:.1f}시간)를 넘습니다", overtime)
+    
+    # 보험료 상한 (명부에 있는 보험료 컬럼만)
+    calculator = PayrollCalculator(period)
+    rules = calculator.rules
+    for name, cap, rate in zip(rules.insurance_types, rules.limits.tolist(), rules.rates.tolist()):
+        column = INSURANCE_RESULT_COLUMNS[name]
+        if column not in df.columns:
+            continue
+        amounts = _numbers(df, column).astype(np.int64)
+        maximum = calculator._truncate(cap * rate // RATE_SCALE)
+        add(amounts > maximum, column, 'insurance_cap',
+            f"보험료가 상한액 기준 보험료({maximum:,}원)를 넘습니다", amounts)
+    
+    # 명부 행 순서로 정렬
+    if frames:
+        order = np.argsort(np.concatenate(positions), kind='stable')
+        issues = pd.concat(frames, ignore_index=True).iloc[order].reset_index(drop=True)
+    else:
+        issues = pd.DataFrame(columns=ISSUE_COLUMNS)
+    report = ValidationReport(issues, len(df))
+    if report.ok:
+        logger.info(f"법정 기준 점검 완료: 위반 없음 ({len(df)}행)")
+    else:
+        logger.warning(f"법정 기준 점검: {report.summary()}")
+    return report
@@ -1,4 +1,13 @@
 # config.py
+import os
+
+try:
+    from .logger import setup_logger
+except ImportError:
+    from logger import setup_logger
+
+logger = setup_logger()
+
 # 4대보험 요율 및 상한액 설정 (2025년 기준)
 
 INSURANCE_RATES = {
@@ -35,3 +44,193 @@ DEPENDENT_DEDUCTION = {
     4: 600_000,  # 4명 이상은 최대 600,000원
 }
 
+LONG_TERM_CARE_RATIO = 0.1295  # 장기요양 (건강보험료의 12.95%)
+
+# 수당 항목 (명부 컬럼명: 설정)
+#   non_taxable_limit: 월 비과세 한도 (0이면 전액 과세, None이면 전액 비과세)
+#   fixed: 고정 수당 여부 (4대보험 기준 금액에 포함, 입사/퇴사 월 일할 계산)
+ALLOWANCE_SCHEMA = {
+    '식대': {'non_taxable_limit': 200_000, 'fixed': False},        # 식사대 월 20만원 비과세
+    '차량유지비': {'non_taxable_limit': 200_000, 'fixed': False},  # 자가운전보조금 월 20만원 비과세
+    '직책수당': {'non_taxable_limit': 0, 'fixed': True},
+    '근속수당': {'non_taxable_limit': 0, 'fixed': True},
+    '당직수당': {'non_taxable_limit': 0, 'fixed': False},
+}
+
+# 정수 계산 설정
+# 요율은 백만분율 정수(RATE_SCALE)로 변환해 int64로만 계산하고,
+# 보험료/세액은 원 단위 절사 규정에 따라 10원 미만을 절사
+RATE_SCALE = 1_000_000
+WON_TRUNCATION_UNIT = 10
+
+# 연말정산 (연간 근로소득 기준)
+ANNUAL_INCOME_TAX_TABLE = [
+    # (과세표준 시작, 과세표준 끝, 세율, 누진공제)
+    (0, 14_000_000, 0.06, 0),
+    (14_000_000, 50_000_000, 0.15, 1_260_000),
+    (50_000_000, 88_000_000, 0.24, 5_760_000),
+    (88_000_000, 150_000_000, 0.35, 15_440_000),
+    (150_000_000, 300_000_000, 0.38, 19_940_000),
+    (300_000_000, 500_000_000, 0.40, 25_940_000),
+    (500_000_000, 1_000_000_000, 0.42, 35_940_000),
+    (1_000_000_000, float('inf'), 0.45, 65_940_000),
+]
+
+# 근로소득공제 (총급여 구간 시작, 구간 시작 공제액, 초과분 공제율), 한도 2천만원
+EARNED_INCOME_DEDUCTION_TABLE = [
+    (0, 0, 0.70),
+    (5_000_000, 3_500_000, 0.40),
+    (15_000_000, 7_500_000, 0.15),
+    (45_000_000, 12_000_000, 0.05),
+    (100_000_000, 14_750_000, 0.02),
+]
+EARNED_INCOME_DEDUCTION_LIMIT = 20_000_000
+
+PERSONAL_DEDUCTION = 1_500_000  # 기본공제 (본인 및 부양가족 1인당)
+
+# 근로소득세액공제 (산출세액 구간 시작, 구간 시작 공제액, 초과분 공제율)
+EARNED_INCOME_TAX_CREDIT_TABLE = [
+    (0, 0, 0.55),
+    (1_300_000, 715_000, 0.30),
+]
+# 근로소득세액공제 한도 (총급여 구간 시작, 구간 시작 한도, 초과분 감액률, 최저 한도)
+EARNED_INCOME_TAX_CREDIT_LIMIT_TABLE = [
+    (0, 740_000, 0.0, 740_000),
+    (33_000_000, 740_000, 0.008, 660_000),
+    (70_000_000, 660_000, 0.5, 500_000),
+    (120_000_000, 500_000, 0.5, 200_000),
+]
+
+# 연도별 요율 레지스트리 (시행일 기준)
+# 급여 기간의 첫날에 시행 중인 가장 최근 항목을 사용하며,
+# 항목에 없는 키는 위의 현재 기준 값을 사용
+RATE_REGISTRY = {
+    '2023-01-01': {
+        'long_term_care_ratio': 0.1281,  # 장기요양 12.81%
+    },
+    '2024-01-01': {
+        'insurance_rates': INSURANCE_RATES,
+        'insurance_limits': INSURANCE_LIMITS,
+        'long_term_care_ratio': LONG_TERM_CARE_RATIO,
+        'income_tax_table': INCOME_TAX_TABLE,
+        'local_tax_rate': LOCAL_TAX_RATE,
+        'dependent_deduction': DEPENDENT_DEDUCTION,
+        'allowance_schema': ALLOWANCE_SCHEMA,
+        'annual_income_tax_table': ANNUAL_INCOME_TAX_TABLE,
+        'earned_income_deduction_table': EARNED_INCOME_DEDUCTION_TABLE,
+        'earned_income_deduction_limit': EARNED_INCOME_DEDUCTION_LIMIT,
+        'personal_deduction': PERSONAL_DEDUCTION,
+        'earned_income_tax_credit_table': EARNED_INCOME_TAX_CREDIT_TABLE,
+        'earned_income_tax_credit_limit_table': EARNED_INCOME_TAX_CREDIT_LIMIT_TABLE,
+    },
+}
+
+# 근로소득 간이세액표 (국세청 월별 원천징수 세액표)
+# 원본 CSV 형식: 하한(원), 상한(원), 공제대상가족 1명 ~ 11명 세액(원)
+# CSV가 없으면 위 INCOME_TAX_TABLE 누진세율 근사치를 사용
+WITHHOLDING_TABLE_CSV = os.path.join(os.path.dirname(__file__), 'data', 'withholding_table.csv')
+WITHHOLDING_TABLE_CACHE = os.path.join(os.path.dirname(__file__), 'withholding_table.npy')  # 컴파일 캐시
+WITHHOLDING_MAX_DEPENDENTS = 11  # 공제대상가족 수 (본인 포함) 최대 열
+
+# 간이세액표 상한(1천만원) 초과분 산식
+# 세액 = 1천만원 해당 세액 + 가산액 + (구간 시작 초과 금액 × 세율)
+WITHHOLDING_EXCESS_TABLE = [
+    # (구간 시작, 가산액, 초과분 세율)
+    (10_000_000, 25_000, 0.98 * 0.35),
+    (14_000_000, 1_397_000, 0.98 * 0.38),
+    (28_000_000, 6_610_600, 0.98 * 0.40),
+    (30_000_000, 7_394_600, 0.40),
+    (45_000_000, 13_394_600, 0.42),
+    (87_000_000, 31_034_600, 0.45),
+]
+
+
+def env_int(name, default, minimum=0):
+    """
+    정수 환경 변수 (임포트 시 읽는 설정용, 잘못된 값으로 앱이 시작하지 못하는 일이 없도록 함)
+    
+    Args:
+        name (str): 환경 변수 이름
+        default (int): 없거나 비어 있을 때의 값
+        minimum (int): 허용 최솟값
+    
+    Returns:
+        int: 환경 변수 값 (정수가 아니거나 minimum 미만이면 경고 후 default)
+    """
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        number = int(value)
+        if number < minimum:
+            raise ValueError(value)
+    except ValueError:
+        logger.warning(f"{name} 값이 올바르지 않아 기본값({default})을 사용합니다: {value!r}")
+        return default
+    return number
+
+
+# 대용량 명부 병렬 계산 (payroll_generator.parallel)
+PARALLEL_WORKERS = env_int('PAYROLL_WORKERS', 0)  # 워커 프로세스 수 (0이면 CPU 코어 수)
+PARALLEL_CHUNK_SIZE = 25_000  # 워커 한 번에 보내는 직원 수
+PARALLEL_MIN_ROWS = 100_000  # 이 행 수 미만은 단일 프로세스로 계산
+
+# 입사/퇴사 월 4대보험 부과 규칙 (payroll_generator.proration)
+# 보험 종류: (입사월 부과 조건, 퇴사월 부과 조건)
+#   'always': 항상 부과 (실제 지급 보수 기준)
+#   'first_day': 1일 입사(자격 취득)한 경우에만 부과 (그 외에는 다음 달부터)
+#   'last_day': 말일 퇴사한 경우에만 부과 (자격 상실일이 속한 달의 전달까지 부과)
+# 장기요양보험은 건강보험을 따름
+PRORATION_INSURANCE_RULES = {
+    'national_pension': ('first_day', 'always'),      # 취득월은 1일 취득 시만, 상실일 전날이 속한 달까지
+    'health_insurance': ('first_day', 'last_day'),    # 취득월은 1일 취득 시만, 상실일이 속한 달의 전달까지
+    'employment_insurance': ('always', 'always'),     # 실제 지급 보수 기준 (일할)
+}
+
+# 근태 기록 집계 (payroll_generator.timesheet)
+DAILY_REGULAR_MINUTES = 8 * 60    # 1일 소정 근로시간 (초과분은 연장근로)
+WEEKLY_REGULAR_MINUTES = 40 * 60  # 1주 소정 근로시간 (초과분은 연장근로)
+NIGHT_START_MINUTES = 22 * 60     # 야간근로 시작 (22시)
+NIGHT_END_MINUTES = 6 * 60        # 야간근로 종료 (다음 날 6시)
+WEEKLY_HOLIDAY = 6                # 주휴일 요일 (월=0 ~ 일=6)
+TIMESHEET_CHUNK_SIZE = 200_000    # 근태 CSV 한 번에 읽는 행 수
+
+# 통상임금 대비 가산 배율 (기본급에 포함되지 않는 부분만, 근로기준법 제56조)
+OVERTIME_MULTIPLIERS = {
+    'overtime': 1.5,          # 연장근로 (통상임금 100% + 가산 50%)
+    'night': 0.5,             # 야간근로 가산 50% (연장/휴일과 중복 가산)
+    'holiday': 1.5,           # 휴일근로 8시간 이내
+    'holiday_overtime': 2.0,  # 휴일근로 8시간 초과
+}
+
+# 직원 명부 값 검증 범위 (payroll_generator.validation)
+# 컬럼: (최소값, 최대값), None이면 제한 없음
+VALIDATION_RANGES = {
+    '기본급': (0, None),
+    '연장근무시간': (0, 31 * 24),  # 한 달 시간 수
+    '연장근무단가': (0, None),
+    '상여금': (0, None),
+    '부양가족수': (0, 20),
+}
+
+# 퇴직금 (payroll_generator.severance, 근로자퇴직급여 보장법)
+SEVERANCE_AVERAGE_MONTHS = 3      # 평균임금 산정 기간 (퇴직일 이전 개월 수)
+SEVERANCE_BONUS_MONTHS = 12       # 상여금 가산 기간 (퇴직일 이전 12개월 상여금 × 3/12)
+SEVERANCE_MIN_SERVICE_DAYS = 365  # 퇴직금 지급 최소 계속근로기간 (1년)
+MONTHLY_STANDARD_HOURS = 209      # 월 통상임금 산정 기준시간 (주 40시간, 주휴 포함)
+
+# 법정 기준 점검 (payroll_generator.compliance)
+# 최저임금 시간급 (고시 시행일: 원)
+MINIMUM_HOURLY_WAGE = {
+    '2023-01-01': 9_620,
+    '2024-01-01': 9_860,
+    '2025-01-01': 10_030,
+    '2026-01-01': 10_320,
+}
+WEEKLY_OVERTIME_LIMIT_HOURS = 12  # 주 최대 연장근로 (주 40시간 + 12시간 = 52시간)
+
+# 명부 엑셀 스트리밍 읽기 (payroll_generator.excel_handler)
+ROSTER_CHUNK_SIZE = 5_000  # 한 번에 DataFrame으로 만드는 직원 수
+# 직원 명부로 읽을 수 있는 확장자 (Parquet/Arrow는 pyarrow 필요, payroll_generator.roster_formats)
+ROSTER_EXTENSIONS = ['.xlsx', '.xls', '.csv', '.parquet', '.arrow', '.feather']
+ROSTER_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 명부 파싱 캐시 전체 크기 한도 (payroll_generator.parse_cache)
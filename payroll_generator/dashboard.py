@@ -20,23 +20,21 @@ class Dashboard:
         try:
             total_employees = len(df)
             
-            # 급여 계산
-            total_payment = 0
-            total_deduction = 0
-            total_net_pay = 0
-            
-            payroll_summary = []
-            for idx, row in df.iterrows():
-                payroll_data = self.calculator.calculate_deductions(row.to_dict())
-                total_payment += payroll_data['총지급액']
-                total_deduction += payroll_data['총공제액']
-                total_net_pay += payroll_data['실수령액']
-                
-                payroll_summary.append({
-                    '이름': row.get('이름', f'직원{idx+1}'),
+            # 급여 계산 (명부 전체 일괄 계산)
+            batch = self.calculator.calculate_batch(df)
+            total_payment = batch['총지급액'].sum().item()
+            total_deduction = batch['총공제액'].sum().item()
+            total_net_pay = batch['실수령액'].sum().item()
+            
+            names = df['이름'].tolist() if '이름' in df.columns else [f'직원{idx+1}' for idx in df.index]
+            payroll_summary = [
+                {
+                    '이름': name,
                     '총지급액': payroll_data['총지급액'],
                     '실수령액': payroll_data['실수령액']
-                })
+                }
+                for name, payroll_data in zip(names, batch.to_dict('records'))
+            ]
             
             # 근무현황 분석
             work_status = self._analyze_work_status(df)
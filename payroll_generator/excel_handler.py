@@ -1,36 +1,224 @@
 # excel_handler.py
 import os
+import numpy as np
 import pandas as pd
 import openpyxl
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 try:
+    from .config import ROSTER_CHUNK_SIZE, ROSTER_EXTENSIONS
+    from .parse_cache import file_digest
+    from .template_cache import get_template_prototype
+    from .template_stamp import ProbeData, StampedWorkbook, get_template_stamp
+    from .roster_formats import (
+        FORMAT_XLSX, FORMAT_XLS, FORMAT_CSV, FORMAT_PARQUET,
+        detect_roster_format, iter_csv_roster, iter_parquet_roster, iter_arrow_roster
+    )
     from .utils import normalize_path, validate_file_path
     from .logger import setup_logger
 except ImportError:
+    from config import ROSTER_CHUNK_SIZE, ROSTER_EXTENSIONS
+    from parse_cache import file_digest
+    from template_cache import get_template_prototype
+    from template_stamp import ProbeData, StampedWorkbook, get_template_stamp
+    from roster_formats import (
+        FORMAT_XLSX, FORMAT_XLS, FORMAT_CSV, FORMAT_PARQUET,
+        detect_roster_format, iter_csv_roster, iter_parquet_roster, iter_arrow_roster
+    )
     from utils import normalize_path, validate_file_path
     from logger import setup_logger
 
 logger = setup_logger()
 
+
+def _header_columns(header):
+    """헤더 행 -> 컬럼 이름 (뒤쪽 빈 칸 제외, 중간 빈 칸은 pd.read_excel처럼 'Unnamed: n')"""
+    header = list(header)
+    while header and header[-1] is None:
+        header.pop()
+    columns = []
+    for i, name in enumerate(header):
+        name = f'Unnamed: {i}' if name is None else str(name).strip()
+        # 중복 이름은 pd.read_excel처럼 '.1', '.2' 접미사
+        base, count = name, 1
+        while name in columns:
+            name = f'{base}.{count}'
+            count += 1
+        columns.append(name)
+    return columns
+
+
+def _records_frame(rows, columns, start):
+    """
+    행 튜플 묶음 -> DataFrame (인덱스는 파일 전체 기준 행 번호)
+    
+    pd.read_excel과 같은 형식이 되도록 숫자로만 된 문자열/빈 컬럼은 숫자로,
+    정수만 있는 실수 컬럼은 int64로 변환합니다.
+    """
+    df = pd.DataFrame(rows, columns=columns, index=pd.RangeIndex(start, start + len(rows)))
+    for col in df.columns[(df.dtypes == object).to_numpy()]:
+        try:
+            df[col] = pd.to_numeric(df[col])
+        except (ValueError, TypeError):
+            continue
+    for col in df.columns[(df.dtypes == np.float64).to_numpy()]:
+        values = df[col].to_numpy()
+        if np.isfinite(values).all() and (values == np.floor(values)).all():
+            df[col] = values.astype(np.int64)
+    return df
+
+class PayrollWorkbook:
+    """
+    직원별 급여명세서를 시트로 담는 통합 엑셀 파일 (ExcelHandler.open_payroll_workbook)
+    
+    with 블록 안에서 add로 직원을 추가하며 시트는 추가할 때마다 파일에 바로 씁니다.
+    블록에서 예외가 나면 쓰던 파일을 삭제합니다.
+    """
+    
+    def __init__(self, workbook, fill):
+        """
+        Args:
+            workbook (StampedWorkbook): 시트를 쓸 통합 워크북
+            fill (callable): (워크시트, payroll_data, employee_data)를 받아 명세서를 채우는 함수
+        """
+        self._workbook = workbook
+        self._fill = fill
+        self.path = workbook.path
+    
+    @property
+    def sheet_count(self):
+        """추가한 시트 수"""
+        return len(self._workbook.titles)
+    
+    def add(self, payroll_data, employee_data):
+        """직원 1명분 시트 추가 (시트 이름은 직원 이름, 중복이면 번호를 붙임)"""
+        name = employee_data.get('이름')
+        added = self._workbook.add_sheet(lambda ws: self._fill(ws, payroll_data, employee_data), name)
+        if not added:
+            raise ValueError(f"통합 엑셀에 쓸 수 없는 값(날짜, 수식 등)이 있습니다: {name}")
+    
+    def close(self):
+        """워크북 마무리"""
+        self._workbook.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._workbook.__exit__(exc_type, exc_value, traceback)
+
+
 class ExcelHandler:
-    def __init__(self):
+    def __init__(self, cache=None):
+        """
+        Args:
+            cache (RosterParseCache, optional): 명부 파싱 결과 캐시 (None이면 매번 파일을 읽음)
+        """
         self.required_columns = ['이름', '주민번호', '입사일', '기본급', '부양가족수']
+        self.cache = cache
+    
+    def _cache_key(self, validated_path):
+        """파일 내용 + 필수 컬럼 기준 캐시 키"""
+        return file_digest(validated_path, salt=','.join(self.required_columns))
     
     def read_employee_data(self, file_path):
-        """직원 정보 엑셀 읽기"""
+        """직원 정보 명부 읽기 (엑셀/CSV/Parquet/Arrow, 스트리밍 묶음을 하나로 합침, 캐시가 있으면 캐시 사용)"""
         try:
             # 파일 경로 정규화 및 검증
-            validated_path = validate_file_path(file_path, ['.xlsx', '.xls'])
-            logger.info(f"엑셀 파일 읽기 시작: {validated_path}")
+            validated_path = validate_file_path(file_path, ROSTER_EXTENSIONS)
             
-            df = pd.read_excel(validated_path)
-            self.validate_data(df)
+            key = self._cache_key(validated_path) if self.cache is not None else None
+            if key is not None:
+                df = self.cache.get(key)
+                if df is not None:
+                    logger.info(f"명부 캐시 사용: {validated_path} ({len(df)}행)")
+                    return df
+            
+            logger.info(f"엑셀 파일 읽기 시작: {validated_path}")
+            chunks = list(self.iter_employee_data(validated_path))
+            df = chunks[0] if len(chunks) == 1 else pd.concat(chunks)
             logger.info(f"엑셀 파일 읽기 완료: {len(df)}행")
+            if key is not None:
+                self.cache.put(key, df)
             return df
         except Exception as e:
             logger.exception(f"엑셀 파일 읽기 오류: {str(e)}")
             raise ValueError(f"엑셀 파일 읽기 오류: {str(e)}")
     
+    def iter_employee_data(self, file_path, chunksize=ROSTER_CHUNK_SIZE):
+        """
+        직원 정보 명부를 묶음 단위로 읽기 (openpyxl 읽기 전용 모드 스트리밍)
+        
+        첫 번째 시트를 행 단위로 읽어 chunksize 행마다 DataFrame을 만들므로 전체 행을
+        메모리에 올리지 않고 첫 묶음부터 계산/명세서 생성을 시작할 수 있습니다.
+        빈 행은 건너뛰며 .xls 파일은 전체를 읽은 뒤 나눕니다.
+        CSV/Parquet/Arrow 명부는 roster_formats 모듈로 같은 형식의 묶음을 읽습니다
+        (형식은 확장자가 아니라 파일 첫 바이트로 판별).
+        
+        Args:
+            file_path (str): 직원 명부 파일 (ROSTER_EXTENSIONS)
+            chunksize (int): 묶음당 직원 수
+        
+        Yields:
+            DataFrame: 직원 묶음 (인덱스는 파일 전체 기준 0부터 이어지는 행 번호,
+                데이터가 없으면 컬럼만 있는 빈 묶음 하나)
+        
+        Raises:
+            ValueError: 필수 컬럼이 없는 경우 (첫 묶음 전에 확인)
+        """
+        validated_path = validate_file_path(file_path, ROSTER_EXTENSIONS)
+        chunksize = max(int(chunksize), 1)
+        fmt = detect_roster_format(validated_path)
+        if fmt != FORMAT_XLSX:
+            yield from self._checked_chunks(self._iter_other_format(validated_path, fmt, chunksize))
+            return
+        
+        # 확장자가 .xlsx가 아닌 엑셀 파일도 읽도록 파일 객체로 전달
+        with open(validated_path, 'rb') as stream:
+            wb = openpyxl.load_workbook(stream, read_only=True, data_only=True)
+            try:
+                rows = wb.worksheets[0].iter_rows(values_only=True)
+                columns = _header_columns(next(rows, ()))
+                self.validate_data(pd.DataFrame(columns=columns))
+                
+                width = len(columns)
+                padding = (None,) * width
+                buffer = []
+                start = 0
+                for row in rows:
+                    row = (row + padding)[:width]
+                    if all(value is None for value in row):
+                        continue
+                    buffer.append(row)
+                    if len(buffer) == chunksize:
+                        yield _records_frame(buffer, columns, start)
+                        start += len(buffer)
+                        buffer = []
+                if buffer or start == 0:
+                    yield _records_frame(buffer, columns, start)
+            finally:
+                wb.close()
+    
+    def _iter_other_format(self, path, fmt, chunksize):
+        """엑셀(.xlsx) 외 형식 묶음 읽기"""
+        if fmt == FORMAT_CSV:
+            return iter_csv_roster(path, chunksize)
+        if fmt == FORMAT_PARQUET:
+            return iter_parquet_roster(path, chunksize)
+        if fmt == FORMAT_XLS:
+            df = pd.read_excel(path)
+            return (df.iloc[begin:begin + chunksize] for begin in range(0, max(len(df), 1), chunksize))
+        return iter_arrow_roster(path, chunksize)
+    
+    def _checked_chunks(self, chunks):
+        """컬럼 이름 앞뒤 공백을 없애고 첫 묶음에서 필수 컬럼 검증"""
+        first = True
+        for chunk in chunks:
+            chunk.columns = [str(col).strip() for col in chunk.columns]
+            if first:
+                self.validate_data(chunk)
+                first = False
+            yield chunk
+    
     def validate_data(self, df):
         """필수 컬럼 검증"""
         missing_cols = [col for col in self.required_columns if col not in df.columns]
@@ -40,11 +228,14 @@ class ExcelHandler:
             raise ValueError(error_msg)
     
     def get_preview(self, file_path, num_rows=3):
-        """엑셀 파일 미리보기 (첫 N행 반환)"""
+        """엑셀 파일 미리보기 (첫 N행 반환, 캐시된 명부가 있으면 캐시 사용)"""
         try:
-            validated_path = validate_file_path(file_path, ['.xlsx', '.xls'])
-            df = pd.read_excel(validated_path, nrows=num_rows)
-            return df.to_dict('records')
+            if self.cache is not None:
+                cached = self.cache.get(self._cache_key(validate_file_path(file_path, ROSTER_EXTENSIONS)))
+                if cached is not None:
+                    return cached.head(num_rows).to_dict('records')
+            chunk = next(self.iter_employee_data(file_path, chunksize=num_rows))
+            return chunk.to_dict('records')
         except Exception as e:
             logger.exception(f"미리보기 오류: {str(e)}")
             raise
@@ -119,25 +310,70 @@ class ExcelHandler:
             logger.exception(f"엑셀 생성 오류: {str(e)}")
             raise ValueError(f"엑셀 생성 오류: {str(e)}")
     
-    def _write_payroll_from_template(self, payroll_data, output_path, employee_data, period=None):
-        """템플릿 기반 급여명세서 엑셀 생성"""
+    def open_payroll_workbook(self, output_path, period=None, design_name=None):
+        """통합 엑셀(직원마다 시트 1개) 열기
+        
+        직원별 파일 대신 명세서 전체를 엑셀 파일 하나로 만듭니다. 템플릿 XML 직접 채우기로
+        시트를 만들어 바로 쓰므로 직원 수가 많아도 메모리 사용량이 늘지 않습니다.
+        
+        Args:
+            output_path (str): 출력 파일 경로
+            period (str, optional): 급여 기간 (예: "2025-01")
+            design_name (str, optional): 디자인 이름 (write_payroll과 같음, None이면 기본 템플릿)
+        
+        Returns:
+            PayrollWorkbook: with 블록에서 add로 직원 추가
+        
+        Raises:
+            ValueError: 통합 엑셀을 만들 수 없는 디자인/템플릿 (직원별 파일로 생성)
+        """
+        if design_name in ['design_1', 'design_2']:
+            design_name = None
+        
+        if design_name:
+            from .templates.designs.design_factory import DesignFactory
+            design = DesignFactory.get_design(design_name)
+            if design is None:
+                raise ValueError(f"디자인을 찾을 수 없습니다: {design_name}")
+            stamp = design.get_template_stamp()
+            fill = lambda ws, payroll_data, employee_data: design._fill_template_data(
+                ws, payroll_data, employee_data, period)
+        else:
+            template_path = self._find_payroll_template()
+            if not template_path:
+                raise ValueError("기본 템플릿 파일이 없어 통합 엑셀을 만들 수 없습니다.")
+            stamp = get_template_stamp(template_path, 'ExcelHandler', self._probe_payroll_template, lambda ws: None)
+            fill = lambda ws, payroll_data, employee_data: self._fill_payroll_template(
+                ws, payroll_data, employee_data, period)
+        if stamp is None:
+            raise ValueError("템플릿을 XML 직접 채우기로 준비할 수 없어 통합 엑셀을 만들 수 없습니다.")
+        
+        # 출력 디렉토리 생성
+        output_dir = os.path.dirname(output_path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
+        return PayrollWorkbook(StampedWorkbook(stamp, normalize_path(output_path)), fill)
+    
+    def _find_payroll_template(self):
+        """기본 템플릿 파일 경로 (없으면 None)"""
         try:
-            from .utils import mask_resident_number, resource_path
+            from .utils import resource_path
         except ImportError:
-            from utils import mask_resident_number, resource_path
+            from utils import resource_path
         
-        # 템플릿 파일 경로 찾기
         template_paths = [
             resource_path('templates/payroll_template.xlsx'),
             os.path.join(os.path.dirname(__file__), 'templates', 'payroll_template.xlsx'),
         ]
-        
-        template_path = None
         for path in template_paths:
             if os.path.exists(path):
-                template_path = path
-                break
-        
+                return path
+        return None
+    
+    def _write_payroll_from_template(self, payroll_data, output_path, employee_data, period=None):
+        """템플릿 기반 급여명세서 엑셀 생성"""
+        # 템플릿 파일 경로 찾기
+        template_path = self._find_payroll_template()
         if not template_path:
             logger.warning("템플릿 파일을 찾을 수 없어 코드 기반 생성으로 전환합니다.")
             return self._write_payroll_code_based(payroll_data, output_path, employee_data, period)
@@ -147,9 +383,26 @@ class ExcelHandler:
         if output_dir and not os.path.exists(output_dir):
             os.makedirs(output_dir, exist_ok=True)
         
-        # 템플릿 파일 로드
-        wb = openpyxl.load_workbook(template_path)
-        ws = wb.active
+        # 템플릿 원형 사용 (프로세스당 한 번 로드, 저장 후 원래 값으로 복원)
+        normalized_path = normalize_path(output_path)
+        with get_template_prototype(template_path).checkout() as wb:
+            # 템플릿 데이터 채우기 (플레이스홀더 교체)
+            self._fill_payroll_template(wb.active, payroll_data, employee_data, period)
+            
+            # 파일 저장
+            wb.save(normalized_path)
+        logger.info(f"템플릿 기반 급여명세서 엑셀 생성 완료: {normalized_path}")
+    
+    def _probe_payroll_template(self, ws):
+        """모든 항목에 값이 있는 데이터로 기본 템플릿 채우기 (스탬핑할 셀 위치 확인용)"""
+        self._fill_payroll_template(ws, ProbeData(), ProbeData(), '2000-01')
+    
+    def _fill_payroll_template(self, ws, payroll_data, employee_data, period=None):
+        """기본 템플릿 셀 채우기"""
+        try:
+            from .utils import mask_resident_number
+        except ImportError:
+            from utils import mask_resident_number
         
         # 주민번호 마스킹 처리
         masked_rrn = mask_resident_number(employee_data.get('주민번호', ''))
@@ -163,7 +416,6 @@ class ExcelHandler:
             else:
                 join_date_str = str(join_date)
         
-        # 템플릿 데이터 채우기 (플레이스홀더 교체)
         # 기간 (A2)
         if period:
             period_cell = ws['A2']
@@ -195,12 +447,6 @@ class ExcelHandler:
         net_pay_cell = ws['A23']
         if net_pay_cell.value and '{NET_PAY}' in str(net_pay_cell.value):
             net_pay_cell.value = f"실수령액: {net_pay:,}원"
-        
-        # 파일 저장
-        normalized_path = normalize_path(output_path)
-        wb.save(normalized_path)
-        wb.close()
-        logger.info(f"템플릿 기반 급여명세서 엑셀 생성 완료: {normalized_path}")
     
     def _write_payroll_code_based(self, payroll_data, output_path, employee_data, period=None):
         """코드 기반 급여명세서 엑셀 생성 (기존 방식)"""
@@ -302,6 +548,7 @@ class ExcelHandler:
             ("기본급", payroll_data.get('기본급', 0)),
             ("연장근무수당", payroll_data.get('연장근무수당', 0)),
             ("상여금", payroll_data.get('상여금', 0)),
+            ("수당", payroll_data.get('수당합계', 0)),
         ]
         
         for item_name, amount in payment_items:
@@ -0,0 +1,88 @@
+# gross_up.py
+"""역산(세후 -> 세전) 계산 모듈
+
+목표 실수령액을 받는 데 필요한 기본급을 구합니다. 실수령액은 원 단위 절사에 따른
+몇 원 이내의 흔들림을 제외하면 기본급에 대해 증가하므로(4대보험 상한액 이후에도
+마찬가지), 목표 배열 전체를 한 번에 정수 이분 탐색합니다. 반복마다 PayrollCalculator의 일괄 계산 커널을 배열로
+한 번 호출하므로 목표가 수천 개여도 약 40회 배열 연산으로 끝납니다.
+"""
+
+import numpy as np
+
+try:
+    from .calculator import PayrollCalculator
+    from .logger import setup_logger
+except ImportError:
+    from calculator import PayrollCalculator
+    from logger import setup_logger
+
+logger = setup_logger()
+
+# 상한 탐색 최대 배가 횟수 (1원에서 시작해도 2^62원까지 탐색)
+MAX_EXPANSIONS = 62
+
+
+def solve_gross_salary(target_net, calculator=None, overtime_hours=0, overtime_rate=0, bonus=0, dependents=0):
+    """
+    목표 실수령액을 받기 위한 기본급 역산
+    
+    결과 기본급 b는 정수이며 net(b) >= 목표이고 net(b - 1) < 목표입니다
+    (원 단위 절사로 실수령액이 국소적으로 몇 원 흔들리는 구간에서도 이 경계를 정확히 반환).
+    목표가 기본급 0원의 실수령액 이하이면 0을 반환합니다.
+    
+    Args:
+        target_net: 목표 실수령액 (스칼라 또는 배열)
+        calculator (PayrollCalculator, optional): 요율 기준 계산기 (None이면 현재 기준)
+        overtime_hours, overtime_rate, bonus, dependents: 고정 입력 (스칼라 또는 목표와 같은 길이의 배열)
+    
+    Returns:
+        int 또는 np.ndarray(int64): 기본급 (목표가 스칼라이면 int)
+    
+    Raises:
+        ValueError: 목표에 숫자가 아닌 값이 있거나 도달할 수 없는 경우
+    """
+    calculator = calculator or PayrollCalculator()
+    scalar = np.ndim(target_net) == 0
+    target = np.atleast_1d(np.asarray(target_net, dtype=np.float64))
+    if not np.all(np.isfinite(target)):
+        raise ValueError("목표 실수령액에 숫자가 아닌 값이 있습니다.")
+    
+    fixed = [np.broadcast_to(np.asarray(value), target.shape)
+             for value in (overtime_hours, overtime_rate, bonus, dependents)]
+    
+    def net_pay(base_salary):
+        return calculator.calculate_net_array(base_salary, *fixed)
+    
+    # 하한: 기본급 0원 (이미 목표 이상이면 답은 0)
+    lo = np.zeros(target.shape, dtype=np.int64)
+    done = net_pay(lo) >= target
+    
+    # 상한: 실수령액이 목표 이상이 될 때까지 배가 (상한액 초과 구간 포함)
+    hi = np.maximum(np.ceil(target), 1).astype(np.int64)
+    reached = done | (net_pay(hi) >= target)
+    for _ in range(MAX_EXPANSIONS):
+        if reached.all():
+            break
+        lo = np.where(reached, lo, hi)
+        hi = np.where(reached, hi, hi * 2)
+        reached = done | (net_pay(hi) >= target)
+    else:
+        if not reached.all():
+            raise ValueError("목표 실수령액에 도달하는 기본급을 찾을 수 없습니다.")
+    hi = np.where(done, 0, hi)
+    lo = np.where(done, -1, lo)
+    
+    # 정수 이분 탐색 (불변식: net(lo) < 목표 <= net(hi), 0원으로 끝난 항목은 lo = -1)
+    iterations = 0
+    while True:
+        active = hi - lo > 1
+        if not active.any():
+            break
+        mid = np.where(active, (lo + hi) // 2, hi)
+        ok = net_pay(mid) >= target
+        hi = np.where(active & ok, mid, hi)
+        lo = np.where(active & ~ok, mid, lo)
+        iterations += 1
+    
+    logger.debug(f"역산 완료: {len(target)}건, 이분 탐색 {iterations}회")
+    return int(hi[0]) if scalar else hi
@@ -5,32 +5,41 @@ from datetime import datetime
 import os
 import sys
 try:
+    from .calculator import RESULT_COLUMNS, PERIOD_COLUMN
+    from .rules import normalize_period
     from .logger import setup_logger
 except ImportError:
+    from calculator import RESULT_COLUMNS, PERIOD_COLUMN
+    from rules import normalize_period
     from logger import setup_logger
 
 logger = setup_logger()
 
+
+def get_history_dir():
+    """이력 데이터 폴더 (PyInstaller 환경에서는 사용자 홈 디렉토리)"""
+    try:
+        if getattr(sys, 'frozen', False):
+            # PyInstaller로 빌드된 실행 파일
+            data_dir = Path(os.path.expanduser('~')) / '.급여명세서생성기' / 'data'
+        else:
+            # 개발 환경
+            data_dir = Path(__file__).parent / 'data'
+    except:
+        # 오류 발생 시 홈 디렉토리 사용
+        data_dir = Path(os.path.expanduser('~')) / '.급여명세서생성기' / 'data'
+    
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
+
+
 class HistoryManager:
     """월별 급여 이력 데이터 관리자"""
     
     def __init__(self):
         """월별 급여 이력 데이터 관리자 초기화"""
         # 이력 파일 경로
-        # PyInstaller 환경에서는 사용자 홈 디렉토리에 이력 저장
-        try:
-            if getattr(sys, 'frozen', False):
-                # PyInstaller로 빌드된 실행 파일
-                data_dir = Path(os.path.expanduser('~')) / '.급여명세서생성기' / 'data'
-            else:
-                # 개발 환경
-                data_dir = Path(__file__).parent / 'data'
-        except:
-            # 오류 발생 시 홈 디렉토리 사용
-            data_dir = Path(os.path.expanduser('~')) / '.급여명세서생성기' / 'data'
-        
-        data_dir.mkdir(parents=True, exist_ok=True)
-        self.history_file = data_dir / 'monthly_payroll_history.xlsx'
+        self.history_file = get_history_dir() / 'monthly_payroll_history.xlsx'
         
         # 파일 존재 확인 및 생성
         self._ensure_file_exists()
@@ -211,3 +220,90 @@ class HistoryManager:
             if value < 0:
                 raise ValueError(f"필드 값 오류: {field}는 0 이상이어야 합니다")
 
+
+
+class EmployeeHistoryManager:
+    """직원별 월 급여 이력 관리자
+    
+    월별 합계만 보관하는 HistoryManager와 달리 직원 × 급여 기간 행마다 계산 결과를
+    긴 형식(key, '기간', '부양가족수', RESULT_COLUMNS)으로 보관합니다.
+    퇴직금 평균임금 산정(severance)과 연말정산(year_end) 입력으로 그대로 쓸 수 있습니다.
+    
+    행은 key 값으로 직원을 구분하므로 key는 명부에서 직원마다 달라야 합니다
+    (동명이인이 있는 명부는 저장하지 않음, 사번 등 고유 컬럼이 있으면 key로 지정).
+    """
+    
+    def __init__(self, history_file=None, key='이름'):
+        """
+        Args:
+            history_file (str, optional): 이력 CSV 경로 (None이면 이력 폴더의 employee_payroll_history.csv)
+            key (str): 직원 식별 컬럼 (명부에서 직원마다 고유해야 함)
+        """
+        self.history_file = Path(history_file) if history_file else get_history_dir() / 'employee_payroll_history.csv'
+        self.key = key
+        self.columns = [key, PERIOD_COLUMN, '부양가족수'] + RESULT_COLUMNS
+    
+    def load(self, start_month=None, end_month=None, employees=None):
+        """
+        직원별 이력 로드
+        
+        Args:
+            start_month: 시작 년월 (YYYY-MM 형식, None이면 전체)
+            end_month: 종료 년월 (YYYY-MM 형식, None이면 전체)
+            employees (list, optional): 직원 목록 (None이면 전체)
+        
+        Returns:
+            DataFrame: 긴 형식 이력 (파일이 없으면 빈 DataFrame)
+        """
+        if not self.history_file.exists():
+            return pd.DataFrame(columns=self.columns)
+        
+        df = pd.read_csv(self.history_file, encoding='utf-8-sig', dtype={self.key: str, PERIOD_COLUMN: str})
+        if start_month:
+            df = df[df[PERIOD_COLUMN] >= start_month]
+        if end_month:
+            df = df[df[PERIOD_COLUMN] <= end_month]
+        if employees is not None:
+            df = df[df[self.key].isin([str(employee) for employee in employees])]
+        return df.reset_index(drop=True)
+    
+    def save_period(self, period, roster, results):
+        """
+        급여 기간의 직원별 계산 결과 저장 (같은 기간, 같은 직원의 기존 행만 교체)
+        
+        Args:
+            period: 급여 기간 (예: "2025-01")
+            roster (DataFrame): 직원 명부 (key 컬럼 필수)
+            results (DataFrame): roster와 같은 순서의 calculate_batch() 결과
+        
+        Raises:
+            ValueError: key 컬럼이 없거나 key가 같은 직원(동명이인 등)이 있는 경우
+                - 같은 key의 이력이 서로 덮어쓰이거나 섞이지 않도록 저장하지 않음
+        """
+        if self.key not in roster.columns:
+            raise ValueError(f"직원별 이력 저장에 필요한 컬럼이 없습니다: {self.key}")
+        keys = roster[self.key].astype(str)
+        duplicated = keys[keys.duplicated(keep=False)].unique()
+        if len(duplicated):
+            raise ValueError(f"{self.key}이(가) 같은 직원이 있어 직원별 이력을 저장하지 않습니다: "
+                             f"{', '.join(duplicated[:10])}")
+        
+        year_month = normalize_period(period)[:7]
+        monthly = pd.DataFrame({
+            self.key: keys.to_numpy(),
+            PERIOD_COLUMN: year_month,
+            '부양가족수': roster['부양가족수'].to_numpy() if '부양가족수' in roster.columns else 0,
+        })
+        for col in RESULT_COLUMNS:
+            monthly[col] = results[col].to_numpy()
+        
+        existing = self.load()
+        replaced = (existing[PERIOD_COLUMN] == year_month) & existing[self.key].isin(monthly[self.key])
+        existing = existing[~replaced]
+        frames = [frame for frame in (existing, monthly) if not frame.empty]
+        df = pd.concat(frames, ignore_index=True) if frames else monthly
+        df = df.sort_values([PERIOD_COLUMN, self.key], kind='stable')
+        
+        self.history_file.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(self.history_file, index=False, encoding='utf-8-sig', columns=self.columns)
+        logger.info(f"직원별 이력 저장 완료: {year_month} {len(monthly)}명")
@@ -0,0 +1,164 @@
+# incremental.py
+"""증분 급여 계산 세션
+
+직원 명부를 한 번 계산해 둔 뒤, 입력이 바뀐 행만 다시 계산하고
+집계(총 지급액/총 공제액/총 실수령액)는 바뀐 행의 차이만큼만 갱신합니다.
+한 명을 수정했을 때의 재계산 비용은 명부 크기와 관계없이 일정합니다.
+"""
+
+import pandas as pd
+
+try:
+    from .calculator import PayrollCalculator, BATCH_INPUT_COLUMNS, OPTIONAL_INPUT_COLUMNS, PERIOD_COLUMN
+    from .logger import setup_logger
+except ImportError:
+    from calculator import PayrollCalculator, BATCH_INPUT_COLUMNS, OPTIONAL_INPUT_COLUMNS, PERIOD_COLUMN
+    from logger import setup_logger
+
+logger = setup_logger()
+
+# 집계 키 -> 결과 키 (app.utils.analytics.calculate_totals_from_results 반환 형식과 동일)
+TOTAL_KEYS = {
+    'total_payroll': '총지급액',
+    'total_deductions': '총공제액',
+    'total_net_pay': '실수령액',
+}
+
+# 이 행 수 이상이 바뀌면 행 단위 계산 대신 일괄 계산 사용
+BATCH_THRESHOLD = 32
+
+
+def _input_key(employee):
+    """계산에 영향을 주는 입력값 튜플 (변경 감지용)"""
+    return (tuple(employee.get(col, 0) for col in BATCH_INPUT_COLUMNS) +
+            tuple(employee.get(col) for col in OPTIONAL_INPUT_COLUMNS) + (employee.get(PERIOD_COLUMN),))
+
+
+def _amount(payroll_data, key):
+    """집계 대상 금액 (숫자가 아니면 0, calculate_totals_from_results와 같은 규칙)"""
+    value = payroll_data.get(key, 0) if payroll_data else 0
+    return value if isinstance(value, (int, float)) else 0
+
+
+class IncrementalPayrollSession:
+    """이전 계산 결과를 유지하며 바뀐 행만 재계산하는 세션"""
+    
+    def __init__(self, calculator=None):
+        """
+        Args:
+            calculator (PayrollCalculator, optional): 사용할 계산기 (None이면 현재 기준 요율)
+        """
+        self.calculator = calculator or PayrollCalculator()
+        self.employees = []
+        self.results = []
+        self.totals = dict.fromkeys(TOTAL_KEYS, 0)
+        self._keys = []
+    
+    def __len__(self):
+        return len(self.results)
+    
+    def load(self, employees, results=None, totals=None):
+        """
+        명부 전체를 세션에 적재
+        
+        Args:
+            employees: 직원 딕셔너리 리스트 또는 DataFrame
+            results (list, optional): 이미 계산된 결과 (calculate_deductions() 형식, 없으면 일괄 계산)
+            totals (dict, optional): results의 집계 (calculate_totals_from_results() 형식, 없으면 합산)
+        """
+        if isinstance(employees, pd.DataFrame):
+            employees = employees.to_dict('records')
+        employees = list(employees)
+        
+        if results is None:
+            results = self._calculate(employees)
+        elif len(results) != len(employees):
+            raise ValueError(f"직원 수({len(employees)})와 결과 수({len(results)})가 다릅니다.")
+        
+        self.employees = employees
+        self.results = list(results)
+        self._keys = [_input_key(employee) for employee in employees]
+        if totals is None:
+            totals = {name: sum(_amount(result, key) for result in self.results) for name, key in TOTAL_KEYS.items()}
+        self.totals = {name: totals.get(name, 0) for name in TOTAL_KEYS}
+        return self
+    
+    def update(self, position, employee):
+        """
+        한 직원의 입력 변경 반영 (입력이 같으면 재계산하지 않음)
+        
+        Args:
+            position (int): 명부 내 위치 (len(self)이면 끝에 추가)
+            employee (dict): 변경된 직원 데이터
+        
+        Returns:
+            dict: 해당 직원의 계산 결과
+        """
+        self._apply({position: employee})
+        return self.results[position]
+    
+    def sync(self, employees):
+        """
+        새 명부와 비교해 입력이 바뀐 행만 재계산 (추가/삭제된 끝 행 포함)
+        
+        Args:
+            employees: 직원 딕셔너리 리스트 또는 DataFrame
+        
+        Returns:
+            list: 재계산된 행 위치
+        """
+        if isinstance(employees, pd.DataFrame):
+            employees = employees.to_dict('records')
+        employees = list(employees)
+        
+        # 줄어든 끝 행은 집계에서 제외
+        while len(self.results) > len(employees):
+            self._add_totals(self.results.pop(), -1)
+            self.employees.pop()
+            self._keys.pop()
+        
+        changes = {}
+        for position, employee in enumerate(employees):
+            if position >= len(self._keys) or _input_key(employee) != self._keys[position]:
+                changes[position] = employee
+            else:
+                self.employees[position] = employee  # 이름 등 계산 외 항목은 그대로 교체
+        self._apply(changes)
+        return list(changes)
+    
+    def _apply(self, changes):
+        """바뀐 행 재계산 후 결과와 집계를 차이만큼 갱신"""
+        changes = {position: employee for position, employee in changes.items()
+                   if position >= len(self._keys) or _input_key(employee) != self._keys[position]}
+        if not changes:
+            return
+        
+        positions = sorted(changes)
+        appended = [position for position in positions if position >= len(self.results)]
+        if positions[0] < 0 or appended != list(range(len(self.results), len(self.results) + len(appended))):
+            raise IndexError(f"명부 범위를 벗어난 위치입니다: {positions}")
+        
+        new_results = self._calculate([changes[position] for position in positions])
+        for position, result in zip(positions, new_results):
+            employee = changes[position]
+            if position < len(self.results):
+                self._add_totals(self.results[position], -1)
+                self.results[position] = result
+                self.employees[position] = employee
+                self._keys[position] = _input_key(employee)
+            else:
+                self.results.append(result)
+                self.employees.append(employee)
+                self._keys.append(_input_key(employee))
+            self._add_totals(result, 1)
+        logger.debug(f"증분 재계산: {len(positions)}/{len(self.results)}명")
+    
+    def _add_totals(self, result, sign):
+        for name, key in TOTAL_KEYS.items():
+            self.totals[name] += sign * _amount(result, key)
+    
+    def _calculate(self, employees):
+        """행 단위 또는 일괄 계산 (결과는 동일, 행 수에 따라 빠른 쪽 선택)"""
+        if len(employees) < BATCH_THRESHOLD and not any(employee.get(PERIOD_COLUMN) for employee in employees):
+            return [self.calculator.calculate_deductions(employee) for employee in employees]
+        return self.calculator.calculate_batch_records(pd.DataFrame(employees))
@@ -0,0 +1,126 @@
+# parallel.py
+"""대용량 명부 병렬 계산 모듈
+
+계열사 명부를 합친 10만 행 이상의 명부를 묶음(chunk)으로 나눠 여러 프로세스에서
+일괄 계산합니다. 요율 규칙과 간이세액표는 워커 시작 시 한 번만 준비하고
+(간이세액표 캐시는 mmap으로 읽으므로 프로세스 간 같은 페이지를 공유),
+묶음마다 계산 입력 컬럼 배열만 주고받습니다. 동시에 처리 중인 묶음 수를 제한해
+최대 메모리 사용량을 일정하게 유지하며, 결과는 입력 행 순서로 합칩니다.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .calculator import PayrollCalculator, PERIOD_COLUMN, RESULT_COLUMNS, batch_inputs
+    from .config import PARALLEL_WORKERS, PARALLEL_CHUNK_SIZE, PARALLEL_MIN_ROWS
+    from .logger import setup_logger
+except ImportError:
+    from calculator import PayrollCalculator, PERIOD_COLUMN, RESULT_COLUMNS, batch_inputs
+    from config import PARALLEL_WORKERS, PARALLEL_CHUNK_SIZE, PARALLEL_MIN_ROWS
+    from logger import setup_logger
+
+logger = setup_logger()
+
+# 워커 프로세스의 계산기 (_init_worker()에서 한 번 생성)
+_worker_calculator = None
+
+
+def _init_worker(period):
+    """워커 시작 시 급여 기간의 규칙/세액표 준비"""
+    global _worker_calculator
+    _worker_calculator = PayrollCalculator(period)
+
+
+def _calculate_chunk(inputs):
+    """
+    워커에서 묶음 하나 계산
+    
+    Args:
+        inputs (dict): batch_inputs() 배열 (선택: '기간' 문자열 배열)
+    
+    Returns:
+        np.ndarray: (RESULT_COLUMNS 수, 행 수) int64 배열 (한 버퍼로 전송)
+    """
+    arrays = _worker_calculator._batch_arrays(pd.DataFrame(inputs, copy=False))
+    return np.stack([arrays[col] for col in RESULT_COLUMNS])
+
+
+def default_workers():
+    """설정된 워커 수 (PAYROLL_WORKERS 환경 변수, 0이면 CPU 코어 수)"""
+    return PARALLEL_WORKERS or os.cpu_count() or 1
+
+
+class ParallelPayrollCalculator(PayrollCalculator):
+    """묶음 단위 다중 프로세스 일괄 계산기
+    
+    PayrollCalculator와 같은 메서드를 제공하며 결과도 동일합니다.
+    calculate_batch() 계열 메서드만 min_rows 이상일 때 병렬로 계산하고,
+    그보다 작은 명부나 행 단위 계산은 현재 프로세스에서 처리합니다.
+    """
+    
+    def __init__(self, period=None, workers=None, chunk_size=None, min_rows=None):
+        """
+        Args:
+            period (str, optional): 급여 기간
+            workers (int, optional): 워커 프로세스 수 (None이면 default_workers())
+            chunk_size (int, optional): 묶음 크기 (None이면 PARALLEL_CHUNK_SIZE)
+            min_rows (int, optional): 병렬 계산 최소 행 수 (None이면 PARALLEL_MIN_ROWS)
+        """
+        super().__init__(period)
+        self.period = period
+        self.workers = max(int(workers or default_workers()), 1)
+        self.chunk_size = max(int(chunk_size or PARALLEL_CHUNK_SIZE), 1)
+        self.min_rows = PARALLEL_MIN_ROWS if min_rows is None else int(min_rows)
+    
+    def _batch_arrays(self, df):
+        """일괄 계산 (큰 명부는 묶음별 병렬 계산, 입력 행 순서)
+        
+        Raises:
+            ValueError: 숫자로 변환할 수 없는 값이나 잘못된 기간이 있는 경우
+        """
+        if self.workers == 1 or len(df) < max(self.min_rows, self.chunk_size + 1):
+            return super()._batch_arrays(df)
+        
+        # 숫자 변환은 여기서 한 번 (잘못된 값은 워커 시작 전에 ValueError)
+        inputs = batch_inputs(df)
+        if PERIOD_COLUMN in df.columns:
+            inputs[PERIOD_COLUMN] = df[PERIOD_COLUMN].astype('string').to_numpy(dtype=object)
+        
+        try:
+            output = self._run_chunks(inputs, len(df))
+        except BrokenProcessPool as e:
+            logger.warning(f"병렬 계산 실패, 단일 프로세스로 계산합니다: {e}")
+            return super()._batch_arrays(df)
+        return dict(zip(RESULT_COLUMNS, output))
+    
+    def _run_chunks(self, inputs, size):
+        """묶음을 워커에 나눠 계산하고 결과를 입력 순서 위치에 기록"""
+        output = np.empty((len(RESULT_COLUMNS), size), dtype=np.int64)
+        bounds = [(begin, min(begin + self.chunk_size, size)) for begin in range(0, size, self.chunk_size)]
+        workers = min(self.workers, len(bounds))
+        max_pending = workers * 2  # 동시에 메모리에 올라가는 묶음 수 제한
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.period,)) as executor:
+            pending = {}
+            for begin, end in bounds:
+                if len(pending) >= max_pending:
+                    self._collect(pending, wait(pending, return_when=FIRST_COMPLETED).done, output)
+                chunk = {col: values[begin:end] for col, values in inputs.items()}
+                pending[executor.submit(_calculate_chunk, chunk)] = begin
+            self._collect(pending, wait(pending).done, output)
+        
+        logger.info(f"병렬 급여 계산: {size}명, 묶음 {len(bounds)}개, 워커 {workers}개")
+        return output
+    
+    @staticmethod
+    def _collect(pending, done, output):
+        for future in done:
+            begin = pending.pop(future)
+            result = future.result()
+            output[:, begin:begin + result.shape[1]] = result
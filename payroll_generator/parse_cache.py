@@ -0,0 +1,122 @@
+# parse_cache.py
+"""직원 명부 파싱 결과 캐시
+
+같은 명부 파일을 미리보기, 대시보드, 급여 생성 단계마다 다시 읽지 않도록
+ExcelHandler.read_employee_data 결과(필수 컬럼 검증을 통과한 DataFrame)를
+파일 내용 해시를 키로 앱 데이터 폴더에 pickle로 저장합니다. 파일 이름이나 경로가
+달라도(웹 재업로드 등) 내용이 같으면 캐시를 사용하고, 내용이 바뀌면 새로 읽습니다.
+
+캐시 파일의 수정 시각을 마지막 사용 시각으로 갱신하고, 전체 크기가 max_bytes를
+넘으면 오래 사용하지 않은 파일부터 삭제합니다 (LRU).
+읽기 방식이 바뀌면 PARSE_CACHE_VERSION을 올려 이전 캐시를 무효화합니다.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+try:
+    from .config import ROSTER_CACHE_MAX_BYTES
+    from .history_manager import get_history_dir
+    from .logger import setup_logger
+except ImportError:
+    from config import ROSTER_CACHE_MAX_BYTES
+    from history_manager import get_history_dir
+    from logger import setup_logger
+
+logger = setup_logger()
+
+# 명부 읽기 방식 버전 (바뀌면 이전 캐시는 사용하지 않음)
+PARSE_CACHE_VERSION = 1
+
+CACHE_SUFFIX = '.pkl'
+
+# 파일 해시 계산 시 한 번에 읽는 크기
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_digest(path, salt=''):
+    """파일 내용 SHA-256 해시 (salt: 읽기 방식/옵션 구분 문자열)"""
+    digest = hashlib.sha256(f'{PARSE_CACHE_VERSION}:{salt}:'.encode('utf-8'))
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class RosterParseCache:
+    """파일 내용 해시 기반 명부 DataFrame 캐시 (크기 제한 LRU)"""
+    
+    def __init__(self, cache_dir=None, max_bytes=ROSTER_CACHE_MAX_BYTES):
+        """
+        Args:
+            cache_dir (str, optional): 캐시 폴더 (None이면 앱 데이터 폴더의 roster_cache)
+            max_bytes (int): 캐시 파일 전체 크기 한도
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else get_history_dir() / 'roster_cache'
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+    
+    def _entry_path(self, key):
+        return self.cache_dir / f'{key}{CACHE_SUFFIX}'
+    
+    def get(self, key):
+        """캐시된 DataFrame (없거나 읽을 수 없으면 None, 읽을 때마다 새 객체)"""
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                df = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"명부 캐시를 읽을 수 없어 삭제합니다: {path.name} ({e})")
+            path.unlink(missing_ok=True)
+            return None
+        
+        # 마지막 사용 시각 갱신 (LRU 순서)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return df
+    
+    def put(self, key, df):
+        """DataFrame 저장 (임시 파일에 쓴 뒤 교체) 후 크기 한도 초과분 삭제"""
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self._entry_path(key))
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            # 캐시 저장 실패는 명부 읽기에 영향을 주지 않음
+            logger.warning(f"명부 캐시 저장 실패: {e}")
+            return
+        self.evict()
+    
+    def evict(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 오래 사용하지 않은 캐시 삭제"""
+        entries = []
+        for path in self.cache_dir.glob(f'*{CACHE_SUFFIX}'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.info(f"명부 캐시 삭제 (크기 한도 초과): {path.name}")
+    
+    def clear(self):
+        """캐시 전체 삭제"""
+        for path in self.cache_dir.glob(f'*{CACHE_SUFFIX}'):
+            path.unlink(missing_ok=True)
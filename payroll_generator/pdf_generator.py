@@ -267,6 +267,8 @@ class PDFGenerator:
                 payment_items.append(("연장근무수당", payroll_data.get('연장근무수당', 0)))
             if payroll_data.get('상여금', 0) > 0:
                 payment_items.append(("상여금", payroll_data.get('상여금', 0)))
+            if payroll_data.get('수당합계', 0) > 0:
+                payment_items.append(("수당", payroll_data.get('수당합계', 0)))
             
             # 지급 항목 표시
             row_height = 10*mm
@@ -0,0 +1,121 @@
+# proration.py
+"""입사/퇴사 월 일할 계산 모듈
+
+급여 기간 중에 입사하거나 퇴사한 직원의 기본급과 고정 수당을 근무일수만큼
+일할 계산하고, 입사/퇴사 월의 4대보험 부과 여부를 판정해 계산 입력 컬럼으로
+추가합니다. 명부 전체를 날짜 컬럼 단위 벡터 연산으로 처리하므로 결과를 그대로
+PayrollCalculator.calculate_batch()에 넘기면 월말 급여를 한 번에 계산할 수 있습니다.
+
+추가 컬럼:
+    근무일수: 급여 기간 중 재직 일수 (입사일~퇴사일, 양 끝 포함)
+    보수월액: 일할 전 기본급 + 고정 수당 (국민연금/건강보험 기준 금액)
+    국민연금부과/건강보험부과/고용보험부과: 1이면 부과, 0이면 미부과
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .calculator import STANDARD_WAGE_COLUMN, INSURANCE_FLAG_COLUMNS
+    from .config import PRORATION_INSURANCE_RULES, ALLOWANCE_SCHEMA
+    from .rules import normalize_period
+    from .validation import parse_dates
+    from .logger import setup_logger
+except ImportError:
+    from calculator import STANDARD_WAGE_COLUMN, INSURANCE_FLAG_COLUMNS
+    from config import PRORATION_INSURANCE_RULES, ALLOWANCE_SCHEMA
+    from rules import normalize_period
+    from validation import parse_dates
+    from logger import setup_logger
+
+logger = setup_logger()
+
+HIRE_DATE_COLUMN = '입사일'
+LEAVE_DATE_COLUMN = '퇴사일'
+WORKED_DAYS_COLUMN = '근무일수'
+
+# 일할 계산 대상 컬럼 (기본급과 고정 수당, 연장근무수당/상여금/실비 수당은 실적 기준이므로 제외)
+PRORATED_COLUMNS = ['기본급'] + [name for name, spec in ALLOWANCE_SCHEMA.items() if spec.get('fixed')]
+
+
+def _parse_dates(df, column):
+    """날짜 컬럼 해석 (없거나 빈 값은 NaT, 해석할 수 없는 값은 경고 후 NaT)"""
+    if column not in df.columns:
+        return pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+    raw = df[column]
+    dates = parse_dates(raw)
+    invalid = dates.isna() & raw.notna() & (raw.astype(str).str.strip() != '')
+    if invalid.any():
+        logger.warning(f"{column} 형식을 해석할 수 없어 일할 계산에서 제외합니다: {int(invalid.sum())}건")
+    return dates.dt.normalize()
+
+
+def _month_rule(rule, in_month, on_boundary):
+    """입사/퇴사 월 부과 조건 판정 (PRORATION_INSURANCE_RULES 참고)"""
+    if rule == 'always':
+        return np.ones(len(in_month), dtype=bool)
+    if rule in ('first_day', 'last_day'):
+        return ~in_month | on_boundary
+    raise ValueError(f"알 수 없는 보험 부과 규칙입니다: {rule}")
+
+
+def prorate_roster(df, period, columns=None):
+    """
+    급여 기간 중 입사/퇴사자 일할 계산
+    
+    입사일/퇴사일이 급여 기간 밖이거나 없는 직원은 금액을 바꾸지 않습니다
+    (보험 부과 여부 컬럼만 1로 추가되므로 계산 결과도 그대로입니다).
+    
+    Args:
+        df (DataFrame): 직원 명부 (선택: '입사일', '퇴사일')
+        period: 급여 기간 (예: "2025-01")
+        columns (list, optional): 일할 계산 대상 금액 컬럼 (None이면 PRORATED_COLUMNS)
+    
+    Returns:
+        DataFrame: 일할 금액과 근무일수/보수월액/보험 부과 여부 컬럼을 추가한 복사본
+    
+    Raises:
+        ValueError: 급여 기간 형식이 잘못되었거나 금액을 숫자로 변환할 수 없는 경우
+    """
+    start = pd.Timestamp(normalize_period(period))
+    end = start + pd.offsets.MonthEnd(0)
+    days = end.day
+    hire = _parse_dates(df, HIRE_DATE_COLUMN)
+    leave = _parse_dates(df, LEAVE_DATE_COLUMN)
+    
+    # 급여 기간과 재직 기간이 겹치는 일수
+    first = hire.where(hire > start, start)
+    last = leave.where(leave < end, end)
+    worked = ((last - first).dt.days + 1).clip(0, days).to_numpy(dtype=np.int64)
+    partial = worked < days
+    
+    columns = [col for col in (PRORATED_COLUMNS if columns is None else columns) if col in df.columns]
+    result = df.copy()
+    if '기본급' in df.columns and STANDARD_WAGE_COLUMN not in df.columns:
+        result[STANDARD_WAGE_COLUMN] = sum(pd.to_numeric(df[col], errors='raise').fillna(0) for col in columns)
+    for col in columns:
+        values = pd.to_numeric(df[col], errors='raise').fillna(0).to_numpy()
+        if values.dtype.kind in 'iu':
+            prorated = values * worked // days
+        else:
+            prorated = np.floor(values * worked / days)
+        result[col] = np.where(partial, prorated, values)
+    result[WORKED_DAYS_COLUMN] = worked
+    
+    # 입사/퇴사 월 보험 부과 여부 (기존 부과 여부 컬럼이 0이면 그대로 미부과)
+    hired_in_month = ((hire >= start) & (hire <= end)).to_numpy()
+    left_in_month = ((leave >= start) & (leave <= end)).to_numpy()
+    hired_first_day = (hire.dt.day == 1).to_numpy()
+    left_last_day = (leave.dt.day == days).to_numpy()
+    for insurance_type, (on_hire, on_leave) in PRORATION_INSURANCE_RULES.items():
+        charged = ((worked > 0) &
+                   _month_rule(on_hire, hired_in_month, hired_first_day) &
+                   _month_rule(on_leave, left_in_month, left_last_day))
+        col = INSURANCE_FLAG_COLUMNS[insurance_type]
+        if col in df.columns:
+            existing = pd.to_numeric(df[col], errors='raise').to_numpy(dtype=np.float64)
+            charged &= np.isnan(existing) | (existing != 0)
+        result[col] = charged.astype(np.int64)
+    
+    logger.info(f"일할 계산 완료: {start:%Y-%m} 입사/퇴사 {int(partial.sum())}명 / 전체 {len(df)}명")
+    return result
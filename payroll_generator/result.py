@@ -0,0 +1,114 @@
+# result.py
+"""급여 계산 결과 타입
+
+PayrollResult는 calculate_deductions() 결과 딕셔너리 대신 쓸 수 있는
+__slots__ 기반 정수 필드 객체입니다. 한글 키로 조회하는 읽기 전용 매핑 인터페이스
+(result['실수령액'], result.get(...), dict(result))를 제공하므로 기존 딕셔너리
+사용 코드와 호환됩니다.
+
+일괄 계산 결과는 RESULT_DTYPE 구조화 배열(np.recarray)로 한 번에 보관합니다.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+# (필드명, 결과 딕셔너리 키) - calculate_deductions() 반환 순서와 동일
+RESULT_FIELD_KEYS = (
+    ('base_salary', '기본급'),
+    ('overtime_pay', '연장근무수당'),
+    ('bonus', '상여금'),
+    ('allowances', '수당합계'),
+    ('total_payment', '총지급액'),
+    ('non_taxable', '비과세액'),
+    ('national_pension', '국민연금'),
+    ('health_insurance', '건강보험'),
+    ('long_term_care', '장기요양'),
+    ('employment_insurance', '고용보험'),
+    ('dependent_deduction', '부양가족공제'),
+    ('income_tax', '소득세'),
+    ('local_tax', '지방소득세'),
+    ('total_deduction', '총공제액'),
+    ('net_pay', '실수령액'),
+)
+RESULT_FIELDS = tuple(field for field, _ in RESULT_FIELD_KEYS)
+RESULT_KEYS = tuple(key for _, key in RESULT_FIELD_KEYS)
+
+# 일괄 계산 결과 구조화 배열 dtype (원 단위 정수, 소수점 이하 버림)
+RESULT_DTYPE = np.dtype([(field, np.int64) for field in RESULT_FIELDS])
+
+_KEY_TO_FIELD = dict((key, field) for field, key in RESULT_FIELD_KEYS)
+
+
+class PayrollResult(Mapping):
+    """직원 1명의 급여 계산 결과 (원 단위 정수 필드)"""
+    
+    __slots__ = RESULT_FIELDS
+    
+    def __init__(self, base_salary, overtime_pay, bonus, allowances, total_payment, non_taxable,
+                 national_pension, health_insurance, long_term_care, employment_insurance,
+                 dependent_deduction, income_tax, local_tax, total_deduction, net_pay):
+        self.base_salary = int(base_salary)
+        self.overtime_pay = int(overtime_pay)
+        self.bonus = int(bonus)
+        self.allowances = int(allowances)
+        self.total_payment = int(total_payment)
+        self.non_taxable = int(non_taxable)
+        self.national_pension = int(national_pension)
+        self.health_insurance = int(health_insurance)
+        self.long_term_care = int(long_term_care)
+        self.employment_insurance = int(employment_insurance)
+        self.dependent_deduction = int(dependent_deduction)
+        self.income_tax = int(income_tax)
+        self.local_tax = int(local_tax)
+        self.total_deduction = int(total_deduction)
+        self.net_pay = int(net_pay)
+    
+    @classmethod
+    def from_mapping(cls, data):
+        """calculate_deductions() 형식 딕셔너리에서 생성 (없는 키는 0)"""
+        return cls(*(data.get(key, 0) for key in RESULT_KEYS))
+    
+    # 매핑 인터페이스 (한글 키)
+    def __getitem__(self, key):
+        try:
+            return getattr(self, _KEY_TO_FIELD[key])
+        except KeyError:
+            raise KeyError(key) from None
+    
+    def __iter__(self):
+        return iter(RESULT_KEYS)
+    
+    def __len__(self):
+        return len(RESULT_KEYS)
+    
+    def __contains__(self, key):
+        return key in _KEY_TO_FIELD
+    
+    def __repr__(self):
+        fields = ', '.join(f"{field}={getattr(self, field)}" for field in RESULT_FIELDS)
+        return f"PayrollResult({fields})"
+    
+    def __reduce__(self):
+        return (self.__class__, self.as_tuple())
+    
+    def as_tuple(self):
+        """필드 값 튜플 (RESULT_FIELDS 순서)"""
+        return tuple(getattr(self, field) for field in RESULT_FIELDS)
+    
+    def to_dict(self):
+        """calculate_deductions()와 같은 한글 키 딕셔너리로 변환 (세션/JSON 저장용)"""
+        return dict(zip(RESULT_KEYS, self.as_tuple()))
+
+
+def results_from_array(records):
+    """RESULT_DTYPE 구조화 배열을 PayrollResult 리스트로 변환"""
+    return [PayrollResult(*row) for row in records.tolist()]
+
+
+def results_to_array(results):
+    """PayrollResult(또는 결과 딕셔너리) 목록을 RESULT_DTYPE 구조화 배열로 변환"""
+    rows = [result.as_tuple() if isinstance(result, PayrollResult)
+            else PayrollResult.from_mapping(result).as_tuple()
+            for result in results]
+    return np.rec.array(np.array(rows, dtype=RESULT_DTYPE))
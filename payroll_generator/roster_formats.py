@@ -0,0 +1,112 @@
+# roster_formats.py
+"""직원 명부 파일 형식 판별 / 열 기반 형식 읽기 모듈
+
+인사 시스템이 내보내는 CSV, Parquet, Arrow IPC(Feather v2) 명부를 엑셀로 변환하지 않고
+바로 읽습니다. 형식은 파일 첫 바이트(매직 넘버)로 판별하고, 판별할 수 없으면 확장자를
+따릅니다. 모든 형식은 ExcelHandler.iter_employee_data와 같은 묶음(chunk) 단위
+DataFrame을 돌려주며 인덱스는 파일 전체 기준 0부터 이어지는 행 번호입니다.
+
+Parquet/Arrow는 선택 의존성인 pyarrow가 필요합니다 (없으면 ValueError).
+"""
+
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+    HAS_PYARROW = True
+except ImportError:
+    pyarrow = None
+    HAS_PYARROW = False
+
+try:
+    from .timesheet import detect_csv_encoding
+    from .logger import setup_logger
+except ImportError:
+    from timesheet import detect_csv_encoding
+    from logger import setup_logger
+
+logger = setup_logger()
+
+FORMAT_XLSX = 'xlsx'
+FORMAT_XLS = 'xls'
+FORMAT_CSV = 'csv'
+FORMAT_PARQUET = 'parquet'
+FORMAT_ARROW = 'arrow'
+
+# 파일 첫 바이트 -> 형식
+MAGIC_NUMBERS = (
+    (b'PK\x03\x04', FORMAT_XLSX),                       # Office Open XML (zip)
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', FORMAT_XLS),  # OLE2 복합 문서
+    (b'PAR1', FORMAT_PARQUET),
+    (b'ARROW1', FORMAT_ARROW),                          # Arrow IPC 파일 / Feather v2
+    (b'\xff\xff\xff\xff', FORMAT_ARROW),                # Arrow IPC 스트림 (continuation 마커)
+)
+
+# 확장자 -> 형식 (매직 넘버로 판별할 수 없는 경우)
+EXTENSION_FORMATS = {
+    '.xlsx': FORMAT_XLSX,
+    '.xls': FORMAT_XLS,
+    '.csv': FORMAT_CSV,
+    '.parquet': FORMAT_PARQUET,
+    '.arrow': FORMAT_ARROW,
+    '.feather': FORMAT_ARROW,
+}
+
+
+def detect_roster_format(path):
+    """명부 파일 형식 판별 (매직 넘버 우선, 없으면 확장자, 그래도 모르면 CSV)"""
+    with open(path, 'rb') as f:
+        head = f.read(8)
+    for magic, fmt in MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return fmt
+    return EXTENSION_FORMATS.get(os.path.splitext(path)[1].lower(), FORMAT_CSV)
+
+
+def _require_pyarrow(fmt):
+    if not HAS_PYARROW:
+        raise ValueError(f"{fmt} 명부를 읽으려면 pyarrow가 필요합니다 (pip install pyarrow)")
+
+
+def _with_index(df, start):
+    """파일 전체 기준 행 번호 인덱스 지정"""
+    df.index = pd.RangeIndex(start, start + len(df))
+    return df
+
+
+def iter_csv_roster(path, chunksize, encoding=None):
+    """CSV 명부 묶음 읽기 (인코딩을 주지 않으면 UTF-8/CP949 판별, 헤더만 있으면 빈 묶음 하나)"""
+    encoding = encoding or detect_csv_encoding(path)
+    logger.info(f"CSV 명부 인코딩: {encoding}")
+    with pd.read_csv(path, chunksize=chunksize, encoding=encoding, skipinitialspace=True) as reader:
+        yield from reader
+
+
+def iter_parquet_roster(path, chunksize):
+    """Parquet 명부 묶음 읽기 (행 그룹을 chunksize 행 배치로 읽음)"""
+    _require_pyarrow('Parquet')
+    parquet_file = pyarrow.parquet.ParquetFile(path)
+    start = 0
+    for batch in parquet_file.iter_batches(batch_size=chunksize):
+        yield _with_index(batch.to_pandas(), start)
+        start += batch.num_rows
+    if start == 0:
+        yield parquet_file.schema_arrow.empty_table().to_pandas()
+
+
+def iter_arrow_roster(path, chunksize):
+    """Arrow IPC 파일/스트림(Feather v2) 명부 묶음 읽기 (메모리 매핑, 복사 없이 잘라서 변환)"""
+    _require_pyarrow('Arrow')
+    # 테이블 버퍼가 매핑을 참조하므로 닫지 않음 (테이블이 해제되면 함께 해제)
+    source = pyarrow.memory_map(path)
+    try:
+        table = pyarrow.ipc.open_file(source).read_all()
+    except pyarrow.ArrowInvalid:
+        source.seek(0)
+        table = pyarrow.ipc.open_stream(source).read_all()
+    for start in range(0, max(table.num_rows, 1), chunksize):
+        yield _with_index(table.slice(start, chunksize).to_pandas(), start)
@@ -0,0 +1,194 @@
+# rules.py
+"""연도별 급여 계산 규칙 모듈
+
+config.RATE_REGISTRY의 시행일별 요율을 읽기 전용 RuleSet으로 컴파일합니다.
+컴파일 결과는 시행일별로 캐시되므로, 여러 기간이 섞인 일괄 계산도
+규칙 컴파일 비용은 시행일(연도)당 한 번만 발생합니다.
+"""
+
+import re
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import date, datetime
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+try:
+    from .config import (
+        INSURANCE_RATES,
+        INSURANCE_LIMITS,
+        INCOME_TAX_TABLE,
+        LOCAL_TAX_RATE,
+        DEPENDENT_DEDUCTION,
+        LONG_TERM_CARE_RATIO,
+        ALLOWANCE_SCHEMA,
+        WON_TRUNCATION_UNIT,
+        RATE_REGISTRY
+    )
+    from .tax_table import TaxBracketIndex, INCOME_TAX_INDEX, to_scaled_rate
+    from .logger import setup_logger
+except ImportError:
+    from config import (
+        INSURANCE_RATES,
+        INSURANCE_LIMITS,
+        INCOME_TAX_TABLE,
+        LOCAL_TAX_RATE,
+        DEPENDENT_DEDUCTION,
+        LONG_TERM_CARE_RATIO,
+        ALLOWANCE_SCHEMA,
+        WON_TRUNCATION_UNIT,
+        RATE_REGISTRY
+    )
+    from tax_table import TaxBracketIndex, INCOME_TAX_INDEX, to_scaled_rate
+    from logger import setup_logger
+
+logger = setup_logger()
+
+RuleSet = namedtuple('RuleSet', [
+    'effective_date',        # 시행일 ('YYYY-MM-DD')
+    'insurance_types',       # 상한액이 있는 보험 종류 (rates/limits 배열 순서)
+    'rates',                 # 요율 배열 (백만분율 int64)
+    'limits',                # 상한액 배열
+    'insurance_rates',       # 요율 (읽기 전용 딕셔너리)
+    'insurance_limits',      # 상한액 (읽기 전용 딕셔너리)
+    'long_term_care_ratio',  # 장기요양 (건강보험료 대비 비율)
+    'long_term_care_scaled', # 장기요양 비율 (백만분율 정수)
+    'tax_index',             # 소득세 구간 인덱스 (TaxBracketIndex)
+    'local_tax_rate',        # 지방소득세율
+    'local_tax_scaled',      # 지방소득세율 (백만분율 정수)
+    'truncation_unit',       # 보험료/세액 절사 단위 (원)
+    'dependent_deduction',   # 부양가족 공제액 (읽기 전용 딕셔너리)
+    'dependent_lookup',      # 부양가족 공제액 배열 (0명 ~ 최대 인원)
+    'dependent_default',     # 범위 밖 부양가족수 공제액
+    'allowance_names',       # 수당 항목 (ALLOWANCE_SCHEMA 컬럼 순서)
+    'allowance_limits',      # 수당별 월 비과세 한도 배열 (전액 비과세는 int64 최댓값)
+    'allowance_fixed',       # 수당별 고정 수당 여부 배열 (bool)
+])
+
+# 전액 비과세 수당의 한도 값
+NO_LIMIT = np.iinfo(np.int64).max
+
+_PERIOD_PATTERN = re.compile(r'^\s*(\d{4})\s*[-./년]\s*(\d{1,2})')
+
+
+def normalize_period(period=None):
+    """급여 기간을 기간 첫날 문자열('YYYY-MM-DD')로 변환
+    
+    Args:
+        period: 'YYYY-MM', 'YYYY-MM-DD', 'YYYY년 MM월', date/datetime 또는 None(오늘)
+    
+    Raises:
+        ValueError: 해석할 수 없는 형식인 경우
+    """
+    if period is None or period == '':
+        period = date.today()
+    if isinstance(period, (date, datetime)):
+        return f"{period.year:04d}-{period.month:02d}-01"
+    
+    match = _PERIOD_PATTERN.match(str(period))
+    if not match or not 1 <= int(match.group(2)) <= 12:
+        raise ValueError(f"급여 기간 형식이 올바르지 않습니다: {period}")
+    return f"{int(match.group(1)):04d}-{int(match.group(2)):02d}-01"
+
+
+def resolve_effective_date(period=None):
+    """급여 기간에 적용할 시행일 키 반환"""
+    effective_dates = sorted(RATE_REGISTRY)
+    day = normalize_period(period)
+    i = bisect_right(effective_dates, day) - 1
+    if i < 0:
+        logger.warning(f"{day} 이전 요율이 등록되어 있지 않아 {effective_dates[0]} 기준을 사용합니다.")
+        i = 0
+    return effective_dates[i]
+
+
+def _readonly_array(values, dtype):
+    array = np.array(values, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+
+def _build_rule_set(effective_date, entry):
+    """레지스트리 항목(없는 키는 현재 기준 값)을 RuleSet으로 변환"""
+    rates = dict(entry.get('insurance_rates', INSURANCE_RATES))
+    limits = dict(entry.get('insurance_limits', INSURANCE_LIMITS))
+    dependent_deduction = dict(entry.get('dependent_deduction', DEPENDENT_DEDUCTION))
+    tax_table = entry.get('income_tax_table', INCOME_TAX_TABLE)
+    long_term_care_ratio = entry.get('long_term_care_ratio', LONG_TERM_CARE_RATIO)
+    local_tax_rate = entry.get('local_tax_rate', LOCAL_TAX_RATE)
+    
+    insurance_types = tuple(limits)
+    max_dependents = max(dependent_deduction)
+    dependent_default = dependent_deduction[max_dependents]
+    
+    # 수당 컬럼은 ALLOWANCE_SCHEMA 기준 (시행일별로 한도/고정 여부만 변경)
+    allowance_schema = entry.get('allowance_schema', ALLOWANCE_SCHEMA)
+    allowances = [allowance_schema.get(name, spec) for name, spec in ALLOWANCE_SCHEMA.items()]
+    
+    return RuleSet(
+        effective_date=effective_date,
+        insurance_types=insurance_types,
+        rates=_readonly_array([to_scaled_rate(rates[name]) for name in insurance_types], np.int64),
+        limits=_readonly_array([limits[name] for name in insurance_types], np.int64),
+        insurance_rates=MappingProxyType(rates),
+        insurance_limits=MappingProxyType(limits),
+        long_term_care_ratio=long_term_care_ratio,
+        long_term_care_scaled=to_scaled_rate(long_term_care_ratio),
+        tax_index=INCOME_TAX_INDEX if tax_table is INCOME_TAX_TABLE else TaxBracketIndex(tax_table),
+        local_tax_rate=local_tax_rate,
+        local_tax_scaled=to_scaled_rate(local_tax_rate),
+        truncation_unit=entry.get('truncation_unit', WON_TRUNCATION_UNIT),
+        dependent_deduction=MappingProxyType(dependent_deduction),
+        dependent_lookup=_readonly_array(
+            [dependent_deduction.get(i, dependent_default) for i in range(max_dependents + 1)], np.int64
+        ),
+        dependent_default=dependent_default,
+        allowance_names=tuple(ALLOWANCE_SCHEMA),
+        allowance_limits=_readonly_array(
+            [NO_LIMIT if spec['non_taxable_limit'] is None else spec['non_taxable_limit'] for spec in allowances],
+            np.int64
+        ),
+        allowance_fixed=_readonly_array([spec.get('fixed', False) for spec in allowances], bool),
+    )
+
+
+@lru_cache(maxsize=None)
+def compile_rule_set(effective_date):
+    """시행일의 레지스트리 항목을 RuleSet으로 컴파일 (시행일별 1회)"""
+    rule_set = _build_rule_set(effective_date, RATE_REGISTRY[effective_date])
+    logger.info(f"급여 계산 규칙 컴파일: {effective_date}")
+    return rule_set
+
+
+def derive_rule_set(base_rules, overrides):
+    """
+    기존 RuleSet에 요율 변경을 적용한 새 RuleSet 생성 (가정 시나리오용, 캐시하지 않음)
+    
+    Args:
+        base_rules (RuleSet): 기준 규칙
+        overrides (dict): 레지스트리 항목 형식의 변경 사항
+            - insurance_rates / insurance_limits: 바꿀 보험 종류만 지정 (나머지는 기준 값)
+            - income_tax_table, long_term_care_ratio, local_tax_rate 등: 값 전체 교체
+    
+    Raises:
+        ValueError: 기준 규칙에 없는 보험 종류를 지정한 경우
+    """
+    entry = dict(RATE_REGISTRY[base_rules.effective_date])
+    for key, value in overrides.items():
+        if key in ('insurance_rates', 'insurance_limits'):
+            merged = dict(getattr(base_rules, key))
+            unknown = set(value) - set(merged)
+            if unknown:
+                raise ValueError(f"알 수 없는 보험 종류입니다: {', '.join(sorted(unknown))}")
+            merged.update(value)
+            entry[key] = merged
+        else:
+            entry[key] = value
+    return _build_rule_set(base_rules.effective_date, entry)
+
+
+def get_rule_set(period=None):
+    """급여 기간에 적용할 RuleSet 반환 (시행일별 캐시)"""
+    return compile_rule_set(resolve_effective_date(period))
@@ -0,0 +1,188 @@
+# scenarios.py
+"""요율 변경 가정(What-if) 시나리오 모듈
+
+기준 명부 하나에 여러 요율 변경 시나리오를 적용해 시나리오별 합계를 구합니다.
+지급액처럼 요율과 무관한 값은 한 번만 계산하고, 보험료/세액은
+(시나리오 × 직원) 배열 연산 한 번으로 모든 시나리오를 동시에 계산합니다.
+결과는 시나리오마다 PayrollCalculator로 일괄 계산한 합계와 동일합니다
+(수당 비과세 한도는 시나리오와 무관하게 기준 규칙을 적용).
+"""
+
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .calculator import (
+        PayrollCalculator,
+        batch_inputs,
+        insurance_inputs,
+        payment_arrays,
+        dependent_deduction_array
+    )
+    from .config import RATE_SCALE
+    from .rules import derive_rule_set
+    from .logger import setup_logger
+except ImportError:
+    from calculator import (
+        PayrollCalculator,
+        batch_inputs,
+        insurance_inputs,
+        payment_arrays,
+        dependent_deduction_array
+    )
+    from config import RATE_SCALE
+    from rules import derive_rule_set
+    from logger import setup_logger
+
+logger = setup_logger()
+
+# 시나리오별 합계 컬럼
+SCENARIO_TOTAL_COLUMNS = [
+    '총지급액', '국민연금', '건강보험', '장기요양', '고용보험',
+    '소득세', '지방소득세', '총공제액', '실수령액'
+]
+
+# 한 번에 계산할 직원 수 (시나리오 × 보험 종류 × 직원 배열 메모리 제한)
+DEFAULT_CHUNK_SIZE = 20_000
+
+# 세액 구간 패딩용 시작값 (어떤 과세표준보다도 큼)
+_NO_BRACKET = np.iinfo(np.int64).max
+
+
+def scenario_grid(axes):
+    """
+    변경 항목별 후보 값의 모든 조합으로 시나리오 생성
+    
+    Args:
+        axes (dict): {변경 항목: 후보 값 리스트}
+            - 변경 항목은 ('insurance_rates', 'national_pension') 같은 튜플 경로
+              또는 'long_term_care_ratio' 같은 최상위 키
+    
+    Returns:
+        dict: {시나리오 이름: 레지스트리 항목 형식의 변경 사항}
+    
+    Example:
+        scenario_grid({
+            ('insurance_rates', 'national_pension'): [0.045, 0.0475],
+            ('insurance_limits', 'national_pension'): [5_530_000, 6_170_000],
+        })
+    """
+    paths = [path if isinstance(path, tuple) else (path,) for path in axes]
+    scenarios = {}
+    for values in product(*axes.values()):
+        overrides = {}
+        for path, value in zip(paths, values):
+            if len(path) == 1:
+                overrides[path[0]] = value
+            else:
+                overrides.setdefault(path[0], {})[path[1]] = value
+        name = ', '.join(f"{'.'.join(path)}={value}" for path, value in zip(paths, values))
+        scenarios[name] = overrides
+    return scenarios
+
+
+def _pad_brackets(tax_indexes):
+    """시나리오별 세액 구간을 같은 길이로 패딩한 (시작, 세율, 누진공제) 2차원 배열"""
+    width = max(len(index) for index in tax_indexes)
+    starts = np.full((len(tax_indexes), width), _NO_BRACKET, dtype=np.int64)
+    rates = np.zeros((len(tax_indexes), width), dtype=np.int64)
+    deductions = np.zeros((len(tax_indexes), width), dtype=np.int64)
+    for i, index in enumerate(tax_indexes):
+        starts[i, :len(index)] = index.starts
+        rates[i, :len(index)] = index.rates
+        deductions[i, :len(index)] = index.deductions
+    return starts, rates, deductions
+
+
+def evaluate_scenarios(roster, scenarios, calculator=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    시나리오별 명부 전체 합계 계산
+    
+    Args:
+        roster (DataFrame): 기준 직원 명부 (기본급, 연장근무시간, 연장근무단가, 상여금, 부양가족수)
+        scenarios: {이름: 변경 사항} 딕셔너리 또는 변경 사항 리스트 (scenario_grid() 참고)
+        calculator (PayrollCalculator, optional): 기준 요율 계산기 (None이면 현재 기준)
+        chunk_size (int): 한 번에 계산할 직원 수
+    
+    Returns:
+        DataFrame: 시나리오별 SCENARIO_TOTAL_COLUMNS 합계 (첫 행은 '기준')
+    
+    Raises:
+        ValueError: 숫자로 변환할 수 없는 값이나 알 수 없는 보험 종류가 있는 경우
+    """
+    calculator = calculator or PayrollCalculator()
+    if not isinstance(scenarios, dict):
+        scenarios = {f'시나리오{i + 1}': overrides for i, overrides in enumerate(scenarios)}
+    names = ['기준'] + list(scenarios)
+    rule_sets = [calculator.rules] + [derive_rule_set(calculator.rules, overrides)
+                                      for overrides in scenarios.values()]
+    
+    # 시나리오 축 규칙 배열 (시나리오 × 보험 종류)
+    rates = np.stack([rules.rates for rules in rule_sets])
+    limits = np.stack([rules.limits for rules in rule_sets])
+    care = np.array([rules.long_term_care_scaled for rules in rule_sets], dtype=np.int64)[:, np.newaxis]
+    local = np.array([rules.local_tax_scaled for rules in rule_sets], dtype=np.int64)[:, np.newaxis]
+    units = np.array([rules.truncation_unit for rules in rule_sets], dtype=np.int64)
+    brackets = _pad_brackets([rules.tax_index for rules in rule_sets])
+    
+    inputs = batch_inputs(roster)
+    
+    totals = np.zeros((len(rule_sets), len(SCENARIO_TOTAL_COLUMNS)), dtype=np.int64)
+    chunk_size = max(int(chunk_size), 1)
+    for begin in range(0, len(roster), chunk_size):
+        chunk = {col: values[begin:begin + chunk_size] for col, values in inputs.items()}
+        totals += _scenario_chunk(calculator, rule_sets, chunk, rates, limits, care, local, units, brackets)
+    
+    logger.info(f"시나리오 계산 완료: {len(rule_sets)}개 시나리오 × {len(roster)}명")
+    return pd.DataFrame(totals, index=pd.Index(names, name='시나리오'), columns=SCENARIO_TOTAL_COLUMNS)
+
+
+def _scenario_chunk(calculator, rule_sets, inputs, rates, limits, care, local, units, brackets):
+    """직원 묶음 하나에 대한 시나리오별 합계 (시나리오 수 × 합계 컬럼 수)"""
+    payments = payment_arrays(calculator.rules, inputs)
+    total_payment, taxable_payment, dependents = payments.total_payment, payments.taxable_payment, payments.dependents
+    unit = units[:, np.newaxis]
+    
+    # 4대보험 (시나리오 × 보험 종류 × 직원, 10원 미만 절사, 보수월액/부과 여부 반영)
+    insurance_unit = unit[:, :, np.newaxis]
+    bases, charged = insurance_inputs(calculator.rules.insurance_types, inputs, payments.insurable_pay)
+    insurance = (np.minimum(bases[np.newaxis, :, :], limits[:, :, np.newaxis]) *
+                 rates[:, :, np.newaxis]) // RATE_SCALE // insurance_unit * insurance_unit
+    if charged is not None:
+        insurance = insurance * charged[np.newaxis, :, :]
+    insurance = dict(zip(calculator.rules.insurance_types, np.moveaxis(insurance, 1, 0)))
+    long_term_care = insurance['health_insurance'] * care // RATE_SCALE // unit * unit
+    insurance_total = (insurance['national_pension'] + insurance['health_insurance'] +
+                       long_term_care + insurance['employment_insurance'])
+    
+    # 소득세 (간이세액표가 있으면 시나리오와 무관, 없으면 시나리오별 누진세율)
+    if calculator.withholding is not None:
+        income_tax = np.broadcast_to(calculator.withholding.tax_array(taxable_payment, dependents),
+                                     insurance_total.shape)
+    else:
+        starts, tax_rates, tax_deductions = brackets
+        dependent_deduction = np.stack([dependent_deduction_array(rules, dependents) for rules in rule_sets])
+        taxable = np.maximum(taxable_payment[np.newaxis, :] - insurance_total - dependent_deduction, 0)
+        index = (starts[:, :, np.newaxis] <= taxable[:, np.newaxis, :]).sum(axis=1) - 1
+        safe_index = np.maximum(index, 0)
+        income_tax = (taxable * np.take_along_axis(tax_rates, safe_index, axis=1) // RATE_SCALE -
+                      np.take_along_axis(tax_deductions, safe_index, axis=1))
+        income_tax = np.where((taxable <= 0) | (index < 0), 0, np.maximum(income_tax, 0))
+    income_tax = income_tax // unit * unit
+    local_tax = income_tax * local // RATE_SCALE // unit * unit
+    
+    payment = total_payment.sum()
+    total_deduction = (insurance_total + income_tax + local_tax).sum(axis=1)
+    return np.column_stack([
+        np.full(len(rule_sets), payment, dtype=np.int64),
+        insurance['national_pension'].sum(axis=1),
+        insurance['health_insurance'].sum(axis=1),
+        long_term_care.sum(axis=1),
+        insurance['employment_insurance'].sum(axis=1),
+        income_tax.sum(axis=1),
+        local_tax.sum(axis=1),
+        total_deduction,
+        payment - total_deduction,
+    ])
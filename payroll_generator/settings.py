@@ -41,6 +41,7 @@ class SettingsManager:
             'last_period': '2025-01',
             'last_output_format': 'both',
             'last_design_name': 'default',
+            'export_trace': False,
             'is_first_run': True
         }
         
@@ -151,4 +152,13 @@ class SettingsManager:
         """마지막으로 사용한 디자인 이름 저장"""
         self.settings['last_design_name'] = design_name
         self.save_settings()
+    
+    def get_export_trace(self):
+        """급여명세서 옆 계산 내역(JSON) 저장 여부 반환"""
+        return bool(self.settings.get('export_trace', False))
+    
+    def set_export_trace(self, enabled):
+        """급여명세서 옆 계산 내역(JSON) 저장 여부 저장"""
+        self.settings['export_trace'] = bool(enabled)
+        self.save_settings()
 
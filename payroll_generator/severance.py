@@ -0,0 +1,218 @@
+# severance.py
+"""퇴직금 계산 모듈
+
+직원별 월 급여 이력(EmployeeHistoryManager 긴 형식)에서 퇴직일 이전 3개월 임금과
+12개월 상여금을 모아 평균임금과 퇴직금을 계산합니다. 퇴직자 전체를
+(퇴직자 수 × 개월 수) 배열로 한 번에 처리하며 금액은 int64 원 단위로만 계산합니다.
+
+계산 순서:
+    산정기간 = 퇴직일(퇴사일 다음 날) 이전 3개월 (달력 일수)
+    3개월 임금총액 = 산정기간에 걸친 월의 (총지급액 - 상여금) × 산정기간에 속한 재직 일수 / 그 달 재직 일수
+    상여금 가산액 = 퇴직일 이전 12개월 상여금 × 3/12
+    1일 평균임금 = (3개월 임금총액 + 상여금 가산액) / 산정기간 일수
+    1일 통상임금 = 월 통상임금(보수월액 또는 기본급 + 고정 수당) × 8시간 / 209시간
+    퇴직금 = max(1일 평균임금, 1일 통상임금) × 30일 × 근속일수 / 365 (근속 1년 미만은 0)
+
+이력의 월 금액은 그 달 재직 일수분(입사/퇴사 월은 prorate_roster로 일할된 금액)이므로
+퇴사 월은 저장된 금액 그대로, 산정기간이 월 중간에 시작하는 첫 달만 일할합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .calculator import ALLOWANCE_COLUMNS, STANDARD_WAGE_COLUMN, PERIOD_COLUMN
+    from .config import (
+        ALLOWANCE_SCHEMA,
+        DAILY_REGULAR_MINUTES,
+        MONTHLY_STANDARD_HOURS,
+        SEVERANCE_AVERAGE_MONTHS,
+        SEVERANCE_BONUS_MONTHS,
+        SEVERANCE_MIN_SERVICE_DAYS
+    )
+    from .history_manager import EmployeeHistoryManager
+    from .rules import normalize_period
+    from .validation import parse_dates
+    from .logger import setup_logger
+except ImportError:
+    from calculator import ALLOWANCE_COLUMNS, STANDARD_WAGE_COLUMN, PERIOD_COLUMN
+    from config import (
+        ALLOWANCE_SCHEMA,
+        DAILY_REGULAR_MINUTES,
+        MONTHLY_STANDARD_HOURS,
+        SEVERANCE_AVERAGE_MONTHS,
+        SEVERANCE_BONUS_MONTHS,
+        SEVERANCE_MIN_SERVICE_DAYS
+    )
+    from history_manager import EmployeeHistoryManager
+    from rules import normalize_period
+    from validation import parse_dates
+    from logger import setup_logger
+
+logger = setup_logger()
+
+HIRE_DATE_COLUMN = '입사일'
+LEAVE_DATE_COLUMN = '퇴사일'
+
+# 계산 결과 컬럼 (금액은 원 단위 정수)
+SEVERANCE_COLUMNS = ['근속일수', '산정기간일수', '3개월임금총액', '상여금가산액', '1일평균임금', '1일통상임금', '퇴직금']
+
+# 통상임금에 포함하는 고정 수당
+FIXED_ALLOWANCE_COLUMNS = [col for col in ALLOWANCE_COLUMNS if ALLOWANCE_SCHEMA[col].get('fixed')]
+
+# 1970-01 기준 월 번호 -> datetime64[M] 변환 기준
+_EPOCH_MONTH = 1970 * 12
+
+
+def _month_numbers(periods):
+    """급여 기간 -> 월 번호 (연 × 12 + 월 - 1), 고유 기간만 해석"""
+    codes, uniques = pd.factorize(periods.astype(str))
+    numbers = [int(day[:4]) * 12 + int(day[5:7]) - 1 for day in map(normalize_period, uniques)]
+    return np.array(numbers + [-1], dtype=np.int64)[codes]
+
+
+def _month_start(numbers):
+    """월 번호 -> 해당 월 첫날 (datetime64[D])"""
+    return (numbers - _EPOCH_MONTH).astype('datetime64[M]').astype('datetime64[D]')
+
+
+def _amounts(df, column):
+    """금액 컬럼 int64 배열 (없거나 빈 값은 0)"""
+    if column not in df.columns:
+        return np.zeros(len(df), dtype=np.int64)
+    return pd.to_numeric(df[column], errors='raise').fillna(0).to_numpy(dtype=np.float64).astype(np.int64)
+
+
+class SeveranceCalculator:
+    """퇴직금 계산기 (퇴직자 × 월 배열 기반)"""
+    
+    def __init__(self, average_months=SEVERANCE_AVERAGE_MONTHS, bonus_months=SEVERANCE_BONUS_MONTHS,
+                 min_service_days=SEVERANCE_MIN_SERVICE_DAYS):
+        self.average_months = average_months
+        self.bonus_months = bonus_months
+        self.min_service_days = min_service_days
+    
+    def _monthly_table(self, history, key):
+        """이력을 (직원, 월 번호)별 임금/상여금 합계로 집계"""
+        missing = [col for col in [key, PERIOD_COLUMN, '총지급액'] if col not in history.columns]
+        if missing:
+            raise ValueError(f"퇴직금 계산 이력에 필요한 컬럼이 없습니다: {', '.join(missing)}")
+        bonus = _amounts(history, '상여금')
+        table = pd.DataFrame({
+            'key': history[key].astype(str).to_numpy(),
+            'month': _month_numbers(history[PERIOD_COLUMN]),
+            'wage': _amounts(history, '총지급액') - bonus,
+            'bonus': bonus,
+        })
+        return table.groupby(['key', 'month']).sum()
+    
+    def _lookup(self, table, column, keys, months):
+        """(퇴직자 수, 개월 수) 월 번호 배열에 해당하는 이력 금액 (없으면 0)"""
+        index = pd.MultiIndex.from_arrays([np.repeat(keys, months.shape[1]), months.ravel()])
+        values = table[column].reindex(index).fillna(0).to_numpy(dtype=np.int64)
+        return values.reshape(months.shape)
+    
+    def _ordinary_daily_wage(self, leavers):
+        """1일 통상임금 (보수월액이 있으면 보수월액, 없으면 기본급 + 고정 수당 기준)"""
+        monthly = sum(_amounts(leavers, col) for col in ['기본급'] + FIXED_ALLOWANCE_COLUMNS)
+        if STANDARD_WAGE_COLUMN in leavers.columns:
+            standard = _amounts(leavers, STANDARD_WAGE_COLUMN)
+            monthly = np.where(standard > 0, standard, monthly)
+        return monthly * (DAILY_REGULAR_MINUTES // 60) // MONTHLY_STANDARD_HOURS
+    
+    def calculate(self, leavers, history, key='이름'):
+        """
+        퇴직자 일괄 퇴직금 계산
+        
+        Args:
+            leavers (DataFrame): 퇴직자 명부 (key, '입사일', '퇴사일', 선택: '기본급', 고정 수당, '보수월액')
+            history (DataFrame): 직원별 월 급여 이력 (key, '기간', '총지급액', 선택: '상여금')
+            key (str): 직원 식별 컬럼
+        
+        Returns:
+            DataFrame: key 인덱스, SEVERANCE_COLUMNS 컬럼 (날짜가 없거나 잘못된 행은 0)
+        
+        Raises:
+            ValueError: 필수 컬럼이 없거나 금액/기간 형식이 잘못된 경우
+        """
+        missing = [col for col in [key, HIRE_DATE_COLUMN, LEAVE_DATE_COLUMN] if col not in leavers.columns]
+        if missing:
+            raise ValueError(f"퇴직금 계산에 필요한 컬럼이 없습니다: {', '.join(missing)}")
+        
+        hire = parse_dates(leavers[HIRE_DATE_COLUMN]).dt.normalize()
+        leave = parse_dates(leavers[LEAVE_DATE_COLUMN]).dt.normalize()
+        valid = (hire.notna() & leave.notna() & (leave >= hire)).to_numpy()
+        if not valid.all():
+            logger.warning(f"입사일/퇴사일이 없거나 잘못되어 퇴직금을 0으로 처리합니다: {int((~valid).sum())}명")
+        fallback = pd.Timestamp('2000-01-01')
+        hire = hire.where(valid, fallback)
+        leave = leave.where(valid, fallback)
+        
+        # 산정기간: 퇴직일(퇴사일 다음 날) 이전 average_months개월 (같은 날짜가 없는 달은 말일)
+        end = leave + pd.Timedelta(days=1)
+        start = (end - pd.DateOffset(months=self.average_months)).to_numpy(dtype='datetime64[D]')
+        end = end.to_numpy(dtype='datetime64[D]')
+        hire = hire.to_numpy(dtype='datetime64[D]')
+        leave = leave.to_numpy(dtype='datetime64[D]')
+        window_days = (end - start).astype(np.int64)
+        
+        # 근속일수 (입사일 ~ 퇴사일, 양 끝 포함)
+        service_days = (leave - hire).astype(np.int64) + 1
+        
+        # 산정기간에 걸친 월별 임금 (그 달 재직 일수 중 산정기간에 속한 일수만큼 일할)
+        keys = leavers[key].astype(str).to_numpy()
+        table = self._monthly_table(history, key)
+        start_number = start.astype('datetime64[M]').astype(np.int64) + _EPOCH_MONTH
+        months = start_number[:, None] + np.arange(self.average_months + 1)
+        employed_start = np.maximum(_month_start(months), hire[:, None])
+        employed_end = np.minimum(_month_start(months + 1), end[:, None])
+        employed_days = (employed_end - employed_start).astype(np.int64)
+        overlap = (employed_end - np.maximum(employed_start, start[:, None])).astype(np.int64)
+        wages = self._lookup(table, 'wage', keys, months)
+        window_wages = np.where(overlap > 0, wages * np.maximum(overlap, 0) // np.maximum(employed_days, 1),
+                                0).sum(axis=1)
+        
+        # 상여금 가산 (퇴사일이 속한 월까지 bonus_months개월 상여금 × average_months / 12)
+        leave_number = leave.astype('datetime64[M]').astype(np.int64) + _EPOCH_MONTH
+        bonus_months = leave_number[:, None] - np.arange(self.bonus_months)
+        annual_bonus = self._lookup(table, 'bonus', keys, bonus_months).sum(axis=1)
+        bonus_addition = annual_bonus * self.average_months // 12
+        
+        no_history = valid & ~(np.isin(keys, table.index.get_level_values('key')))
+        if no_history.any():
+            logger.warning(f"급여 이력이 없는 퇴직자가 있습니다 (통상임금 기준으로 계산): {int(no_history.sum())}명")
+        
+        average_daily = (window_wages + bonus_addition) // window_days
+        ordinary_daily = self._ordinary_daily_wage(leavers)
+        daily_wage = np.maximum(average_daily, ordinary_daily)
+        eligible = valid & (service_days >= self.min_service_days)
+        severance = np.where(eligible, daily_wage * 30 * service_days // 365, 0)
+        
+        result = pd.DataFrame({
+            '근속일수': np.where(valid, service_days, 0),
+            '산정기간일수': np.where(valid, window_days, 0),
+            '3개월임금총액': np.where(valid, window_wages, 0),
+            '상여금가산액': np.where(valid, bonus_addition, 0),
+            '1일평균임금': np.where(valid, average_daily, 0),
+            '1일통상임금': np.where(valid, ordinary_daily, 0),
+            '퇴직금': severance,
+        }, index=pd.Index(leavers[key].to_numpy(), name=key), columns=SEVERANCE_COLUMNS)
+        logger.info(f"퇴직금 계산 완료: {len(result)}명 (지급 대상 {int(eligible.sum())}명)")
+        return result
+
+
+def calculate_severance(leavers, history=None, key='이름'):
+    """
+    퇴직금 계산 (이력을 주지 않으면 직원별 이력 파일에서 퇴직자 이력만 로드)
+    
+    Args:
+        leavers (DataFrame): 퇴직자 명부 (SeveranceCalculator.calculate() 참고)
+        history (DataFrame, optional): 직원별 월 급여 이력 (None이면 EmployeeHistoryManager)
+        key (str): 직원 식별 컬럼
+    
+    Returns:
+        DataFrame: key 인덱스, SEVERANCE_COLUMNS 컬럼
+    """
+    if history is None:
+        history = EmployeeHistoryManager(key=key).load(employees=leavers[key].tolist())
+    return SeveranceCalculator().calculate(leavers, history, key)
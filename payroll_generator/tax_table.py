@@ -0,0 +1,284 @@
+# tax_table.py
+"""소득세 세액표 인덱스 모듈
+
+INCOME_TAX_TABLE을 한 번만 정렬된 경계 배열로 컴파일해 두고,
+단건 계산은 bisect, 일괄 계산은 np.searchsorted로 구간을 찾습니다.
+세율은 백만분율 정수(RATE_SCALE)로 보관해 단건/배열 모두 정수 연산만 사용합니다.
+
+국세청 간이세액표(WithholdingTable)는 원본 CSV를 int32 배열로 컴파일해
+.npy 캐시로 저장하고, 이후에는 메모리 매핑으로 읽어 O(1)로 조회합니다.
+"""
+
+import csv
+import math
+import os
+from bisect import bisect_right
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from .config import (
+        INCOME_TAX_TABLE,
+        RATE_SCALE,
+        WITHHOLDING_TABLE_CSV,
+        WITHHOLDING_TABLE_CACHE,
+        WITHHOLDING_MAX_DEPENDENTS,
+        WITHHOLDING_EXCESS_TABLE
+    )
+    from .logger import setup_logger
+except ImportError:
+    from config import (
+        INCOME_TAX_TABLE,
+        RATE_SCALE,
+        WITHHOLDING_TABLE_CSV,
+        WITHHOLDING_TABLE_CACHE,
+        WITHHOLDING_MAX_DEPENDENTS,
+        WITHHOLDING_EXCESS_TABLE
+    )
+    from logger import setup_logger
+
+logger = setup_logger()
+
+
+def to_scaled_rate(rate):
+    """요율을 백만분율 정수로 변환 (예: 0.045 -> 45000)"""
+    return int(round(rate * RATE_SCALE))
+
+
+class TaxBracketIndex:
+    """누진세율 구간 인덱스 (O(log n) 구간 탐색)"""
+    
+    __slots__ = ('_starts', '_rates', '_deductions', 'starts', 'rates', 'deductions')
+    
+    def __init__(self, table):
+        """
+        Args:
+            table: (과세표준 시작, 과세표준 끝, 세율, 누진공제) 튜플 리스트
+        
+        Raises:
+            ValueError: 구간이 비어 있거나 연속되지 않는 경우
+        """
+        rows = sorted(table, key=lambda row: row[0])
+        if not rows:
+            raise ValueError("세액표 구간이 비어있습니다.")
+        for prev, cur in zip(rows, rows[1:]):
+            if prev[1] != cur[0]:
+                raise ValueError(f"세액표 구간이 연속되지 않습니다: {prev[1]} != {cur[0]}")
+        
+        # 단건 계산용 (파이썬 정수 리스트, 세율은 백만분율)
+        self._starts = [int(row[0]) for row in rows]
+        self._rates = [to_scaled_rate(row[2]) for row in rows]
+        self._deductions = [int(row[3]) for row in rows]
+        
+        # 일괄 계산용 (int64 배열)
+        self.starts = np.array(self._starts, dtype=np.int64)
+        self.rates = np.array(self._rates, dtype=np.int64)
+        self.deductions = np.array(self._deductions, dtype=np.int64)
+    
+    def __len__(self):
+        return len(self._starts)
+    
+    def bracket(self, taxable_income):
+        """과세표준이 속한 구간 번호 반환 (첫 구간 시작 미만이면 -1)"""
+        return bisect_right(self._starts, taxable_income) - 1
+    
+    def tax(self, taxable_income):
+        """소득세 계산 (단건, 원 미만 절사)"""
+        taxable_income = int(taxable_income)
+        if taxable_income <= 0:
+            return 0
+        i = self.bracket(taxable_income)
+        if i < 0:
+            return 0
+        income_tax = taxable_income * self._rates[i] // RATE_SCALE - self._deductions[i]
+        return max(0, income_tax)  # 음수 방지
+    
+    def tax_array(self, taxable_income):
+        """소득세 계산 (배열, tax()와 같은 정수 연산)"""
+        taxable_income = np.asarray(taxable_income).astype(np.int64)
+        index = np.searchsorted(self.starts, taxable_income, side='right') - 1
+        safe_index = np.maximum(index, 0)
+        income_tax = taxable_income * self.rates[safe_index] // RATE_SCALE - self.deductions[safe_index]
+        income_tax = np.maximum(income_tax, 0)
+        return np.where((taxable_income <= 0) | (index < 0), 0, income_tax)
+
+
+# config.py의 세액표를 임포트 시 한 번만 컴파일
+INCOME_TAX_INDEX = TaxBracketIndex(INCOME_TAX_TABLE)
+
+
+def dependents_to_column(dependents):
+    """부양가족수(본인 제외)를 간이세액표 공제대상가족 수 열(본인 포함, 1~11)로 변환 (빈 값은 본인만)"""
+    if dependents is None or (isinstance(dependents, float) and math.isnan(dependents)):
+        dependents = 0
+    return min(max(int(dependents) + 1, 1), WITHHOLDING_MAX_DEPENDENTS)
+
+
+class WithholdingTable:
+    """국세청 근로소득 간이세액표 (월급여액 구간 × 공제대상가족 수)
+    
+    table은 (구간 수, 2 + 가족 수 열) 형태의 int32 배열이며 각 행은
+    [하한, 상한, 1명 세액, 2명 세액, ...] 입니다. 모든 구간 경계의 최대공약수(unit)
+    단위로 구간 번호 조회 배열을 만들어 두므로 조회는 O(1)입니다.
+    """
+    
+    __slots__ = ('table', 'unit', 'min_salary', 'max_salary', 'band_lookup',
+                 'excess_starts', 'excess_adds', 'excess_rates')
+    
+    def __init__(self, table):
+        """
+        Args:
+            table: int32 배열 (np.load(mmap_mode='r') 결과도 가능)
+        
+        Raises:
+            ValueError: 배열 형태가 잘못되었거나 구간이 연속되지 않는 경우
+        """
+        if table.ndim != 2 or table.shape[0] == 0 or table.shape[1] < 3:
+            raise ValueError(f"간이세액표 배열 형태가 올바르지 않습니다: {table.shape}")
+        
+        lowers = np.asarray(table[:, 0], dtype=np.int64)
+        uppers = np.asarray(table[:, 1], dtype=np.int64)
+        if np.any(uppers <= lowers) or np.any(lowers[1:] != uppers[:-1]):
+            raise ValueError("간이세액표 구간이 정렬되어 있지 않거나 연속되지 않습니다.")
+        
+        self.table = table
+        self.unit = int(np.gcd.reduce(np.concatenate([lowers, uppers])))
+        self.min_salary = int(lowers[0])
+        self.max_salary = int(uppers[-1])
+        
+        # unit 단위 금액 -> 구간 번호 (하한 미만은 -1)
+        units = np.arange(self.max_salary // self.unit, dtype=np.int64) * self.unit
+        self.band_lookup = (np.searchsorted(lowers, units, side='right') - 1).astype(np.int32)
+        
+        # 상한 초과분 산식 (구간 시작, 가산액, 세율(백만분율))
+        self.excess_starts = np.array([row[0] for row in WITHHOLDING_EXCESS_TABLE], dtype=np.int64)
+        self.excess_adds = np.array([row[1] for row in WITHHOLDING_EXCESS_TABLE], dtype=np.int64)
+        self.excess_rates = np.array([to_scaled_rate(row[2]) for row in WITHHOLDING_EXCESS_TABLE], dtype=np.int64)
+    
+    def __len__(self):
+        return self.table.shape[0]
+    
+    @property
+    def max_dependents(self):
+        return self.table.shape[1] - 2
+    
+    def tax(self, monthly_salary, dependents):
+        """소득세 조회 (단건)
+        
+        Args:
+            monthly_salary: 월급여액 (비과세 제외)
+            dependents: 부양가족수 (본인 제외)
+        """
+        column = 1 + min(dependents_to_column(dependents), self.max_dependents)
+        monthly_salary = int(monthly_salary)
+        if monthly_salary < self.min_salary:
+            return 0
+        if monthly_salary >= self.max_salary:
+            return int(self.table[-1, column]) + self._excess_tax(monthly_salary)
+        band = self.band_lookup[monthly_salary // self.unit]
+        return int(self.table[band, column])
+    
+    def tax_array(self, monthly_salary, dependents):
+        """소득세 조회 (배열)"""
+        monthly_salary = np.asarray(monthly_salary).astype(np.int64)
+        dependents = np.nan_to_num(np.asarray(dependents, dtype=np.float64))
+        columns = 1 + np.clip(dependents.astype(np.int64) + 1, 1, min(WITHHOLDING_MAX_DEPENDENTS, self.max_dependents))
+        
+        in_table = (monthly_salary >= self.min_salary) & (monthly_salary < self.max_salary)
+        unit_index = np.where(in_table, monthly_salary // self.unit, 0)
+        band = self.band_lookup[unit_index]
+        income_tax = np.asarray(self.table[band, columns], dtype=np.int64)
+        
+        # 상한 초과분
+        above = monthly_salary >= self.max_salary
+        if np.any(above):
+            top_tax = np.asarray(self.table[-1, columns], dtype=np.int64)
+            income_tax = np.where(above, top_tax + self._excess_tax_array(monthly_salary), income_tax)
+        
+        return np.where(monthly_salary < self.min_salary, 0, income_tax)
+    
+    def _excess_tax(self, monthly_salary):
+        """상한 초과분 세액 (단건)"""
+        i = bisect_right(self.excess_starts.tolist(), monthly_salary) - 1
+        if i < 0:
+            return 0
+        excess = (monthly_salary - int(self.excess_starts[i])) * int(self.excess_rates[i]) // RATE_SCALE
+        return int(self.excess_adds[i]) + excess
+    
+    def _excess_tax_array(self, monthly_salary):
+        """상한 초과분 세액 (배열)"""
+        i = np.searchsorted(self.excess_starts, monthly_salary, side='right') - 1
+        safe_i = np.maximum(i, 0)
+        excess = (monthly_salary - self.excess_starts[safe_i]) * self.excess_rates[safe_i] // RATE_SCALE
+        return np.where(i < 0, 0, self.excess_adds[safe_i] + excess)
+
+
+def _parse_amount(value):
+    """CSV 금액 셀 파싱 ('1,234', '-', '' 지원)"""
+    value = value.strip().replace(',', '')
+    if value in ('', '-'):
+        return 0
+    return int(float(value))
+
+
+def compile_withholding_table(csv_path=WITHHOLDING_TABLE_CSV, cache_path=WITHHOLDING_TABLE_CACHE):
+    """간이세액표 CSV를 int32 배열로 컴파일하고 .npy 캐시로 저장
+    
+    헤더 행(숫자로 시작하지 않는 행)은 건너뜁니다. 캐시 저장에 실패해도
+    (읽기 전용 배포 환경 등) 컴파일된 배열은 반환합니다.
+    
+    Returns:
+        np.ndarray: (구간 수, 2 + 가족 수 열) int32 배열
+    """
+    rows = []
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+        for record in csv.reader(f):
+            if not record or not record[0].strip().replace(',', '').isdigit():
+                continue
+            rows.append([_parse_amount(value) for value in record[:2 + WITHHOLDING_MAX_DEPENDENTS]])
+    
+    if not rows:
+        raise ValueError(f"간이세액표 CSV에 데이터가 없습니다: {csv_path}")
+    width = max(len(row) for row in rows)
+    table = np.zeros((len(rows), width), dtype=np.int32)
+    for i, row in enumerate(rows):
+        table[i, :len(row)] = row
+        if len(row) < width:
+            # 가족 수가 많은 열이 비어 있으면 마지막 값 유지
+            table[i, len(row):] = row[-1]
+    
+    try:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, table)
+        os.replace(tmp_path, cache_path)  # 여러 워커가 동시에 컴파일해도 안전하도록 원자적 교체
+        logger.info(f"간이세액표 캐시 생성: {cache_path} ({len(rows)}개 구간)")
+    except OSError as e:
+        logger.warning(f"간이세액표 캐시 저장 실패 (메모리에서만 사용): {e}")
+    return table
+
+
+@lru_cache(maxsize=None)
+def load_withholding_table(csv_path=WITHHOLDING_TABLE_CSV, cache_path=WITHHOLDING_TABLE_CACHE):
+    """간이세액표 로드 (프로세스당 1회)
+    
+    캐시(.npy)가 CSV보다 최신이면 메모리 매핑으로 바로 읽고,
+    아니면 CSV를 다시 컴파일합니다.
+    
+    Returns:
+        WithholdingTable 또는 None (CSV와 캐시가 모두 없는 경우)
+    """
+    csv_exists = os.path.exists(csv_path)
+    cache_exists = os.path.exists(cache_path)
+    try:
+        if cache_exists and (not csv_exists or os.path.getmtime(cache_path) >= os.path.getmtime(csv_path)):
+            return WithholdingTable(np.load(cache_path, mmap_mode='r'))
+        if csv_exists:
+            return WithholdingTable(compile_withholding_table(csv_path, cache_path))
+    except Exception as e:
+        logger.error(f"간이세액표 로드 실패, 누진세율 근사치 사용: {e}")
+        return None
+    logger.info("간이세액표 CSV가 없어 누진세율 근사치를 사용합니다.")
+    return None
+
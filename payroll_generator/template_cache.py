@@ -0,0 +1,96 @@
+# template_cache.py
+"""급여명세서 템플릿 원형(prototype) 캐시
+
+템플릿 엑셀을 직원마다 openpyxl.load_workbook으로 다시 읽으면 스타일 XML 파싱이
+엑셀 일괄 생성 시간의 대부분을 차지합니다. 템플릿마다 프로세스당 한 번만 읽어 두고,
+직원별 명세서는 같은 워크북에 값을 채워 저장한 뒤 셀 값을 원래대로 되돌려 재사용합니다.
+
+워크북 복사(copy.deepcopy)는 스타일 목록이 복사되지 않아 저장이 실패하므로 사용하지
+않습니다. 템플릿 채우기 코드는 셀 값과 페이지 설정(항상 같은 값)만 바꾸므로 셀 값과
+스타일을 복원하면 다음 직원은 새로 읽은 템플릿과 같은 상태에서 시작합니다.
+템플릿 파일이 바뀌면(수정 시각/크기) 다시 읽습니다.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from copy import copy
+
+import openpyxl
+from openpyxl.cell.cell import MergedCell
+
+try:
+    from .logger import setup_logger
+except ImportError:
+    from logger import setup_logger
+
+logger = setup_logger()
+
+_prototypes = {}
+_prototypes_lock = threading.Lock()
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class TemplatePrototype:
+    """한 번 읽은 템플릿 워크북 (채우기/저장 후 셀 값 복원)"""
+    
+    def __init__(self, path):
+        self.path = path
+        self.signature = _file_signature(path)
+        self.workbook = openpyxl.load_workbook(path)
+        self._snapshot = [(ws, self._cell_state(ws)) for ws in self.workbook.worksheets]
+        self._lock = threading.Lock()
+        logger.info(f"템플릿 원형 로드: {path}")
+    
+    @staticmethod
+    def _cell_state(ws):
+        """셀 좌표 -> (값, 데이터 형식, 스타일) (병합 영역의 셀은 값이 없으므로 None)"""
+        return {key: None if isinstance(cell, MergedCell) else (cell._value, cell.data_type, copy(cell._style))
+                for key, cell in ws._cells.items()}
+    
+    def _restore(self):
+        """템플릿을 읽은 직후의 셀 값/스타일로 복원 (새로 만든 셀은 삭제)"""
+        for ws, state in self._snapshot:
+            cells = ws._cells
+            for key in [key for key in cells if key not in state]:
+                del cells[key]
+            for key, saved in state.items():
+                if saved is not None:
+                    cell = cells[key]
+                    cell._value, cell.data_type, style = saved
+                    cell._style = copy(style)
+    
+    @contextmanager
+    def checkout(self):
+        """
+        직원 1명분 워크북 사용 (with 블록 안에서 값을 채우고 저장)
+        
+        블록이 끝나면(예외 포함) 셀 값을 복원하며, 스레드마다 순서대로 사용합니다.
+        """
+        with self._lock:
+            try:
+                yield self.workbook
+            finally:
+                self._restore()
+
+
+def get_template_prototype(path):
+    """템플릿 경로의 원형 반환 (프로세스당 한 번 로드, 파일이 바뀌면 다시 로드)"""
+    key = os.path.normcase(os.path.abspath(path))
+    signature = _file_signature(key)
+    with _prototypes_lock:
+        prototype = _prototypes.get(key)
+        if prototype is None or prototype.signature != signature:
+            prototype = TemplatePrototype(key)
+            _prototypes[key] = prototype
+    return prototype
+
+
+def clear_template_prototypes():
+    """캐시된 템플릿 원형 모두 삭제"""
+    with _prototypes_lock:
+        _prototypes.clear()
@@ -0,0 +1,504 @@
+# template_stamp.py
+"""급여명세서 템플릿 XML 직접 채우기(스탬핑) 엔진
+
+고정 양식 템플릿(template_sample1/2.xlsx)은 직원마다 셀 매핑에 있는 20여 개 셀만
+바뀝니다. 템플릿마다 한 번만 openpyxl로 읽어 페이지 설정을 적용해 저장한 결과를
+기준 파일로 삼고, 시트 XML을 채울 셀 위치에서 미리 잘라 둡니다. 직원별 명세서는
+채울 셀의 <c> 요소만 바꿔 끼운 시트 XML과, 미리 압축해 둔 나머지 파일을 그대로
+이어 붙여 zip으로 씁니다 (openpyxl 읽기/저장 없음).
+
+채울 셀과 값은 템플릿 디자인의 채우기 코드를 기록용 시트(_RecordingSheet)에 실행해
+얻으므로 openpyxl로 만든 명세서와 셀 값/서식이 같습니다. 미리 잘라 두지 않은 셀을
+쓰거나, 날짜/수식처럼 직접 쓸 수 없는 값이 있으면 render가 False를 반환하고
+호출하는 쪽에서 openpyxl로 생성합니다.
+"""
+
+import os
+import re
+import struct
+import threading
+import zlib
+from collections import namedtuple
+from datetime import date, time, timedelta
+from io import BytesIO
+from types import SimpleNamespace
+from xml.sax.saxutils import escape, quoteattr, unescape
+import zipfile
+
+import openpyxl
+from openpyxl.cell.cell import Cell, MergedCell
+from openpyxl.cell.rich_text import CellRichText
+from openpyxl.compat import safe_string
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string, get_column_letter
+from openpyxl.xml.functions import Element, SubElement, tostring, whitespace
+
+try:
+    from .template_cache import _file_signature
+    from .logger import setup_logger
+except ImportError:
+    from template_cache import _file_signature
+    from logger import setup_logger
+
+logger = setup_logger()
+
+# 시트 XML의 셀 요소 (openpyxl이 저장한 형식: <c r="B4" s="19" t="n" /> 또는 <c ...>...</c>)
+_CELL_PATTERN = re.compile(rb'<c r="([A-Z]+[0-9]+)"([^>]*?)\s*(?:/>|>.*?</c>)', re.S)
+_STYLE_PATTERN = re.compile(rb'\ss="([0-9]+)"')
+
+# 값/서식이 없는 셀의 위치를 확보하기 위한 값
+_PLACEHOLDER = '{STAMP}'
+
+# 워크북 수준 파일 (통합 워크북에서 시트 수만큼 다시 씀)
+_WORKBOOK_PART = 'xl/workbook.xml'
+_WORKBOOK_RELS_PART = 'xl/_rels/workbook.xml.rels'
+_CONTENT_TYPES_PART = '[Content_Types].xml'
+_WORKSHEET_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet'
+_WORKSHEET_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml'
+_DEFINED_NAME_PATTERN = re.compile(rb'<definedName ([^>]*?)\s*localSheetId="0"([^>]*)>(.*?)</definedName>', re.S)
+
+# 엑셀 시트 이름 규칙
+MAX_SHEET_TITLE_LENGTH = 31
+_INVALID_TITLE_CHARS = re.compile(r'[\\/?*:\[\]]')
+
+# 미리 압축한 zip 항목
+_ZipPart = namedtuple('_ZipPart', ['name', 'crc', 'size', 'data'])
+
+_stamps = {}
+_stamps_lock = threading.Lock()
+
+
+class ProbeData(dict):
+    """어떤 키를 조회해도 값이 있는 데이터 (채우기 코드가 쓰는 셀 위치 확인용)"""
+    
+    def get(self, key, default=None):
+        return 1
+
+
+class _Unstampable(Exception):
+    """XML 직접 채우기로 만들 수 없는 명세서 (openpyxl로 생성)"""
+
+
+def _compress(name, data):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    return _ZipPart(name.encode('utf-8'), zlib.crc32(data), len(data),
+                    compressor.compress(data) + compressor.flush())
+
+
+class _ZipWriter:
+    """미리 압축한 항목을 차례로 쓰는 zip 파일 (항목은 모두 4GB 미만, 65535개 이하)"""
+    
+    def __init__(self, f, date_time):
+        year, month, day, hour, minute, second = date_time
+        self._f = f
+        self._time = hour << 11 | minute << 5 | second // 2
+        self._date = (year - 1980) << 9 | month << 5 | day
+        self._central = []
+        self._offset = 0
+    
+    def write(self, part):
+        fields = (20, 0, zipfile.ZIP_DEFLATED, self._time, self._date,
+                  part.crc, len(part.data), part.size, len(part.name))
+        header = struct.pack('<IHHHHHIIIHH', 0x04034b50, *fields, 0)
+        self._f.write(header)
+        self._f.write(part.name)
+        self._f.write(part.data)
+        self._central.append(struct.pack('<IH', 0x02014b50, 20)
+                             + struct.pack('<HHHHHIIIHHHHHII', *fields, 0, 0, 0, 0, 0, self._offset) + part.name)
+        self._offset += len(header) + len(part.name) + len(part.data)
+    
+    def close(self):
+        """중앙 디렉터리 쓰기"""
+        directory = b''.join(self._central)
+        self._f.write(directory)
+        self._f.write(struct.pack('<IHHHHIIH', 0x06054b50, 0, 0, len(self._central), len(self._central),
+                                  len(directory), self._offset, 0))
+
+
+def _cell_xml(coordinate, style, value):
+    """값을 openpyxl 저장 형식과 같은 <c> 요소로 변환 (문자열은 인라인 문자열)"""
+    if isinstance(value, (date, time, timedelta)):
+        raise _Unstampable(f"{coordinate}: 날짜/시간 값")
+    # openpyxl과 같은 규칙으로 값 형식 판별 (수식, 허용되지 않는 문자 등)
+    cell = Cell(None, value=value)
+    data_type, value = cell.data_type, cell._value
+    if data_type not in ('n', 's', 'b') or isinstance(value, CellRichText):
+        raise _Unstampable(f"{coordinate}: 형식 {data_type}")
+    
+    if value is None and style is None:
+        # openpyxl도 값/서식이 없는 셀은 저장하지 않음
+        return b''
+    
+    attrib = {'r': coordinate}
+    if style:
+        attrib['s'] = style
+    attrib['t'] = 'inlineStr' if data_type == 's' else data_type
+    element = Element('c', attrib)
+    if value is not None and value != '':
+        if data_type == 's':
+            text = SubElement(SubElement(element, 'is'), 't')
+            text.text = value
+            whitespace(text)
+        else:
+            SubElement(element, 'v').text = safe_string(value)
+    return tostring(element, encoding='unicode').encode('utf-8')
+
+
+class _StampCell:
+    """기록용 시트의 셀 (값을 읽으면 채운 값 또는 템플릿 값)"""
+    
+    __slots__ = ('_sheet', 'coordinate')
+    
+    def __init__(self, sheet, coordinate):
+        self._sheet = sheet
+        self.coordinate = coordinate
+    
+    @property
+    def value(self):
+        return self._sheet._read(self.coordinate)
+    
+    @value.setter
+    def value(self, value):
+        self._sheet._write(self.coordinate, value)
+
+
+class _RecordingSheet:
+    """템플릿 채우기 코드가 접근/기록한 셀을 모으는 워크시트 대용 객체
+    
+    cell(), ws['B4'], ws['B4'] = 값, merged_cells.ranges만 지원하며 그 밖의 접근은
+    unsupported로 표시합니다 (openpyxl로 생성).
+    """
+    
+    def __init__(self, stamp):
+        self._stamp = stamp
+        self.values = {}
+        self.touched = set()
+        self.unsupported = False
+    
+    @property
+    def merged_cells(self):
+        return self._stamp.merged_cells
+    
+    def cell(self, row, column=None, value=None):
+        if column is None or row < 1 or column < 1:
+            self.unsupported = True
+            raise ValueError("Row or column values must be at least 1")
+        coordinate = f"{get_column_letter(column)}{row}"
+        self.touched.add(coordinate)
+        cell = _StampCell(self, coordinate)
+        if value is not None:
+            cell.value = value
+        return cell
+    
+    def __getitem__(self, key):
+        try:
+            column_letter, row = coordinate_from_string(key)
+        except Exception:
+            self.unsupported = True
+            raise
+        return self.cell(row, column_index_from_string(column_letter))
+    
+    def __setitem__(self, key, value):
+        self[key].value = value
+    
+    def __getattr__(self, name):
+        self.unsupported = True
+        raise AttributeError(f"기록용 시트에서 지원하지 않는 속성: {name}")
+    
+    def _read(self, coordinate):
+        if coordinate in self.values:
+            return self.values[coordinate]
+        return self._stamp.values.get(coordinate)
+    
+    def _write(self, coordinate, value):
+        if coordinate in self._stamp.merged_interior:
+            # openpyxl과 같이 병합 영역의 나머지 셀은 쓸 수 없음
+            raise AttributeError("'MergedCell' object attribute 'value' is read-only")
+        self.values[coordinate] = value
+
+
+class TemplateStamp:
+    """XML 직접 채우기용으로 미리 준비한 템플릿"""
+    
+    def __init__(self, path, probe, configure):
+        """
+        Args:
+            path (str): 템플릿 엑셀 경로
+            probe (callable): 워크시트를 받아 모든 항목을 채우는 함수 (채울 셀 위치 확인용)
+            configure (callable): 워크시트 페이지 설정 함수 (기준 파일에 한 번만 적용)
+        """
+        self.path = path
+        self.signature = _file_signature(path)
+        
+        wb = openpyxl.load_workbook(path)
+        ws = wb.active
+        self.merged_cells = SimpleNamespace(ranges=tuple(ws.merged_cells.ranges))
+        self.merged_interior = frozenset(cell.coordinate for cell in ws._cells.values() if isinstance(cell, MergedCell))
+        self.values = {cell.coordinate: cell.value for cell in ws._cells.values() if not isinstance(cell, MergedCell)}
+        
+        # 채울 셀 위치 확인
+        recorder = _RecordingSheet(self)
+        probe(recorder)
+        if recorder.unsupported:
+            raise _Unstampable("채우기 코드가 지원하지 않는 워크시트 기능을 사용합니다")
+        # 값/서식이 없는 셀은 openpyxl이 저장하지 않으므로 자리 표시 값을 넣어 위치를 확보
+        # (채우지 않으면 해당 셀은 빈 문자열로 바꿔 저장하지 않음)
+        placeholders = set()
+        for coordinate in recorder.touched:
+            cell = ws[coordinate]
+            if cell.value is None and not cell.has_style:
+                cell.value = _PLACEHOLDER
+                placeholders.add(coordinate)
+        configure(ws)
+        
+        buffer = BytesIO()
+        wb.save(buffer)
+        self.title = ws.title
+        self._sheet_name = ws.path.lstrip('/')
+        with zipfile.ZipFile(buffer) as archive:
+            infos = archive.infolist()
+            self._date_time = infos[0].date_time
+            self._parts = [None if info.filename == self._sheet_name else _compress(info.filename, archive.read(info))
+                           for info in infos]
+            sheet_xml = archive.read(self._sheet_name)
+            # 통합 워크북용 (시트 1개, 시트에 딸린 그림/메모 없음)
+            self.single_sheet = len(wb.sheetnames) == 1 and not any(
+                info.filename.startswith('xl/worksheets/_rels/') for info in infos)
+            self._rels_xml = archive.read(_WORKBOOK_RELS_PART)
+            self._content_types_xml = archive.read(_CONTENT_TYPES_PART)
+            workbook_xml = archive.read(_WORKBOOK_PART)
+        
+        # 시트 범위 이름(인쇄 영역 등)은 통합 워크북에서 시트마다 다시 씀
+        self._sheet_names = []
+        for match in _DEFINED_NAME_PATTERN.finditer(workbook_xml):
+            reference = unescape(match.group(3).decode('utf-8'))
+            if '!' in reference:
+                attributes = (match.group(1) + match.group(2)).decode('utf-8').strip()
+                self._sheet_names.append((attributes, reference))
+        workbook_xml = _DEFINED_NAME_PATTERN.sub(b'', workbook_xml)
+        self._workbook_xml = workbook_xml.replace(b'<definedNames></definedNames>', b'')
+        
+        # 시트 XML을 채울 셀 위치에서 잘라 둠
+        self._chunks = []
+        self._slots = []
+        start = 0
+        for match in _CELL_PATTERN.finditer(sheet_xml):
+            coordinate = match.group(1).decode('ascii')
+            if coordinate in recorder.touched:
+                style = _STYLE_PATTERN.search(match.group(2))
+                self._chunks.append(sheet_xml[start:match.start()])
+                original = b'' if coordinate in placeholders else match.group(0)
+                self._slots.append((coordinate, style.group(1).decode('ascii') if style else None, original))
+                start = match.end()
+        self._chunks.append(sheet_xml[start:])
+        # 통합 워크북의 두 번째 시트부터는 선택하지 않은 시트 (여러 시트가 함께 선택되면 그룹 편집 상태)
+        self._unselected_head = self._chunks[0].replace(b' tabSelected="1"', b'')
+        self._slot_coordinates = frozenset(coordinate for coordinate, _, _ in self._slots)
+        if self._slot_coordinates != recorder.touched:
+            raise _Unstampable(f"시트 XML에서 찾지 못한 셀: {sorted(recorder.touched - self._slot_coordinates)}")
+        logger.info(f"템플릿 스탬핑 준비: {path} (셀 {len(self._slots)}개)")
+    
+    def _stamp_sheet(self, fill, selected=True):
+        """채운 시트 XML (XML 직접 채우기로 만들 수 없으면 None)"""
+        recorder = _RecordingSheet(self)
+        try:
+            fill(recorder)
+        except Exception:
+            # 기록용 시트가 지원하지 않는 기능 때문에 생긴 오류는 openpyxl 경로에서 다시 시도
+            if recorder.unsupported:
+                return None
+            raise
+        if recorder.unsupported or not recorder.touched <= self._slot_coordinates:
+            return None
+        
+        try:
+            cells = {coordinate: _cell_xml(coordinate, style, recorder.values[coordinate])
+                     for coordinate, style, _ in self._slots if coordinate in recorder.values}
+        except Exception as e:
+            # 날짜/수식 값, openpyxl 값 검사 오류(허용되지 않는 문자 등)는 openpyxl 경로에서 처리
+            logger.debug(f"XML 직접 채우기 불가, openpyxl로 생성: {e}")
+            return None
+        
+        pieces = [self._chunks[0] if selected else self._unselected_head]
+        for (coordinate, _, original), chunk in zip(self._slots, self._chunks[1:]):
+            pieces.append(cells.get(coordinate, original))
+            pieces.append(chunk)
+        return b''.join(pieces)
+    
+    def render(self, fill, output_path):
+        """
+        직원 1명분 명세서 저장
+        
+        Args:
+            fill (callable): 워크시트를 받아 직원 데이터를 채우는 함수
+            output_path (str): 저장 경로
+        
+        Returns:
+            bool: 저장했으면 True, XML 직접 채우기로 만들 수 없으면 False (파일을 쓰지 않음)
+        """
+        sheet_xml = self._stamp_sheet(fill)
+        if sheet_xml is None:
+            return False
+        
+        sheet_part = _compress(self._sheet_name, sheet_xml)
+        with open(output_path, 'wb') as f:
+            writer = _ZipWriter(f, self._date_time)
+            for part in self._parts:
+                writer.write(sheet_part if part is None else part)
+            writer.close()
+        return True
+    
+    def _workbook_parts(self, titles):
+        """시트 여러 개인 워크북의 workbook.xml / 관계 / 콘텐츠 형식 (기준 파일의 시트 1개를 titles 수만큼)"""
+        sheet_target = f'/{self._sheet_name}'.encode('ascii')
+        sheets = []
+        defined_names = []
+        relationships = []
+        overrides = []
+        for index, title in enumerate(titles, 1):
+            sheets.append(f'<sheet name={quoteattr(title)} sheetId="{index}" state="visible" r:id="rIdSheet{index}" />')
+            relationships.append(f'<Relationship Type="{_WORKSHEET_REL}" Target="/xl/worksheets/sheet{index}.xml" '
+                                 f'Id="rIdSheet{index}" />')
+            overrides.append(f'<Override PartName="/xl/worksheets/sheet{index}.xml" ContentType="{_WORKSHEET_TYPE}" />')
+            # 시트 범위 이름(인쇄 영역 등)은 시트마다 복사
+            quoted_title = "'" + title.replace("'", "''") + "'"
+            for attributes, reference in self._sheet_names:
+                reference = escape(quoted_title + reference[reference.rindex('!'):])
+                defined_names.append(f'<definedName {attributes} localSheetId="{index - 1}">{reference}</definedName>')
+        
+        workbook = self._workbook_xml
+        workbook = re.sub(rb'<sheets>.*?</sheets>', lambda _: f'<sheets>{"".join(sheets)}</sheets>'.encode('utf-8'),
+                          workbook, flags=re.S)
+        if defined_names:
+            defined_names = ''.join(defined_names).encode('utf-8')
+            if b'</definedNames>' in workbook:
+                workbook = workbook.replace(b'</definedNames>', defined_names + b'</definedNames>')
+            else:
+                workbook = workbook.replace(b'</sheets>', b'</sheets><definedNames>' + defined_names + b'</definedNames>')
+        
+        rels = re.sub(rb'<Relationship [^>]*Target="' + re.escape(sheet_target) + rb'"[^>]*/>', b'', self._rels_xml)
+        rels = rels.replace(b'</Relationships>', ''.join(relationships).encode('utf-8') + b'</Relationships>')
+        content_types = re.sub(rb'<Override PartName="' + re.escape(sheet_target) + rb'"[^>]*/>', b'',
+                               self._content_types_xml)
+        content_types = content_types.replace(b'</Types>', ''.join(overrides).encode('utf-8') + b'</Types>')
+        return {
+            _WORKBOOK_PART: _compress(_WORKBOOK_PART, workbook),
+            _WORKBOOK_RELS_PART: _compress(_WORKBOOK_RELS_PART, rels),
+            _CONTENT_TYPES_PART: _compress(_CONTENT_TYPES_PART, content_types),
+        }
+
+
+class StampedWorkbook:
+    """
+    직원별 명세서를 시트로 담는 통합 워크북
+    
+    시트를 추가할 때마다 채운 시트 XML을 바로 zip에 쓰고(메모리에는 시트 이름만 보관),
+    close에서 워크북/관계/콘텐츠 형식 파일과 나머지 파일을 씁니다. with 블록에서 예외가
+    나면 쓰던 파일을 삭제합니다.
+    """
+    
+    def __init__(self, stamp, output_path):
+        """
+        Args:
+            stamp (TemplateStamp): 시트 1개짜리 템플릿으로 준비한 스탬핑 템플릿
+            output_path (str): 저장 경로
+        """
+        if not stamp.single_sheet:
+            raise ValueError(f"시트가 여러 개이거나 시트에 그림/메모가 있는 템플릿은 통합 엑셀을 만들 수 없습니다: {stamp.path}")
+        self._stamp = stamp
+        self.path = output_path
+        self.titles = []
+        self._used_titles = set()
+        self._file = open(output_path, 'wb')
+        self._writer = _ZipWriter(self._file, stamp._date_time)
+    
+    def _unique_title(self, title):
+        """엑셀 시트 이름 규칙에 맞춘 중복 없는 이름 (31자 이하, \\ / ? * : [ ] 제외)"""
+        title = _INVALID_TITLE_CHARS.sub('_', '' if title is None else str(title)).strip().strip("'")
+        title = title[:MAX_SHEET_TITLE_LENGTH] or f"직원{len(self.titles) + 1}"
+        candidate, number = title, 2
+        while candidate.casefold() in self._used_titles:
+            suffix = f" ({number})"
+            candidate = title[:MAX_SHEET_TITLE_LENGTH - len(suffix)] + suffix
+            number += 1
+        self._used_titles.add(candidate.casefold())
+        return candidate
+    
+    def add_sheet(self, fill, title):
+        """
+        시트 1개 추가
+        
+        Args:
+            fill (callable): 워크시트를 받아 직원 데이터를 채우는 함수
+            title (str): 시트 이름 (엑셀 규칙에 맞게 고치고 중복이면 번호를 붙임)
+        
+        Returns:
+            bool: 추가했으면 True, XML 직접 채우기로 만들 수 없으면 False
+        """
+        sheet_xml = self._stamp._stamp_sheet(fill, selected=not self.titles)
+        if sheet_xml is None:
+            return False
+        self._writer.write(_compress(f'xl/worksheets/sheet{len(self.titles) + 1}.xml', sheet_xml))
+        self.titles.append(self._unique_title(title))
+        return True
+    
+    def close(self):
+        """워크북 마무리 (시트가 없으면 빈 템플릿 시트 1개)"""
+        if not self.titles:
+            self.add_sheet(lambda ws: None, self._stamp.title)
+        workbook_parts = self._stamp._workbook_parts(self.titles)
+        for part in self._stamp._parts:
+            if part is not None:
+                self._writer.write(workbook_parts.get(part.name.decode('utf-8'), part))
+        self._writer.close()
+        self._file.close()
+    
+    def abort(self):
+        """쓰던 파일 삭제"""
+        self._file.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def get_template_stamp(path, key, probe, configure):
+    """
+    템플릿 경로/채우기 방식별 스탬핑 템플릿 반환 (프로세스당 한 번 준비, 파일이 바뀌면 다시 준비)
+    
+    Args:
+        path (str): 템플릿 엑셀 경로
+        key (str): 채우기 방식 구분 문자열 (셀 매핑 등)
+        probe (callable): TemplateStamp 참고
+        configure (callable): TemplateStamp 참고
+    
+    Returns:
+        TemplateStamp | None: 준비할 수 없는 템플릿이면 None (openpyxl로 생성)
+    """
+    path = os.path.normcase(os.path.abspath(path))
+    signature = _file_signature(path)
+    with _stamps_lock:
+        entry = _stamps.get((path, key))
+        if entry is None or entry[0] != signature:
+            try:
+                stamp = TemplateStamp(path, probe, configure)
+            except Exception as e:
+                logger.warning(f"템플릿 스탬핑을 사용할 수 없어 openpyxl로 생성합니다: {path} ({e})")
+                stamp = None
+            entry = (signature, stamp)
+            _stamps[(path, key)] = entry
+    return entry[1]
+
+
+def clear_template_stamps():
+    """준비한 스탬핑 템플릿 모두 삭제"""
+    with _stamps_lock:
+        _stamps.clear()
@@ -65,7 +65,18 @@ class TemplateDesign(BaseDesign):
         logger.warning(f"셀 매핑 파일을 찾을 수 없습니다: {self.mapping_filename}. 기본 매핑 사용")
         return {}
     
+    # 템플릿 파일명 -> 찾은 경로 (프로세스당 한 번 검색)
+    _template_paths = {}
+    
     def _get_template_path(self):
+        """템플릿 파일 경로 (한 번 찾은 경로는 파일이 있는 동안 검색 없이 재사용)"""
+        path = TemplateDesign._template_paths.get(self.template_filename)
+        if path is None or not os.path.isfile(path):
+            path = self._find_template_path()
+            TemplateDesign._template_paths[self.template_filename] = path
+        return path
+    
+    def _find_template_path(self):
         """템플릿 파일 경로 찾기
         
         경로 우선순위:
@@ -158,28 +169,41 @@ class TemplateDesign(BaseDesign):
             )
         
         try:
-            template_path = self._get_template_path()
-            wb = openpyxl.load_workbook(template_path)
-            ws = wb.active
-            
-            # 셀 매핑에 따라 데이터 채우기
-            self._fill_template_data(ws, payroll_data, employee_data, period)
-            
-            # 페이지 설정: 한 페이지에 맞추기
-            self._configure_page_settings(ws)
-            
-            # 파일 저장
+            from payroll_generator.template_cache import get_template_prototype
+        except ImportError:
+            from template_cache import get_template_prototype
+        
+        try:
+            from ..utils import normalize_path
+        except ImportError:
             try:
-                from ..utils import normalize_path
+                from payroll_generator.utils import normalize_path
             except ImportError:
-                try:
-                    from payroll_generator.utils import normalize_path
-                except ImportError:
-                    normalize_path = lambda x: x
-            
+                normalize_path = lambda x: x
+        
+        try:
+            template_path = self._get_template_path()
             normalized_path = normalize_path(output_path)
-            wb.save(normalized_path)
-            wb.close()
+            
+            # 셀 XML 직접 채우기 (채울 셀만 바꿔 zip으로 저장, openpyxl 읽기/저장 없음)
+            stamp = self.get_template_stamp()
+            if stamp is not None and stamp.render(
+                    lambda ws: self._fill_template_data(ws, payroll_data, employee_data, period), normalized_path):
+                logger.info(f"템플릿 기반 엑셀 생성 완료: {normalized_path}")
+                return
+            
+            # 템플릿 원형 사용 (프로세스당 한 번 로드, 저장 후 원래 값으로 복원)
+            with get_template_prototype(template_path).checkout() as wb:
+                ws = wb.active
+                
+                # 셀 매핑에 따라 데이터 채우기
+                self._fill_template_data(ws, payroll_data, employee_data, period)
+                
+                # 페이지 설정: 한 페이지에 맞추기
+                self._configure_page_settings(ws)
+                
+                # 파일 저장
+                wb.save(normalized_path)
             
             logger.info(f"템플릿 기반 엑셀 생성 완료: {normalized_path}")
         except FileNotFoundError as e:
@@ -189,6 +213,27 @@ class TemplateDesign(BaseDesign):
             logger.error(f"엑셀 생성 실패: {e}", exc_info=True)
             raise
     
+    def get_template_stamp(self):
+        """XML 직접 채우기용 템플릿 (템플릿마다 한 번 준비, 준비할 수 없으면 None)"""
+        try:
+            from payroll_generator.template_stamp import get_template_stamp
+        except ImportError:
+            from template_stamp import get_template_stamp
+        return get_template_stamp(self._get_template_path(), self._stamp_key(),
+                                  self._probe_template_data, self._configure_page_settings)
+    
+    def _stamp_key(self):
+        """스탬핑 템플릿 구분 문자열 (디자인 클래스 + 셀 매핑)"""
+        return f"{type(self).__qualname__}:{json.dumps(self.cell_mapping, sort_keys=True)}"
+    
+    def _probe_template_data(self, ws):
+        """모든 항목에 값이 있는 데이터로 채우기 (스탬핑할 셀 위치 확인용)"""
+        try:
+            from payroll_generator.template_stamp import ProbeData
+        except ImportError:
+            from template_stamp import ProbeData
+        self._fill_template_data(ws, ProbeData(), ProbeData(), '2000-01')
+    
     def _safe_set_cell_value(self, ws, cell_addr, value):
         """셀에 안전하게 값 설정 (병합된 셀 처리)"""
         try:
@@ -0,0 +1,280 @@
+# timesheet.py
+"""근태 기록 집계 모듈
+
+일별 출퇴근 기록 CSV(월 수백만 행)를 묶음 단위로 읽어 직원별 연장/야간/휴일
+근로시간으로 분류하고, 가산 배율을 반영한 환산 시간을 급여 계산 입력
+(연장근무시간)으로 만듭니다. 전체 기록을 DataFrame으로 올리지 않고
+(직원 수 × 해당 월 일수) 정수 행렬에 분 단위로 누적하므로 메모리 사용량은
+기록 행 수와 관계없이 직원 수에 비례합니다.
+
+분류 규칙:
+    - 근무일(출근일) 기준으로 1일 8시간 초과분은 연장근로, 휴일(주휴일/지정 휴일)
+      근로는 8시간 이내/초과로 나눔
+    - 1일 8시간 이내 근로의 주(월요일 시작, 해당 월 안의 날짜) 합계 40시간 초과분도 연장근로
+    - 22시 ~ 다음 날 6시 근로는 야간근로로 별도 가산 (연장/휴일과 중복 가산)
+    - 퇴근 시각이 출근 시각보다 이르거나 같으면 다음 날 퇴근으로 처리
+    - 휴게시간(분)은 총 근로시간에서 빼고, 야간근로시간은 총 근로시간을 넘지 않음
+"""
+
+import codecs
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .config import (
+        DAILY_REGULAR_MINUTES,
+        WEEKLY_REGULAR_MINUTES,
+        NIGHT_START_MINUTES,
+        NIGHT_END_MINUTES,
+        WEEKLY_HOLIDAY,
+        TIMESHEET_CHUNK_SIZE,
+        OVERTIME_MULTIPLIERS
+    )
+    from .rules import normalize_period
+    from .logger import setup_logger
+except ImportError:
+    from config import (
+        DAILY_REGULAR_MINUTES,
+        WEEKLY_REGULAR_MINUTES,
+        NIGHT_START_MINUTES,
+        NIGHT_END_MINUTES,
+        WEEKLY_HOLIDAY,
+        TIMESHEET_CHUNK_SIZE,
+        OVERTIME_MULTIPLIERS
+    )
+    from rules import normalize_period
+    from logger import setup_logger
+
+logger = setup_logger()
+
+MINUTES_PER_DAY = 24 * 60
+
+# 집계 결과 컬럼 (시간 단위, 소수점 셋째 자리)
+TIMESHEET_COLUMNS = ['출근일수', '총근로시간', '연장시간', '야간시간', '휴일시간', '휴일연장시간', '연장근무시간']
+
+# 근무일 자정 기준 야간근로 구간 (전날 밤 ~ 당일 새벽, 당일 밤 ~ 다음 날 새벽, 다음 날 밤 ~)
+_NIGHT_WINDOWS = [
+    (offset + NIGHT_START_MINUTES, offset + MINUTES_PER_DAY + NIGHT_END_MINUTES)
+    for offset in (-MINUTES_PER_DAY, 0, MINUTES_PER_DAY)
+]
+
+
+def _clock_minutes(values):
+    """출퇴근 시각('HH:MM', 'HH:MM:SS', 'YYYY-MM-DD HH:MM' 등)을 자정 기준 분으로 변환 (해석 불가는 NaN)
+    
+    같은 시각 문자열이 반복되므로 고유 값만 해석합니다.
+    """
+    codes, uniques = pd.factorize(values.astype(str))
+    parts = pd.Series(uniques).str.extract(r'(\d{1,2}):(\d{2})')
+    minutes = (pd.to_numeric(parts[0], errors='coerce') * 60 +
+               pd.to_numeric(parts[1], errors='coerce')).to_numpy(dtype=np.float64)
+    return np.append(minutes, np.nan)[codes]
+
+
+def _day_offsets(values, start):
+    """근무일을 기간 첫날 기준 일수로 변환 (고유 값만 해석, 해석 불가는 NaN)"""
+    codes, uniques = pd.factorize(values)
+    days = (pd.to_datetime(pd.Series(uniques), errors='coerce').dt.normalize() - start).dt.days
+    return np.append(days.to_numpy(dtype=np.float64), np.nan)[codes]
+
+
+def detect_csv_encoding(path, sample_size=65536):
+    """CSV 인코딩 판별 (UTF-8로 해석되면 'utf-8-sig', 아니면 'cp949')"""
+    with open(path, 'rb') as f:
+        sample = f.read(sample_size)
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return 'cp949'
+    return 'utf-8-sig'
+
+
+class TimesheetAggregator:
+    """근태 기록 묶음을 직원 × 일 행렬로 누적하는 집계기"""
+    
+    def __init__(self, period, holidays=(), key='이름', date_column='근무일',
+                 start_column='출근', end_column='퇴근', break_column='휴게시간'):
+        """
+        Args:
+            period: 급여 기간 (예: "2025-01", 기간 밖 근무일 기록은 제외)
+            holidays: 주휴일 외 휴일 날짜 목록 (공휴일, 약정 휴일 등)
+            key (str): 직원 식별 컬럼
+            date_column, start_column, end_column: 근무일, 출근 시각, 퇴근 시각 컬럼
+            break_column (str): 휴게시간(분) 컬럼 (없으면 0)
+        """
+        self.start = pd.Timestamp(normalize_period(period))
+        self.days = (self.start + pd.offsets.MonthEnd(0)).day
+        self.key = key
+        self.date_column = date_column
+        self.start_column = start_column
+        self.end_column = end_column
+        self.break_column = break_column
+        
+        dates = pd.date_range(self.start, periods=self.days, freq='D')
+        holiday_dates = pd.to_datetime(pd.Series(list(holidays), dtype=object)).dt.normalize()
+        self.holidays = np.asarray((dates.weekday == WEEKLY_HOLIDAY) | dates.isin(holiday_dates))
+        
+        self._employees = []
+        self._index = pd.Index([], dtype=object)
+        self._worked = np.zeros((0, self.days), dtype=np.int64)
+        self._night = np.zeros(0, dtype=np.int64)
+        self.rows = 0
+        self.skipped = 0
+    
+    @property
+    def columns(self):
+        """읽어야 하는 CSV 컬럼"""
+        return [self.key, self.date_column, self.start_column, self.end_column, self.break_column]
+    
+    def add_chunk(self, chunk):
+        """
+        근태 기록 묶음 누적
+        
+        Raises:
+            ValueError: 필수 컬럼이 없는 경우
+        """
+        missing = [col for col in self.columns[:4] if col not in chunk.columns]
+        if missing:
+            raise ValueError(f"근태 기록에 필요한 컬럼이 없습니다: {', '.join(missing)}")
+        
+        day = _day_offsets(chunk[self.date_column], self.start)
+        clock_in = _clock_minutes(chunk[self.start_column])
+        clock_out = _clock_minutes(chunk[self.end_column])
+        valid = (chunk[self.key].notna().to_numpy() & (day >= 0) & (day < self.days) &
+                 ~np.isnan(clock_in) & ~np.isnan(clock_out))
+        self.rows += len(chunk)
+        self.skipped += int((~valid).sum())
+        if not valid.any():
+            return
+        
+        keys = chunk[self.key].to_numpy()[valid]
+        day = day[valid].astype(np.int64)
+        clock_in = clock_in[valid].astype(np.int64)
+        clock_out = clock_out[valid].astype(np.int64)
+        clock_out = np.where(clock_out <= clock_in, clock_out + MINUTES_PER_DAY, clock_out)
+        if self.break_column in chunk.columns:
+            codes, uniques = pd.factorize(chunk[self.break_column])
+            breaks = np.append(pd.to_numeric(pd.Series(uniques), errors='coerce').fillna(0).to_numpy(), 0)[codes][valid]
+        else:
+            breaks = 0
+        worked = np.maximum(clock_out - clock_in - np.asarray(breaks, dtype=np.int64), 0)
+        
+        night = np.zeros(len(worked), dtype=np.int64)
+        for window_start, window_end in _NIGHT_WINDOWS:
+            night += np.maximum(np.minimum(clock_out, window_end) - np.maximum(clock_in, window_start), 0)
+        night = np.minimum(night, worked)
+        
+        codes = self._codes(keys)
+        np.add.at(self._worked, (codes, day), worked)
+        np.add.at(self._night, codes, night)
+    
+    def _codes(self, keys):
+        """직원 키를 행렬 행 번호로 변환 (처음 나온 직원은 행 추가)"""
+        codes = self._index.get_indexer(keys)
+        if (codes < 0).any():
+            new = pd.unique(keys[codes < 0])
+            self._employees.extend(new)
+            self._index = pd.Index(self._employees, dtype=object)
+            size = len(self._employees)
+            if size > len(self._worked):
+                capacity = max(size, 2 * len(self._worked))
+                self._worked = np.vstack([self._worked, np.zeros((capacity - len(self._worked), self.days), dtype=np.int64)])
+                self._night = np.concatenate([self._night, np.zeros(capacity - len(self._night), dtype=np.int64)])
+            codes = self._index.get_indexer(keys)
+        return codes
+    
+    def result(self):
+        """
+        직원별 근로시간 분류 결과
+        
+        Returns:
+            DataFrame: 직원 키 인덱스, TIMESHEET_COLUMNS 컬럼 (시간 단위)
+                - 연장근무시간: 가산 배율을 반영한 통상시급 기준 환산 시간
+                  (연장근무단가를 통상시급으로 두면 연장근무수당 = 연장근무시간 × 연장근무단가)
+        """
+        size = len(self._employees)
+        worked = self._worked[:size]
+        regular = np.minimum(worked, DAILY_REGULAR_MINUTES)
+        over = worked - regular
+        holiday = self.holidays
+        
+        # 주 단위 소정근로 초과 (월요일 시작 주, 휴일근로 제외)
+        week = (self.start.weekday() + np.arange(self.days)) // 7
+        week_starts = np.flatnonzero(np.r_[True, week[1:] != week[:-1]])
+        weekly = np.add.reduceat(np.where(holiday, 0, regular), week_starts, axis=1)
+        weekly_over = np.maximum(weekly - WEEKLY_REGULAR_MINUTES, 0).sum(axis=1)
+        
+        minutes = {
+            'overtime': over[:, ~holiday].sum(axis=1) + weekly_over,
+            'night': self._night[:size],
+            'holiday': regular[:, holiday].sum(axis=1),
+            'holiday_overtime': over[:, holiday].sum(axis=1),
+        }
+        weighted = sum(minutes[name] * multiplier for name, multiplier in OVERTIME_MULTIPLIERS.items())
+        
+        result = pd.DataFrame({
+            '출근일수': (worked > 0).sum(axis=1),
+            '총근로시간': worked.sum(axis=1) / 60,
+            '연장시간': minutes['overtime'] / 60,
+            '야간시간': minutes['night'] / 60,
+            '휴일시간': minutes['holiday'] / 60,
+            '휴일연장시간': minutes['holiday_overtime'] / 60,
+            '연장근무시간': weighted / 60,
+        }, index=pd.Index(self._employees, name=self.key, dtype=object), columns=TIMESHEET_COLUMNS)
+        return result.round(3)
+
+
+def aggregate_timesheet(path, period, holidays=(), chunksize=TIMESHEET_CHUNK_SIZE, encoding=None, **columns):
+    """
+    근태 기록 CSV를 묶음 단위로 읽어 직원별 근로시간 분류
+    
+    Args:
+        path (str): 근태 기록 CSV 경로
+        period: 급여 기간
+        holidays: 주휴일 외 휴일 날짜 목록
+        chunksize (int): 한 번에 읽는 행 수
+        encoding (str, optional): 파일 인코딩 (None이면 UTF-8/CP949 자동 판별)
+        **columns: TimesheetAggregator 컬럼 이름 인자 (key, date_column 등)
+    
+    Returns:
+        DataFrame: TimesheetAggregator.result() 참고
+    
+    Raises:
+        ValueError: 필수 컬럼이 없는 경우
+    """
+    aggregator = TimesheetAggregator(period, holidays, **columns)
+    wanted = set(aggregator.columns)
+    encoding = encoding or detect_csv_encoding(path)
+    reader = pd.read_csv(path, chunksize=chunksize, encoding=encoding, dtype=str,
+                         usecols=lambda col: col in wanted)
+    for chunk in reader:
+        aggregator.add_chunk(chunk)
+    
+    if aggregator.skipped:
+        logger.warning(f"근태 기록 중 기간 밖이거나 형식이 잘못된 {aggregator.skipped}행을 제외했습니다.")
+    result = aggregator.result()
+    logger.info(f"근태 기록 집계 완료: {aggregator.rows}행 -> {len(result)}명")
+    return result
+
+
+def apply_timesheet(roster, summary, key='이름'):
+    """
+    근태 집계 결과를 직원 명부의 연장근무시간에 반영
+    
+    근태 기록이 있는 직원만 연장근무시간을 환산 시간으로 바꾸고 분류 시간 컬럼을 추가합니다
+    (근태 기록이 없는 직원은 기존 값 유지). 직원 키는 문자열로 비교합니다.
+    
+    Returns:
+        DataFrame: 명부 복사본
+    """
+    result = roster.copy()
+    lookup = summary.set_axis(summary.index.astype(str))
+    matched = lookup.reindex(roster[key].astype(str).to_numpy())
+    found = matched.index.isin(lookup.index)
+    for col in TIMESHEET_COLUMNS[1:]:
+        values = matched[col].to_numpy()
+        if col == '연장근무시간' and col in roster.columns:
+            values = np.where(found, values, pd.to_numeric(roster[col], errors='coerce').to_numpy())
+        result[col] = values
+    return result
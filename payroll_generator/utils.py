@@ -54,7 +54,7 @@ def normalize_path(file_path):
     return normalized
 
 def validate_file_path(file_path, allowed_extensions=None):
-    """파일 경로 유효성 검증"""
+    """파일 경로 유효성 검증 (허용 확장자는 '.xlsx', 'xlsx' 어느 형식이든 가능)"""
     normalized = normalize_path(file_path)
     
     if not os.path.exists(normalized):
@@ -62,7 +62,8 @@ def validate_file_path(file_path, allowed_extensions=None):
     
     if allowed_extensions:
         ext = os.path.splitext(normalized)[1].lower()
-        if ext not in allowed_extensions:
+        allowed = {'.' + str(e).lower().lstrip('.') for e in allowed_extensions}
+        if ext not in allowed:
             raise ValueError(f"지원하지 않는 파일 형식입니다: {ext}")
     
     return normalized
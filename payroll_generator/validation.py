@@ -0,0 +1,279 @@
+# validation.py
+"""직원 명부 값 검증 모듈
+
+급여 계산 전에 명부 전체를 컬럼 단위 벡터 연산으로 한 번에 검사해
+행 번호가 포함된 구조화된 오류 보고서(ValidationReport)를 반환합니다.
+행 단위 계산 중 예외로 건너뛰던 잘못된 값(숫자가 아닌 금액, 범위를 벗어난 값,
+해석할 수 없는 날짜, 잘못된 주민번호, 중복 직원)을 계산 전에 모두 찾습니다.
+
+심각도:
+    error: 계산할 수 없거나 결과를 믿을 수 없는 행 (계산에서 제외)
+    warning: 계산은 가능하지만 확인이 필요한 행 (빈 값은 0으로 계산, 동명이인 등)
+
+주민번호는 계산에 쓰이지 않으므로 형식 오류는 경고로 보고하고, 13자리 전체가 같은
+중복 행만 오류로 봅니다 (직원 템플릿처럼 앞 6자리만 입력한 명부는 생년월일만 확인).
+검증 숫자는 2020년 10월 이후 발급분부터 쓰이지 않으므로 불일치도 경고입니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .calculator import ALLOWANCE_COLUMNS, STANDARD_WAGE_COLUMN
+    from .config import VALIDATION_RANGES
+    from .logger import setup_logger
+except ImportError:
+    from calculator import ALLOWANCE_COLUMNS, STANDARD_WAGE_COLUMN
+    from config import VALIDATION_RANGES
+    from logger import setup_logger
+
+logger = setup_logger()
+
+ERROR = 'error'
+WARNING = 'warning'
+
+# 보고서 항목 컬럼 (row: 명부 DataFrame의 인덱스, 컬럼 누락은 None)
+ISSUE_COLUMNS = ['row', 'column', 'code', 'severity', 'message', 'value']
+
+REQUIRED_COLUMNS = ['이름', '주민번호', '입사일', '기본급', '부양가족수']
+NUMERIC_COLUMNS = list(VALIDATION_RANGES) + ALLOWANCE_COLUMNS + [STANDARD_WAGE_COLUMN]
+INTEGER_COLUMNS = ['부양가족수']
+DATE_COLUMNS = ['입사일', '퇴사일']
+NAME_COLUMN = '이름'
+RRN_COLUMN = '주민번호'
+
+# 주민번호 검증 숫자 가중치 (앞 12자리)
+RRN_WEIGHTS = np.array([2, 3, 4, 5, 6, 7, 8, 9, 2, 3, 4, 5], dtype=np.int64)
+
+# 주민번호 7번째 자리(성별) -> 출생 세기
+RRN_CENTURY = np.array([1800, 1900, 1900, 2000, 2000, 1900, 1900, 2000, 2000, 1800], dtype=np.int64)
+
+# 앞 6자리만 있으면 출생 연도를 알 수 없으므로 윤년 기준으로 월/일만 확인
+RRN_FRONT_YEAR = 2000
+
+
+class ValidationReport:
+    """명부 검증 결과 (issues: ISSUE_COLUMNS 컬럼의 DataFrame)"""
+    
+    def __init__(self, issues, row_count):
+        self.issues = issues
+        self.row_count = row_count
+    
+    @property
+    def errors(self):
+        """오류 항목"""
+        return self.issues[self.issues['severity'] == ERROR]
+    
+    @property
+    def warnings(self):
+        """경고 항목"""
+        return self.issues[self.issues['severity'] == WARNING]
+    
+    @property
+    def ok(self):
+        """오류가 없으면 True (경고는 무시)"""
+        return not (self.issues['severity'] == ERROR).any()
+    
+    @property
+    def error_rows(self):
+        """오류가 있는 행 인덱스 (중복 없이 명부 순서)"""
+        rows = self.errors['row'].dropna()
+        return list(dict.fromkeys(rows))
+    
+    def valid_rows(self, df):
+        """오류 행을 제외한 명부"""
+        return df.drop(index=self.error_rows)
+    
+    def to_records(self, limit=None):
+        """보고서 항목 딕셔너리 리스트 (JSON 응답용)"""
+        issues = self.issues if limit is None else self.issues.head(limit)
+        records = issues.astype(object).where(issues.notna(), None).to_dict('records')
+        for record in records:
+            if isinstance(record['row'], np.integer):
+                record['row'] = int(record['row'])
+        return records
+    
+    def to_dict(self, limit=None):
+        """요약과 항목을 담은 딕셔너리 (JSON 응답용)"""
+        return {
+            'rows': self.row_count,
+            'errors': len(self.errors),
+            'warnings': len(self.warnings),
+            'error_rows': len(self.error_rows),
+            'issues': self.to_records(limit),
+        }
+    
+    def summary(self):
+        """한 줄 요약"""
+        return (f"전체 {self.row_count}행 중 오류 {len(self.errors)}건({len(self.error_rows)}행), "
+                f"경고 {len(self.warnings)}건")
+    
+    def __repr__(self):
+        return f"ValidationReport({self.summary()})"
+
+
+def _blank(raw):
+    """빈 값 여부 (NaN/None/공백 문자열)"""
+    blank = raw.isna()
+    if raw.dtype == object:
+        blank |= raw.astype(str).str.strip() == ''
+    return blank.to_numpy()
+
+
+def parse_dates(raw):
+    """날짜 컬럼 해석 (값마다 형식 판별, 빈 값이나 해석할 수 없는 값은 NaT)
+    
+    pandas 기본 해석은 첫 값의 형식을 컬럼 전체에 적용하므로 2020-01-01, 2021/05/03,
+    2022.03.01이 섞인 컬럼은 나머지가 NaT가 됩니다. ISO 형식은 한 번에 변환하고
+    해석하지 못한 값만 값별 형식(format='mixed')으로 다시 해석합니다.
+    """
+    dates = pd.to_datetime(raw, errors='coerce', format='ISO8601')
+    retry = (dates.isna() & raw.notna()).to_numpy()
+    if retry.any():
+        dates.iloc[np.flatnonzero(retry)] = pd.to_datetime(raw[retry], errors='coerce', format='mixed').to_numpy()
+    return dates
+
+
+def _issue_frame(df, mask, column, code, severity, message):
+    """mask 행에 대한 보고서 항목"""
+    rows = df.index[mask]
+    values = None
+    if column in df.columns:
+        raw = df[column][mask]
+        values = raw.astype(str).where(raw.notna(), None).to_numpy()
+    return pd.DataFrame({
+        'row': rows, 'column': column, 'code': code,
+        'severity': severity, 'message': message, 'value': values,
+    }, columns=ISSUE_COLUMNS)
+
+
+def _rrn_digits(raw):
+    """주민번호 숫자만 추출 (엑셀에서 숫자로 읽혀 앞자리 0이 빠진 값은 13자리로 복원)"""
+    if raw.dtype.kind in 'iuf':
+        digits = raw.astype('Int64').astype('string').str.zfill(13)
+    else:
+        digits = raw.astype('string').str.replace(r'\D', '', regex=True)
+    return digits.fillna('')
+
+
+def _check_rrn(digits):
+    """
+    주민번호 형식/검증 숫자 판정
+    
+    Returns:
+        tuple: (형식 오류 mask, 검증 숫자 불일치 mask) - 같은 자릿수 행 전체를 한 번에 계산
+    """
+    lengths = digits.str.len().to_numpy()
+    invalid = (lengths != 6) & (lengths != 13)
+    mismatch = np.zeros(len(digits), dtype=bool)
+    for width in (6, 13):
+        positions = np.flatnonzero(lengths == width)
+        if len(positions) == 0:
+            continue
+        
+        # (행, 자릿수) 숫자 행렬
+        joined = ''.join(digits.to_numpy()[positions]).encode('ascii')
+        matrix = np.frombuffer(joined, dtype=np.uint8).reshape(-1, width).astype(np.int64) - ord('0')
+        
+        # 생년월일 (7번째 자리로 세기 판정)
+        if width == 13:
+            year = RRN_CENTURY[matrix[:, 6]] + matrix[:, 0] * 10 + matrix[:, 1]
+        else:
+            year = RRN_FRONT_YEAR
+        birth = pd.to_datetime(pd.DataFrame({
+            'year': year,
+            'month': matrix[:, 2] * 10 + matrix[:, 3],
+            'day': matrix[:, 4] * 10 + matrix[:, 5],
+        }), errors='coerce')
+        invalid[positions] = birth.isna().to_numpy()
+        
+        if width == 13:
+            check = (11 - (matrix[:, :12] @ RRN_WEIGHTS) % 11) % 10
+            mismatch[positions] = (check != matrix[:, 12]) & ~invalid[positions]
+    return invalid, mismatch
+
+
+def validate_roster(df, required_columns=None):
+    """
+    직원 명부 값 검증
+    
+    Args:
+        df (DataFrame): 직원 명부
+        required_columns (list, optional): 필수 컬럼 (None이면 REQUIRED_COLUMNS)
+    
+    Returns:
+        ValidationReport: 검증 결과 (명부는 변경하지 않음)
+    """
+    required_columns = REQUIRED_COLUMNS if required_columns is None else required_columns
+    frames = []
+    positions = []
+    
+    def add(mask, column, code, severity, message):
+        if mask.any():
+            frames.append(_issue_frame(df, mask, column, code, severity, message))
+            positions.append(np.flatnonzero(mask))
+    
+    # 필수 컬럼 누락 / 빈 값
+    for col in required_columns:
+        if col not in df.columns:
+            frames.append(pd.DataFrame([[None, col, 'missing_column', ERROR, f"필수 컬럼이 없습니다: {col}", None]],
+                                       columns=ISSUE_COLUMNS))
+            positions.append(np.array([-1]))
+            continue
+        add(_blank(df[col]), col, 'empty', WARNING, "값이 비어 있습니다")
+    
+    # 숫자 형식 / 범위
+    for col in NUMERIC_COLUMNS:
+        if col not in df.columns:
+            continue
+        raw = df[col]
+        values = pd.to_numeric(raw, errors='coerce').to_numpy(dtype=np.float64)
+        present = ~_blank(raw)
+        add(present & np.isnan(values), col, 'not_numeric', ERROR, "숫자가 아닙니다")
+        
+        lower, upper = VALIDATION_RANGES.get(col, (0, None))
+        if lower is not None:
+            add(values < lower, col, 'out_of_range', ERROR, f"{lower} 이상이어야 합니다")
+        if upper is not None:
+            add(values > upper, col, 'out_of_range', ERROR, f"{upper} 이하여야 합니다")
+        if col in INTEGER_COLUMNS:
+            add(np.isfinite(values) & (values != np.floor(values)), col, 'not_integer', ERROR, "정수가 아닙니다")
+    
+    # 날짜 형식 / 입사일-퇴사일 순서
+    dates = {}
+    for col in DATE_COLUMNS:
+        if col not in df.columns:
+            continue
+        raw = df[col]
+        dates[col] = parse_dates(raw)
+        add(~_blank(raw) & dates[col].isna().to_numpy(), col, 'invalid_date', ERROR, "날짜 형식이 아닙니다")
+    if len(dates) == len(DATE_COLUMNS):
+        hire, leave = (dates[col] for col in DATE_COLUMNS)
+        add((leave < hire).to_numpy(), DATE_COLUMNS[1], 'date_order', ERROR, "퇴사일이 입사일보다 빠릅니다")
+    
+    # 주민번호 형식 / 검증 숫자 / 중복
+    if RRN_COLUMN in df.columns:
+        present = ~_blank(df[RRN_COLUMN])
+        digits = _rrn_digits(df[RRN_COLUMN])
+        invalid, mismatch = _check_rrn(digits)
+        add(present & invalid, RRN_COLUMN, 'invalid_rrn', WARNING, "주민번호 형식이 잘못되었습니다")
+        add(present & mismatch, RRN_COLUMN, 'rrn_checksum', WARNING, "주민번호 검증 숫자가 맞지 않습니다")
+        full = present & ~invalid & (digits.str.len() == 13).to_numpy()
+        add(full & digits.where(full).duplicated(keep=False).to_numpy(), RRN_COLUMN, 'duplicate_rrn', ERROR,
+            "주민번호가 중복되었습니다")
+    
+    # 동명이인 (명세서 파일명이 겹치므로 경고)
+    if NAME_COLUMN in df.columns:
+        names = df[NAME_COLUMN].astype('string').str.strip()
+        add(~_blank(df[NAME_COLUMN]) & names.duplicated(keep=False).to_numpy(), NAME_COLUMN,
+            'duplicate_name', WARNING, "이름이 중복되었습니다")
+    
+    # 명부 행 순서로 정렬 (컬럼 누락 항목이 먼저)
+    if frames:
+        order = np.argsort(np.concatenate(positions), kind='stable')
+        issues = pd.concat(frames, ignore_index=True).iloc[order].reset_index(drop=True)
+    else:
+        issues = pd.DataFrame(columns=ISSUE_COLUMNS)
+    report = ValidationReport(issues, len(df))
+    logger.info(f"명부 검증 완료: {report.summary()}")
+    return report
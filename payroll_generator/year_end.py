@@ -0,0 +1,251 @@
+# year_end.py
+"""연말정산 시뮬레이션 모듈
+
+직원별 12개월 급여 결과를 (직원 수 × 12) 행렬로 모은 뒤, 연간 세액 계산을
+행렬 컬럼 연산 한 번으로 처리합니다. 월별 calculate_deductions() 호출 없이
+3,000명 규모도 수십 밀리초 안에 정산합니다.
+
+정산 순서:
+    총급여 - 근로소득공제 = 근로소득금액
+    근로소득금액 - 인적공제 - 4대보험료공제 = 과세표준
+    과세표준 × 기본세율 = 산출세액
+    산출세액 - 근로소득세액공제 = 결정세액
+    결정세액 - 기납부세액(월별 원천징수 합계) = 차감징수세액 (음수이면 환급)
+
+월별 계산과 같이 비율은 백만분율 정수(RATE_SCALE)로 바꿔 int64로만 계산하고,
+결정세액과 결정지방소득세는 10원 미만을 절사합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .calculator import PayrollCalculator, RESULT_COLUMNS, PERIOD_COLUMN
+    from .config import (
+        ANNUAL_INCOME_TAX_TABLE,
+        EARNED_INCOME_DEDUCTION_TABLE,
+        EARNED_INCOME_DEDUCTION_LIMIT,
+        PERSONAL_DEDUCTION,
+        EARNED_INCOME_TAX_CREDIT_TABLE,
+        EARNED_INCOME_TAX_CREDIT_LIMIT_TABLE,
+        RATE_REGISTRY,
+        RATE_SCALE
+    )
+    from .rules import get_rule_set, normalize_period
+    from .tax_table import TaxBracketIndex, to_scaled_rate
+    from .logger import setup_logger
+except ImportError:
+    from calculator import PayrollCalculator, RESULT_COLUMNS, PERIOD_COLUMN
+    from config import (
+        ANNUAL_INCOME_TAX_TABLE,
+        EARNED_INCOME_DEDUCTION_TABLE,
+        EARNED_INCOME_DEDUCTION_LIMIT,
+        PERSONAL_DEDUCTION,
+        EARNED_INCOME_TAX_CREDIT_TABLE,
+        EARNED_INCOME_TAX_CREDIT_LIMIT_TABLE,
+        RATE_REGISTRY,
+        RATE_SCALE
+    )
+    from rules import get_rule_set, normalize_period
+    from tax_table import TaxBracketIndex, to_scaled_rate
+    from logger import setup_logger
+
+logger = setup_logger()
+
+# 월별 결과 중 연말정산에 쓰는 항목
+MONTHLY_FIELDS = ['총지급액', '국민연금', '건강보험', '장기요양', '고용보험', '소득세', '지방소득세']
+
+# 없으면 0으로 보는 월별 항목
+OPTIONAL_MONTHLY_FIELDS = ['비과세액']
+
+# 정산 결과 컬럼
+SETTLEMENT_COLUMNS = [
+    '근무월수', '총급여', '근로소득공제', '근로소득금액', '인적공제', '보험료공제', '과세표준',
+    '산출세액', '근로소득세액공제', '결정세액', '기납부세액', '차감징수세액',
+    '결정지방소득세', '기납부지방소득세', '차감지방소득세'
+]
+
+
+def _compile_table(table):
+    """구간표를 컬럼별 int64 배열로 변환 (세 번째 값인 비율은 백만분율 정수)"""
+    columns = [np.array([row[j] for row in table], dtype=np.int64) for j in range(len(table[0]))]
+    columns[2] = np.array([to_scaled_rate(row[2]) for row in table], dtype=np.int64)
+    return tuple(columns)
+
+
+def _piecewise(values, table):
+    """구간별 (구간 시작, 시작 금액, 초과분 비율) 선형 함수 (int64 배열, 원 미만 절사)"""
+    starts, bases, rates = table
+    i = np.maximum(np.searchsorted(starts, values, side='right') - 1, 0)
+    return bases[i] + (values - starts[i]) * rates[i] // RATE_SCALE
+
+
+def collect_monthly_results(rosters, key='이름'):
+    """
+    월별 명부를 기간별 요율로 일괄 계산해 연말정산 입력(긴 형식)으로 합침
+    
+    Args:
+        rosters (dict): {급여 기간: 직원 명부 DataFrame}
+        key (str): 직원 식별 컬럼
+    
+    Returns:
+        DataFrame: key, '기간', '부양가족수', RESULT_COLUMNS 컬럼
+    """
+    frames = []
+    for period, roster in rosters.items():
+        result = PayrollCalculator(period).calculate_batch(roster)
+        result.insert(0, key, roster[key].to_numpy())
+        result.insert(1, PERIOD_COLUMN, period)
+        result.insert(2, '부양가족수', roster['부양가족수'].to_numpy() if '부양가족수' in roster.columns else 0)
+        frames.append(result)
+    if not frames:
+        return pd.DataFrame(columns=[key, PERIOD_COLUMN, '부양가족수'] + RESULT_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+class YearEndSettlement:
+    """연말정산 계산기 (직원 × 월 행렬 기반)"""
+    
+    def __init__(self, year):
+        """
+        Args:
+            year (int): 귀속 연도 (해당 연도 12월에 시행 중인 요율/세율 사용)
+        """
+        self.year = int(year)
+        rules = get_rule_set(f"{self.year}-12")
+        entry = RATE_REGISTRY[rules.effective_date]
+        self.local_tax_scaled = rules.local_tax_scaled
+        self.truncation_unit = rules.truncation_unit
+        self.tax_index = TaxBracketIndex(entry.get('annual_income_tax_table', ANNUAL_INCOME_TAX_TABLE))
+        self.deduction_table = _compile_table(
+            entry.get('earned_income_deduction_table', EARNED_INCOME_DEDUCTION_TABLE))
+        self.deduction_limit = entry.get('earned_income_deduction_limit', EARNED_INCOME_DEDUCTION_LIMIT)
+        self.personal_deduction = entry.get('personal_deduction', PERSONAL_DEDUCTION)
+        self.credit_table = _compile_table(
+            entry.get('earned_income_tax_credit_table', EARNED_INCOME_TAX_CREDIT_TABLE))
+        self.credit_limit_table = _compile_table(
+            entry.get('earned_income_tax_credit_limit_table', EARNED_INCOME_TAX_CREDIT_LIMIT_TABLE))
+    
+    def build_matrix(self, monthly, key='이름'):
+        """
+        긴 형식 월별 결과를 직원 × 12개월 행렬로 변환
+        
+        같은 직원/월의 행이 여러 개이면 합산합니다. 귀속 연도 밖의 기간은 제외합니다.
+        
+        Args:
+            monthly (DataFrame): key, '기간', MONTHLY_FIELDS (선택: '비과세액', '부양가족수') 컬럼
+        
+        Returns:
+            tuple: (직원 Index, {항목: (직원 수, 12) int64 배열 (부양가족수는 float64, 빈 월은 NaN)},
+                    근무 여부 (직원 수, 12) bool 배열)
+        
+        Raises:
+            ValueError: 필수 컬럼이 없거나 기간 형식이 잘못된 경우
+        """
+        missing = [col for col in [key, PERIOD_COLUMN] + MONTHLY_FIELDS if col not in monthly.columns]
+        if missing:
+            raise ValueError(f"연말정산 입력에 필요한 컬럼이 없습니다: {', '.join(missing)}")
+        
+        # 고유 기간만 해석 (행 수가 아니라 기간 수만큼)
+        period_codes, periods = pd.factorize(monthly[PERIOD_COLUMN].astype(str))
+        normalized = [normalize_period(period) for period in periods]
+        period_year = np.array([int(day[:4]) for day in normalized] + [0])
+        period_month = np.array([int(day[5:7]) - 1 for day in normalized] + [0])
+        in_year = period_year[period_codes] == self.year
+        
+        employee_codes, employees = pd.factorize(monthly.loc[in_year, key])
+        months = period_month[period_codes][in_year]
+        shape = (len(employees), 12)
+        
+        matrix = {}
+        for field in MONTHLY_FIELDS + OPTIONAL_MONTHLY_FIELDS:
+            matrix[field] = np.zeros(shape, dtype=np.int64)
+            if field not in monthly.columns:
+                continue
+            values = pd.to_numeric(monthly.loc[in_year, field], errors='raise').fillna(0).to_numpy(
+                dtype=np.float64).astype(np.int64)
+            np.add.at(matrix[field], (employee_codes, months), values)
+        
+        worked = np.zeros(shape, dtype=bool)
+        worked[employee_codes, months] = True
+        
+        # 부양가족수는 합산하지 않고 해당 월 값 사용
+        dependents = np.full(shape, np.nan)
+        if '부양가족수' in monthly.columns:
+            dependents[employee_codes, months] = pd.to_numeric(
+                monthly.loc[in_year, '부양가족수'], errors='coerce').to_numpy(dtype=np.float64)
+        matrix['부양가족수'] = dependents
+        return pd.Index(employees, name=key), matrix, worked
+    
+    def settle(self, monthly, key='이름'):
+        """
+        연말정산 계산
+        
+        Args:
+            monthly (DataFrame): 월별 결과 (긴 형식, collect_monthly_results() 참고)
+            key (str): 직원 식별 컬럼
+        
+        Returns:
+            DataFrame: 직원별 SETTLEMENT_COLUMNS (차감징수세액이 음수이면 환급)
+        """
+        employees, matrix, worked = self.build_matrix(monthly, key)
+        
+        # 연간 합계 (월 축 합산, 총급여는 비과세 제외)
+        total_salary = matrix['총지급액'].sum(axis=1) - matrix['비과세액'].sum(axis=1)
+        insurance = (matrix['국민연금'] + matrix['건강보험'] + matrix['장기요양'] + matrix['고용보험']).sum(axis=1)
+        prepaid_tax = matrix['소득세'].sum(axis=1)
+        prepaid_local = matrix['지방소득세'].sum(axis=1)
+        
+        # 부양가족수: 마지막 근무 월 값 (12월 기준 판정)
+        dependents_matrix = matrix['부양가족수']
+        has_value = ~np.isnan(dependents_matrix)
+        last_month = 11 - np.argmax(has_value[:, ::-1], axis=1)
+        dependents = dependents_matrix[np.arange(len(employees)), last_month]
+        dependents = np.where(np.isnan(dependents), 0, np.maximum(dependents, 0)).astype(np.int64)
+        
+        # 근로소득공제 (한도 적용)
+        earned_deduction = np.minimum(_piecewise(total_salary, self.deduction_table), self.deduction_limit)
+        earned_deduction = np.minimum(earned_deduction, total_salary)
+        earned_income = total_salary - earned_deduction
+        
+        # 과세표준
+        personal = self.personal_deduction * (1 + dependents)
+        taxable = np.maximum(earned_income - personal - insurance, 0)
+        
+        # 산출세액 / 근로소득세액공제 (총급여 구간별 한도) / 결정세액 (10원 미만 절사)
+        calculated_tax = self.tax_index.tax_array(taxable)
+        credit = np.minimum(_piecewise(calculated_tax, self.credit_table), self._credit_limit(total_salary))
+        determined_tax = self._truncate(np.maximum(calculated_tax - credit, 0))
+        determined_local = self._truncate(determined_tax * self.local_tax_scaled // RATE_SCALE)
+        
+        result = pd.DataFrame({
+            '근무월수': worked.sum(axis=1),
+            '총급여': total_salary,
+            '근로소득공제': earned_deduction,
+            '근로소득금액': earned_income,
+            '인적공제': personal,
+            '보험료공제': insurance,
+            '과세표준': taxable,
+            '산출세액': calculated_tax,
+            '근로소득세액공제': credit,
+            '결정세액': determined_tax,
+            '기납부세액': prepaid_tax,
+            '차감징수세액': determined_tax - prepaid_tax,
+            '결정지방소득세': determined_local,
+            '기납부지방소득세': prepaid_local,
+            '차감지방소득세': determined_local - prepaid_local,
+        }, index=employees, columns=SETTLEMENT_COLUMNS)
+        
+        logger.info(f"{self.year}년 연말정산 계산 완료: {len(result)}명")
+        return result
+    
+    def _truncate(self, amount):
+        """원 단위 절사 (기본 10원 미만, PayrollCalculator와 같은 단위)"""
+        unit = self.truncation_unit
+        return amount // unit * unit
+    
+    def _credit_limit(self, total_salary):
+        """근로소득세액공제 한도 (총급여 구간별, 감액분 원 미만 절사, 최저 한도 보장)"""
+        starts, bases, rates, floors = self.credit_limit_table
+        i = np.maximum(np.searchsorted(starts, total_salary, side='right') - 1, 0)
+        return np.maximum(bases[i] - (total_salary - starts[i]) * rates[i] // RATE_SCALE, floors[i])
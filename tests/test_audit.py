@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""계산 추적(감사) 모드 테스트"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.audit import (
+    TracingPayrollCalculator, TRACE_DTYPE, TAX_METHOD_WITHHOLDING, trace_path, write_trace
+)
+from payroll_generator.calculator import PayrollCalculator
+from payroll_generator.tax_table import WithholdingTable
+from tests.test_calculator import make_roster
+
+
+class TestTracingPayrollCalculator(unittest.TestCase):
+    """추적 계산기 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = TracingPayrollCalculator('2024-01')
+        self.roster = make_roster(2_000, seed=8).assign(식대=250_000)
+    
+    def test_same_result(self):
+        """추적 모드 결과는 일반 계산과 동일 (기간별 요율 포함)"""
+        roster = self.roster.assign(기간=['2023-06', '2025-01'] * 1_000)
+        result, trace = self.calculator.calculate_trace_array(roster)
+        pd.testing.assert_frame_equal(result, PayrollCalculator('2024-01').calculate_batch(roster))
+        self.assertEqual(trace.dtype, TRACE_DTYPE)
+        self.assertEqual(trace['effective_date'][:2].astype(str).tolist(), ['2023-01-01', '2024-01-01'])
+    
+    def test_trace_values(self):
+        """상한 적용, 절사 전 금액, 세액 구간 기록"""
+        result, trace = self.calculator.trace_deductions({'기본급': 10_000_000, '식대': 250_000, '부양가족수': 1})
+        self.assertEqual(result, PayrollCalculator('2024-01').calculate_deductions(
+            {'기본급': 10_000_000, '식대': 250_000, '부양가족수': 1}))
+        self.assertEqual(trace['국민연금_기준금액'], 10_000_000)
+        self.assertEqual(trace['국민연금_상한적용금액'], self.calculator.limits['national_pension'])
+        self.assertEqual(trace['과세급여'], 10_050_000)
+        self.assertEqual(trace['장기요양_절사전'], result['건강보험'] * 129_500 // 1_000_000)
+        self.assertEqual(trace['부양가족공제'], result['부양가족공제'])
+        self.assertEqual(trace['세액구간'], self.calculator.tax_index.bracket(trace['과세표준']))
+        self.assertEqual(result['소득세'], trace['소득세_절사전'] // 10 * 10)
+    
+    def test_truncated_total(self):
+        """절사합계 = 절사 전 금액 합계 - 결과 합계 (항목당 10원 미만)"""
+        result, trace = self.calculator.calculate_trace(self.roster)
+        raw = trace[['국민연금_절사전', '건강보험_절사전', '장기요양_절사전', '고용보험_절사전',
+                     '소득세_절사전', '지방소득세_절사전']].sum(axis=1)
+        final = result[['국민연금', '건강보험', '장기요양', '고용보험', '소득세', '지방소득세']].sum(axis=1)
+        self.assertTrue((trace['절사합계'] == raw - final).all())
+        self.assertTrue(trace['절사합계'].between(0, 6 * 9).all())
+    
+    def test_withholding_bracket(self):
+        """간이세액표 사용 시 구간/공제대상가족 수 기록"""
+        table = np.array([[0, 1_000_000, 0, 0], [1_000_000, 2_000_000, 10_000, 5_000]], dtype=np.int32)
+        self.calculator.withholding = WithholdingTable(table)
+        result, trace = self.calculator.trace_deductions({'기본급': 1_500_000, '부양가족수': 1})
+        self.assertEqual(trace['세액산정방식'], TAX_METHOD_WITHHOLDING)
+        self.assertEqual(trace['세액구간'], 1)
+        self.assertEqual(trace['공제대상가족수'], 2)
+        self.assertEqual(result['소득세'], 5_000)
+    
+    def test_write_trace(self):
+        """급여명세서 옆 JSON 저장"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = trace_path(os.path.join(temp_dir, '홍길동_급여명세서.xlsx'))
+            self.assertTrue(path.endswith('홍길동_급여명세서_계산내역.json'))
+            result, trace = self.calculator.trace_deductions({'기본급': 3_000_000, '부양가족수': 1})
+            write_trace(trace, result, path, {'이름': '홍길동'})
+            with open(path, encoding='utf-8') as f:
+                document = json.load(f)
+            self.assertEqual(document['이름'], '홍길동')
+            self.assertEqual(document['계산결과']['실수령액'], result['실수령액'])
+            self.assertEqual(document['계산내역']['시행일'], '2024-01-01')
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
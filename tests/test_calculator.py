@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""급여 계산기 테스트"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.calculator import PayrollCalculator, RESULT_COLUMNS
+from payroll_generator.config import INCOME_TAX_TABLE
+from payroll_generator.tax_table import TaxBracketIndex
+
+
+def make_roster(size, seed=0):
+    """무작위 직원 명부 생성"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        '이름': [f'직원{i}' for i in range(size)],
+        '기본급': rng.integers(0, 20_000_000, size),
+        '연장근무시간': rng.integers(0, 40, size),
+        '연장근무단가': rng.choice([0, 10_000, 15_000, 25_000], size),
+        '상여금': rng.choice([0, 0, 500_000, 3_000_000], size),
+        '부양가족수': rng.integers(0, 8, size),
+    })
+
+
+class TestPayrollCalculatorBatch(unittest.TestCase):
+    """일괄 계산 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = PayrollCalculator()
+    
+    def test_batch_matches_scalar(self):
+        """일괄 계산 결과가 행 단위 계산과 동일한지 확인"""
+        df = make_roster(500)
+        batch = self.calculator.calculate_batch(df)
+        
+        self.assertEqual(list(batch.columns), RESULT_COLUMNS)
+        for (idx, row), record in zip(df.iterrows(), batch.to_dict('records')):
+            expected = self.calculator.calculate_deductions(row.to_dict())
+            self.assertEqual(record, expected, f"행 {idx} 결과 불일치")
+    
+    def test_batch_missing_columns(self):
+        """없는 컬럼과 빈 값은 0으로 처리"""
+        df = pd.DataFrame({'기본급': [3_000_000, None], '부양가족수': [1, 2]})
+        records = self.calculator.calculate_batch_records(df)
+        
+        expected = self.calculator.calculate_deductions({'기본급': 3_000_000, '부양가족수': 1})
+        self.assertEqual(records[0], expected)
+        self.assertEqual(records[1]['총지급액'], 0)
+    
+    def test_batch_blank_dependents(self):
+        """빈 부양가족수는 일괄/단건 모두 기본 공제액 적용"""
+        df = pd.DataFrame({'기본급': [3_000_000, 3_000_000], '부양가족수': [None, 1]})
+        records = self.calculator.calculate_batch_records(df)
+        
+        for (idx, row), record in zip(df.iterrows(), records):
+            self.assertEqual(record, self.calculator.calculate_deductions(row.to_dict()), f"행 {idx} 결과 불일치")
+        self.assertNotEqual(records[0]['소득세'], records[1]['소득세'])
+    
+    def test_batch_invalid_value(self):
+        """숫자가 아닌 값은 ValueError"""
+        df = pd.DataFrame({'기본급': ['삼백만원'], '부양가족수': [1]})
+        with self.assertRaises(ValueError):
+            self.calculator.calculate_batch(df)
+
+
+class TestFixedPointKernel(unittest.TestCase):
+    """정수 고정소수점 계산 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = PayrollCalculator('2024-01')
+    
+    def test_truncate_to_10_won(self):
+        """보험료/세액은 10원 미만 절사"""
+        result = self.calculator.calculate_deductions({'기본급': 3_000_000, '부양가족수': 1})
+        self.assertEqual(result['국민연금'], 135_000)
+        self.assertEqual(result['건강보험'], 106_350)
+        self.assertEqual(result['장기요양'], 13_770)  # 106,350 × 12.95% = 13,772.3
+        self.assertEqual(result['고용보험'], 27_000)
+        for key in ['국민연금', '건강보험', '장기요양', '고용보험', '소득세', '지방소득세']:
+            self.assertEqual(result[key] % 10, 0, key)
+    
+    def test_fractional_and_empty_inputs(self):
+        """소수 근무시간/빈 값도 단건과 일괄 결과가 비트 단위로 동일"""
+        df = make_roster(2_000, seed=11)
+        df['연장근무시간'] = df['연장근무시간'] + np.random.default_rng(11).choice([0, 0.25, 0.5, 0.333], len(df))
+        df['연장근무단가'] = df['연장근무단가'] + 7
+        df.loc[::17, '상여금'] = np.nan
+        
+        batch = self.calculator.calculate_batch(df)
+        self.assertTrue(all(dtype == np.int64 for dtype in batch.dtypes))
+        for (idx, row), record in zip(df.iterrows(), batch.to_dict('records')):
+            self.assertEqual(record, self.calculator.calculate_deductions(row.to_dict()), f"행 {idx} 결과 불일치")
+    
+    def test_scaled_rates(self):
+        """요율은 백만분율 정수로 보관"""
+        rules = self.calculator.rules
+        self.assertEqual(rules.rates.dtype, np.int64)
+        self.assertEqual(rules.long_term_care_scaled, 129_500)
+        self.assertEqual(rules.local_tax_scaled, 100_000)
+
+
+class TestAllowances(unittest.TestCase):
+    """수당/비과세 한도 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = PayrollCalculator('2024-01')
+        self.base = {'기본급': 3_000_000, '부양가족수': 1}
+    
+    def test_batch_matches_scalar(self):
+        """수당 컬럼이 있어도 단건과 일괄 결과가 동일"""
+        df = make_roster(1_000, seed=3)
+        rng = np.random.default_rng(3)
+        df['식대'] = rng.choice([0, 100_000, 200_000, 300_000], len(df))
+        df['직책수당'] = rng.choice([0, 150_000], len(df))
+        df['당직수당'] = rng.choice([0, 50_000, np.nan], len(df))
+        
+        batch = self.calculator.calculate_batch(df)
+        for (idx, row), record in zip(df.iterrows(), batch.to_dict('records')):
+            self.assertEqual(record, self.calculator.calculate_deductions(row.to_dict()), f"행 {idx} 결과 불일치")
+    
+    def test_non_taxable_limit(self):
+        """비과세 한도 이내 식대는 세액에 영향 없음, 초과분만 과세"""
+        plain = self.calculator.calculate_deductions(self.base)
+        meal = self.calculator.calculate_deductions({**self.base, '식대': 200_000})
+        self.assertEqual(meal['수당합계'], 200_000)
+        self.assertEqual(meal['비과세액'], 200_000)
+        self.assertEqual(meal['총지급액'], plain['총지급액'] + 200_000)
+        self.assertEqual(meal['소득세'], plain['소득세'])
+        self.assertEqual(meal['국민연금'], plain['국민연금'])
+        
+        over = self.calculator.calculate_deductions({**self.base, '식대': 300_000})
+        self.assertEqual(over['비과세액'], 200_000)
+        self.assertGreater(over['소득세'], plain['소득세'])
+    
+    def test_fixed_allowance_insurable(self):
+        """고정 수당은 보험료 기준 금액에 포함"""
+        result = self.calculator.calculate_deductions({**self.base, '직책수당': 200_000})
+        expected = self.calculator.calculate_deductions({'기본급': 3_200_000, '부양가족수': 1})
+        self.assertEqual(result['비과세액'], 0)
+        for key in ['국민연금', '건강보험', '고용보험', '소득세']:
+            self.assertEqual(result[key], expected[key], key)
+
+
+class TestTaxBracketIndex(unittest.TestCase):
+    """소득세 구간 인덱스 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.index = TaxBracketIndex(INCOME_TAX_TABLE)
+    
+    def linear_tax(self, taxable_income):
+        """기존 선형 탐색 방식 소득세 (비교 기준)"""
+        if taxable_income <= 0:
+            return 0
+        for start, end, rate, deduction in INCOME_TAX_TABLE:
+            if start <= taxable_income < end:
+                return max(0, int(taxable_income * rate - deduction))
+    
+    def test_boundaries(self):
+        """구간 경계값에서 단건/배열 결과가 선형 탐색과 동일한지 확인"""
+        values = [-1, 0, 1]
+        for start, _, _, _ in INCOME_TAX_TABLE:
+            values.extend([start - 1, start, start + 1])
+        values.append(100_000_000)
+        
+        array_result = self.index.tax_array(np.array(values))
+        for value, from_array in zip(values, array_result):
+            self.assertEqual(self.index.tax(value), self.linear_tax(value), f"과세표준 {value}")
+            self.assertEqual(from_array, self.linear_tax(value), f"과세표준 {value} (배열)")
+    
+    def test_bracket_lookup(self):
+        """구간 번호 탐색"""
+        self.assertEqual(self.index.bracket(0), 0)
+        self.assertEqual(self.index.bracket(1_200_000), 1)
+        self.assertEqual(self.index.bracket(50_000_000), len(self.index) - 1)
+    
+    def test_non_contiguous_table(self):
+        """연속되지 않는 구간은 ValueError"""
+        with self.assertRaises(ValueError):
+            TaxBracketIndex([(0, 100, 0.1, 0), (200, float('inf'), 0.2, 10)])
+
+
+if __name__ == '__main__':
+    unittest.main()
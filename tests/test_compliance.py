@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""법정 기준 점검 테스트"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.compliance import minimum_hourly_wage, monthly_overtime_limit, scan_compliance
+from payroll_generator.calculator import PayrollCalculator
+from tests.test_calculator import make_roster
+
+
+class TestScanCompliance(unittest.TestCase):
+    """법정 기준 점검 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.roster = pd.DataFrame({
+            '이름': ['정상', '최저임금미달', '연장초과', '단시간', '휴직'],
+            '기본급': [3_000_000, 1_900_000, 3_000_000, 1_000_000, 0],
+            '직책수당': [0, 100_000, 0, 0, 0],
+            '월소정근로시간': [None, None, None, 100, None],
+            '연장근무시간': [20, 0, 60, 0, 0],
+            '연장근무단가': [15_000] * 5,
+            '상여금': [0] * 5,
+            '부양가족수': [1] * 5,
+        }, index=[10, 11, 12, 13, 14])
+    
+    def test_rules_by_period(self):
+        """기간별 최저임금 / 월 일수 기준 연장근무 한도"""
+        self.assertEqual(minimum_hourly_wage('2024-06'), 9_860)
+        self.assertEqual(minimum_hourly_wage('2025-01'), 10_030)
+        self.assertEqual(minimum_hourly_wage('2020-01'), 9_620)
+        self.assertAlmostEqual(monthly_overtime_limit('2024-02'), 12 * 29 / 7)
+        self.assertAlmostEqual(monthly_overtime_limit('2024-03'), 12 * 31 / 7)
+    
+    def test_report(self):
+        """위반 행과 계산 값 보고 (명부 행 순서)"""
+        report = scan_compliance(self.roster, '2024-03')
+        self.assertEqual(report.error_rows, [11, 12])
+        issues = report.issues.set_index('row')
+        self.assertEqual(issues.loc[11, 'code'], 'minimum_wage')
+        self.assertEqual(issues.loc[11, 'value'], str(2_000_000 // 209))
+        self.assertEqual(issues.loc[12, 'code'], 'overtime_limit')
+        
+        # 2025년 최저임금 기준이면 단시간 근로자(1,000,000 / 100시간 = 10,000원)도 미달
+        self.assertEqual(scan_compliance(self.roster, '2025-01').error_rows, [11, 12, 13])
+    
+    def test_insurance_cap(self):
+        """명부의 보험료가 상한액 기준 보험료를 넘으면 위반 (보험료 컬럼이 없으면 점검하지 않음)"""
+        roster = make_roster(1_000, seed=5)
+        roster['기본급'] = roster['기본급'].clip(lower=2_500_000)
+        roster.loc[::100, '기본급'] = 20_000_000
+        roster['연장근무시간'] = 0
+        self.assertTrue(scan_compliance(roster, '2024-01').ok)
+        
+        results = PayrollCalculator('2024-01').calculate_batch(roster)
+        roster['국민연금'] = results['국민연금']
+        roster.loc[::100, '국민연금'] = 20_000_000 * 45 // 1000  # 상한 미적용
+        report = scan_compliance(roster, '2024-01')
+        self.assertEqual(report.error_rows, list(roster.index[::100]))
+        self.assertTrue((report.errors['column'] == '국민연금').all())
+
+
+if __name__ == '__main__':
+    unittest.main()
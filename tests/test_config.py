@@ -138,6 +138,33 @@ def test_session_timeout():
     return True
 
 
+def _config_values(env, *names):
+    """환경 변수를 바꾼 새 프로세스에서 Config 값 읽기 (설정은 임포트 시 한 번만 읽으므로)"""
+    import json
+    import subprocess
+    code = f"import json, config; print(json.dumps([getattr(config.Config, name) for name in {list(names)!r}]))"
+    result = subprocess.run([sys.executable, '-c', code], env={**os.environ, **env}, capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_malformed_env_values():
+    """정수 환경 변수가 잘못되어도 앱 설정은 기본값으로 로드"""
+    print("🧪 테스트 5: 잘못된 정수 환경 변수")
+    
+    assert _config_values({'ROSTER_CACHE_MAX_BYTES': '1gb'}, 'ROSTER_CACHE_MAX_BYTES') == [256 * 1024 * 1024]
+    assert _config_values({'ROSTER_CACHE_MAX_BYTES': '1048576'}, 'ROSTER_CACHE_MAX_BYTES') == [1048576]
+    print("✅ ROSTER_CACHE_MAX_BYTES: 잘못된 값은 기본값")
+    
+    for value in ['abc', '0', '-5']:
+        assert _config_values({'PREVIEW_CACHE_SIZE': value}, 'PREVIEW_CACHE_SIZE') == [1024], value
+    assert _config_values({'PREVIEW_CACHE_SIZE': '16'}, 'PREVIEW_CACHE_SIZE') == [16]
+    print("✅ PREVIEW_CACHE_SIZE: 잘못된 값이나 1 미만은 기본값")
+    
+    return True
+
+
 if __name__ == '__main__':
     print("=" * 60)
     print("설정 파일 테스트 시작")
@@ -147,7 +174,8 @@ if __name__ == '__main__':
         test_development_config,
         test_production_config_without_secret_key,
         test_production_config_with_secret_key,
-        test_session_timeout
+        test_session_timeout,
+        test_malformed_env_values
     ]
     
     passed = 0
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""직원 명부 스트리밍 읽기 테스트"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.excel_handler import ExcelHandler
+from payroll_generator.roster_formats import HAS_PYARROW, detect_roster_format
+from tests.test_calculator import make_roster
+
+
+class TestIterEmployeeData(unittest.TestCase):
+    """openpyxl 읽기 전용 모드 묶음 읽기 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.handler = ExcelHandler()
+        self.roster = make_roster(250, seed=3).assign(
+            주민번호='900101', 입사일=pd.Timestamp('2020-01-01'), 비고=None)
+        self.path = os.path.join(self.temp_dir, 'roster.xlsx')
+        self.roster.to_excel(self.path, index=False)
+    
+    def tearDown(self):
+        """테스트 정리"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_same_as_read_excel(self):
+        """묶음을 합치면 pd.read_excel과 같은 값/형식, 인덱스는 파일 전체 기준"""
+        chunks = list(self.handler.iter_employee_data(self.path, chunksize=100))
+        self.assertEqual([len(chunk) for chunk in chunks], [100, 100, 50])
+        self.assertEqual(chunks[2].index[0], 200)
+        pd.testing.assert_frame_equal(pd.concat(chunks), pd.read_excel(self.path))
+        pd.testing.assert_frame_equal(self.handler.read_employee_data(self.path), pd.read_excel(self.path))
+    
+    def test_blank_rows_and_header(self):
+        """빈 행은 건너뛰고 빈 헤더는 'Unnamed: n'"""
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(['이름', '주민번호', None, '입사일', '기본급', '부양가족수'])
+        ws.append(['가', '900101', 'x', '2020-01-01', 3_000_000, 1])
+        ws.append([None] * 6)
+        ws.append(['나', '900102', None, '2021-01-01', 2_500_000])
+        wb.save(self.path)
+        
+        df = self.handler.read_employee_data(self.path)
+        self.assertEqual(list(df.columns), ['이름', '주민번호', 'Unnamed: 2', '입사일', '기본급', '부양가족수'])
+        self.assertEqual(df['이름'].tolist(), ['가', '나'])
+        self.assertTrue(pd.isna(df.loc[1, '부양가족수']))
+    
+    def test_missing_column(self):
+        """필수 컬럼이 없으면 첫 묶음 전에 ValueError, 빈 명부는 컬럼만 있는 묶음"""
+        self.roster.drop(columns='기본급').to_excel(self.path, index=False)
+        with self.assertRaises(ValueError):
+            next(self.handler.iter_employee_data(self.path))
+        
+        self.roster.head(0).to_excel(self.path, index=False)
+        chunks = list(self.handler.iter_employee_data(self.path))
+        self.assertEqual(len(chunks), 1)
+        self.assertTrue(chunks[0].empty)
+        self.assertIn('기본급', chunks[0].columns)
+
+
+
+class TestRosterFormats(unittest.TestCase):
+    """CSV/Parquet/Arrow 명부 읽기 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.handler = ExcelHandler()
+        self.roster = make_roster(120, seed=6).assign(주민번호='900101-1234568', 입사일='2020-01-01')
+    
+    def tearDown(self):
+        """테스트 정리"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def path(self, name):
+        return os.path.join(self.temp_dir, name)
+    
+    def test_csv_encodings(self):
+        """UTF-8(BOM)/CP949 CSV는 같은 명부, 컬럼 이름 공백 제거"""
+        for encoding in ['utf-8-sig', 'cp949']:
+            path = self.path(f'roster_{encoding}.csv')
+            self.roster.rename(columns={'기본급': ' 기본급 '}).to_csv(path, index=False, encoding=encoding)
+            df = self.handler.read_employee_data(path)
+            pd.testing.assert_frame_equal(df, self.roster, check_dtype=False)
+            chunks = list(self.handler.iter_employee_data(path, chunksize=50))
+            self.assertEqual([chunk.index[0] for chunk in chunks], [0, 50, 100])
+    
+    def test_detect_format(self):
+        """확장자보다 파일 첫 바이트 우선"""
+        path = self.path('roster.xls')
+        self.roster.to_excel(path, index=False, engine='openpyxl')
+        self.assertEqual(detect_roster_format(path), 'xlsx')
+        self.assertEqual(len(self.handler.read_employee_data(path)), 120)
+        
+        self.roster.to_csv(self.path('roster.txt'), index=False)
+        self.assertEqual(detect_roster_format(self.path('roster.txt')), 'csv')
+        with self.assertRaises(ValueError):
+            self.handler.read_employee_data(self.path('roster.txt'))
+    
+    @unittest.skipUnless(HAS_PYARROW, 'pyarrow 미설치')
+    def test_parquet_and_arrow(self):
+        """Parquet/Arrow IPC 명부"""
+        self.roster.to_parquet(self.path('roster.parquet'), index=False)
+        self.roster.to_feather(self.path('roster.arrow'))
+        for name in ['roster.parquet', 'roster.arrow']:
+            chunks = list(self.handler.iter_employee_data(self.path(name), chunksize=50))
+            self.assertEqual([len(chunk) for chunk in chunks], [50, 50, 20])
+            pd.testing.assert_frame_equal(pd.concat(chunks), self.roster)
+    
+    @unittest.skipIf(HAS_PYARROW, 'pyarrow 설치됨')
+    def test_parquet_without_pyarrow(self):
+        """pyarrow가 없으면 ValueError"""
+        with open(self.path('roster.parquet'), 'wb') as f:
+            f.write(b'PAR1' + b'\0' * 16)
+        with self.assertRaises(ValueError):
+            self.handler.read_employee_data(self.path('roster.parquet'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""세후 -> 세전 역산 테스트"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.calculator import PayrollCalculator
+from payroll_generator.config import INSURANCE_LIMITS
+from payroll_generator.gross_up import solve_gross_salary
+
+
+class TestGrossUpSolver(unittest.TestCase):
+    """역산 솔버 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = PayrollCalculator()
+    
+    def net(self, base_salary, **inputs):
+        """행 단위 계산 실수령액 (비교 기준)"""
+        employee = {'기본급': base_salary, '상여금': inputs.get('bonus', 0),
+                    '부양가족수': inputs.get('dependents', 0)}
+        return self.calculator.calculate_net_pay(employee)
+    
+    def assert_exact(self, target, gross, **inputs):
+        """net(gross) >= 목표 > net(gross - 1)"""
+        self.assertGreaterEqual(self.net(gross, **inputs), target, f"목표 {target}")
+        if gross > 0:
+            self.assertLess(self.net(gross - 1, **inputs), target, f"목표 {target}")
+    
+    def test_scalar(self):
+        """스칼라 목표는 int 반환, 역산 결과로 다시 계산하면 목표 도달"""
+        gross = solve_gross_salary(3_000_000, self.calculator)
+        self.assertIsInstance(gross, int)
+        self.assert_exact(3_000_000, gross)
+    
+    def test_vectorized_targets(self):
+        """목표/부양가족/상여금 배열 전체를 한 번에 역산"""
+        rng = np.random.default_rng(1)
+        targets = rng.integers(0, 25_000_000, 500)
+        bonus = rng.choice([0, 1_000_000], 500)
+        dependents = rng.integers(0, 6, 500)
+        
+        grosses = solve_gross_salary(targets, self.calculator, bonus=bonus, dependents=dependents)
+        self.assertEqual(grosses.dtype, np.int64)
+        for target, gross, b, d in zip(targets, grosses, bonus, dependents):
+            self.assert_exact(int(target), int(gross), bonus=int(b), dependents=int(d))
+    
+    def test_around_insurance_cap(self):
+        """4대보험 상한액 전후 목표"""
+        limit = max(INSURANCE_LIMITS.values())
+        targets = [self.net(limit + offset) for offset in (-1_000, 0, 1, 1_000, 500_000)]
+        for target, gross in zip(targets, solve_gross_salary(targets, self.calculator)):
+            self.assert_exact(target, int(gross))
+    
+    def test_below_zero_salary_net(self):
+        """기본급 0원으로도 도달하는 목표는 0"""
+        self.assertEqual(solve_gross_salary(0, self.calculator), 0)
+        self.assertEqual(solve_gross_salary(100_000, self.calculator, bonus=500_000), 0)
+    
+    def test_invalid_target(self):
+        """숫자가 아닌 목표는 ValueError"""
+        with self.assertRaises(ValueError):
+            solve_gross_salary([1_000_000, float('nan')], self.calculator)
+
+
+if __name__ == '__main__':
+    unittest.main()
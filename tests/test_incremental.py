@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""증분 급여 계산 세션 테스트"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.calculator import PayrollCalculator
+from payroll_generator.incremental import IncrementalPayrollSession, TOTAL_KEYS
+from tests.test_calculator import make_roster
+
+
+class CountingCalculator(PayrollCalculator):
+    """행 단위/일괄 계산 호출 횟수를 세는 계산기"""
+    
+    def __init__(self, period=None):
+        super().__init__(period)
+        self.scalar_calls = 0
+        self.batch_rows = 0
+    
+    def calculate_deductions(self, employee_data):
+        self.scalar_calls += 1
+        return super().calculate_deductions(employee_data)
+    
+    def calculate_batch_records(self, df):
+        self.batch_rows += len(df)
+        return super().calculate_batch_records(df)
+
+
+class TestIncrementalPayrollSession(unittest.TestCase):
+    """증분 재계산 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = CountingCalculator()
+        self.employees = make_roster(200, seed=3).to_dict('records')
+        self.session = IncrementalPayrollSession(self.calculator).load(self.employees)
+    
+    def assert_consistent(self):
+        """결과/집계가 전체 재계산과 동일한지 확인"""
+        expected = [PayrollCalculator().calculate_deductions(e) for e in self.session.employees]
+        self.assertEqual(self.session.results, expected)
+        for name, key in TOTAL_KEYS.items():
+            self.assertEqual(self.session.totals[name], sum(r[key] for r in expected), name)
+    
+    def test_load(self):
+        """최초 적재는 일괄 계산"""
+        self.assertEqual(self.calculator.batch_rows, 200)
+        self.assert_consistent()
+    
+    def test_update_single_row(self):
+        """한 명 수정 시 그 행만 재계산"""
+        employee = dict(self.employees[10], 기본급=4_321_000)
+        result = self.session.update(10, employee)
+        
+        self.assertEqual(self.calculator.scalar_calls, 1)
+        self.assertEqual(result['기본급'], 4_321_000)
+        self.assert_consistent()
+    
+    def test_update_unchanged(self):
+        """계산 입력이 같으면 재계산하지 않음"""
+        self.session.update(5, dict(self.employees[5], 이름='새이름'))
+        self.assertEqual(self.calculator.scalar_calls, 0)
+    
+    def test_sync(self):
+        """명부 비교 후 바뀐 행/추가 행만 재계산, 삭제 행은 집계에서 제외"""
+        employees = [dict(e) for e in self.employees[:150]]
+        employees[3]['상여금'] = 777_000
+        employees[100]['부양가족수'] = 9
+        employees.append({'이름': '신규', '기본급': 2_000_000, '부양가족수': 0})
+        
+        changed = self.session.sync(employees)
+        self.assertEqual(changed, [3, 100, 150])
+        self.assertEqual(self.calculator.scalar_calls, 3)
+        self.assertEqual(len(self.session), 151)
+        self.assert_consistent()
+    
+    def test_load_with_previous_totals(self):
+        """저장된 결과와 집계로 복원 후 차이만 반영"""
+        restored = IncrementalPayrollSession(self.calculator).load(
+            self.session.employees, self.session.results, self.session.totals
+        )
+        restored.update(0, dict(self.employees[0], 기본급=0))
+        self.session = restored
+        self.assert_consistent()
+    
+    def test_invalid_position(self):
+        """명부 범위를 벗어난 위치는 IndexError"""
+        with self.assertRaises(IndexError):
+            self.session.update(500, {'기본급': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""대용량 명부 병렬 계산 테스트"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.calculator import PayrollCalculator
+from payroll_generator.config import env_int
+from payroll_generator.parallel import ParallelPayrollCalculator
+from tests.test_calculator import make_roster
+
+
+class TestParallelPayrollCalculator(unittest.TestCase):
+    """병렬 계산 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = ParallelPayrollCalculator(workers=2, chunk_size=700, min_rows=0)
+        self.roster = make_roster(5_000, seed=5)
+    
+    def test_matches_single_process(self):
+        """병렬 결과가 단일 프로세스 결과와 같고 입력 순서 유지"""
+        roster = self.roster.sample(frac=1, random_state=1)
+        expected = PayrollCalculator().calculate_batch(roster)
+        result = self.calculator.calculate_batch(roster)
+        pd.testing.assert_frame_equal(result, expected)
+    
+    def test_periods(self):
+        """행별 기간 요율도 동일하게 적용"""
+        roster = self.roster.assign(기간=['2023-06', '2024-03', None, '2025-01'] * 1_250)
+        expected = PayrollCalculator().calculate_batch_array(roster)
+        result = self.calculator.calculate_batch_array(roster)
+        self.assertTrue((result == expected).all())
+    
+    def test_small_roster_in_process(self):
+        """최소 행 수 미만은 워커 없이 계산"""
+        calculator = ParallelPayrollCalculator(workers=2, chunk_size=700)
+        calculator._run_chunks = None  # 호출되면 실패
+        self.assertEqual(len(calculator.calculate_batch(self.roster)), 5_000)
+    
+    def test_invalid_value(self):
+        """숫자가 아닌 값은 ValueError"""
+        roster = self.roster.astype({'기본급': object})
+        roster.loc[4_000, '기본급'] = '삼백만원'
+        with self.assertRaises(ValueError):
+            self.calculator.calculate_batch(roster)
+    
+    def test_env_workers(self):
+        """PAYROLL_WORKERS가 비어 있거나 잘못된 값이면 0 (CPU 코어 수)"""
+        with mock.patch.dict(os.environ, {'PAYROLL_WORKERS': '4'}):
+            self.assertEqual(env_int('PAYROLL_WORKERS', 0), 4)
+        for value in ['', '0', 'auto', '-2', '1.5']:
+            with mock.patch.dict(os.environ, {'PAYROLL_WORKERS': value}):
+                self.assertEqual(env_int('PAYROLL_WORKERS', 0), 0, value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""명부 파싱 캐시 테스트"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.excel_handler import ExcelHandler
+from payroll_generator.parse_cache import RosterParseCache
+from tests.test_calculator import make_roster
+
+
+class TestRosterParseCache(unittest.TestCase):
+    """파일 내용 해시 기반 캐시 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = RosterParseCache(os.path.join(self.temp_dir, 'cache'))
+        self.handler = ExcelHandler(cache=self.cache)
+        self.roster = make_roster(300, seed=7).assign(주민번호='900101', 입사일='2020-01-01')
+        self.path = os.path.join(self.temp_dir, 'roster.xlsx')
+        self.roster.to_excel(self.path, index=False)
+    
+    def tearDown(self):
+        """테스트 정리"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def cache_files(self):
+        return sorted(self.cache.cache_dir.glob('*.pkl'))
+    
+    def test_hit_by_content(self):
+        """내용이 같으면 경로가 달라도 캐시 사용, 결과는 매번 새 객체"""
+        first = self.handler.read_employee_data(self.path)
+        self.assertEqual(len(self.cache_files()), 1)
+        
+        copy_path = os.path.join(self.temp_dir, 'uploaded_roster.xlsx')
+        with open(self.path, 'rb') as src, open(copy_path, 'wb') as dst:
+            dst.write(src.read())
+        second = self.handler.read_employee_data(copy_path)
+        pd.testing.assert_frame_equal(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(len(self.cache_files()), 1)
+        self.assertEqual(self.handler.get_preview(copy_path, num_rows=2), first.head(2).to_dict('records'))
+    
+    def test_changed_content(self):
+        """내용이 바뀌면 새로 읽음"""
+        self.handler.read_employee_data(self.path)
+        self.roster.assign(기본급=1).to_excel(self.path, index=False)
+        df = self.handler.read_employee_data(self.path)
+        self.assertTrue((df['기본급'] == 1).all())
+        self.assertEqual(len(self.cache_files()), 2)
+    
+    def test_missing_column_not_cached(self):
+        """필수 컬럼 검증 실패는 캐시하지 않음"""
+        self.roster.drop(columns='기본급').to_excel(self.path, index=False)
+        with self.assertRaises(ValueError):
+            self.handler.read_employee_data(self.path)
+        self.assertEqual(self.cache_files(), [])
+    
+    def test_lru_eviction(self):
+        """크기 한도를 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        frame = pd.DataFrame({'값': range(1_000)})
+        for key in ['a', 'b', 'c']:
+            self.cache.put(key, frame)
+            time.sleep(0.01)
+        size = self.cache_files()[0].stat().st_size
+        self.cache.get('a')  # a를 최근 사용으로
+        time.sleep(0.01)
+        
+        self.cache.max_bytes = size * 2
+        self.cache.put('d', frame)
+        self.assertEqual([path.stem for path in self.cache_files()], ['a', 'd'])
+    
+    def test_corrupt_entry(self):
+        """읽을 수 없는 캐시 파일은 삭제하고 새로 읽음"""
+        self.handler.read_employee_data(self.path)
+        self.cache_files()[0].write_bytes(b'broken')
+        df = self.handler.read_employee_data(self.path)
+        self.assertEqual(len(df), 300)
+        self.assertIsNotNone(self.cache.get(self.handler._cache_key(self.path)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""실시간 미리보기 계산 캐시 테스트"""
+
+import os
+import sys
+import unittest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app import create_app
+from app.utils.preview_cache import PreviewCache, get_preview_cache, normalize_preview_input
+from payroll_generator.calculator import PayrollCalculator
+
+
+class TestPreviewCache(unittest.TestCase):
+    """미리보기 LRU 캐시 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.cache = PreviewCache(maxsize=2)
+        self.request = {'base_salary': 3_000_000, 'overtime_hours': 10, 'overtime_rate': 15_000,
+                        'bonus': 0, 'dependents': 1, 'period': '2024-05'}
+    
+    def test_normalize(self):
+        """빈 값/문자열 숫자/같은 시행일 기간은 같은 키"""
+        same = {'base_salary': '3000000', 'overtime_hours': 10.0, 'overtime_rate': 15_000,
+                'bonus': '', 'dependents': 1, 'period': '2024년 11월'}
+        self.assertEqual(normalize_preview_input(self.request), normalize_preview_input(same))
+        self.assertNotEqual(normalize_preview_input(self.request),
+                            normalize_preview_input(dict(self.request, period='2023-05')))
+        with self.assertRaises(ValueError):
+            normalize_preview_input({'base_salary': '삼백만원'})
+    
+    def test_hit_and_miss(self):
+        """같은 입력은 캐시 적중, 결과는 계산기와 동일"""
+        first = self.cache.calculate(self.request)
+        second = self.cache.calculate(dict(self.request, period='2024-06'))
+        self.assertEqual(first, second)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+        
+        expected = PayrollCalculator('2024-05').calculate_deductions({
+            '기본급': 3_000_000, '연장근무시간': 10, '연장근무단가': 15_000, '상여금': 0, '부양가족수': 1
+        })
+        self.assertEqual(first, expected)
+    
+    def test_returns_copy(self):
+        """반환된 결과를 수정해도 캐시는 그대로"""
+        self.cache.calculate(self.request)['실수령액'] = -1
+        self.assertNotEqual(self.cache.calculate(self.request)['실수령액'], -1)
+    
+    def test_lru_eviction(self):
+        """최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        for base_salary in (1_000_000, 2_000_000, 1_000_000, 3_000_000):
+            self.cache.calculate({'base_salary': base_salary})
+        self.assertEqual(self.cache.stats()['size'], 2)
+        
+        self.cache.calculate({'base_salary': 1_000_000})  # 최근 사용 -> 유지
+        self.cache.calculate({'base_salary': 2_000_000})  # 제거됨 -> 미적중
+        stats = self.cache.stats()
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 4)
+    
+    def test_invalid_maxsize(self):
+        """최대 크기가 1보다 작으면 ValueError"""
+        for maxsize in (0, -1):
+            with self.assertRaises(ValueError):
+                PreviewCache(maxsize=maxsize)
+    
+    def test_clear(self):
+        """초기화 시 항목과 카운터 모두 초기화"""
+        self.cache.calculate(self.request)
+        self.cache.clear()
+        self.assertEqual(self.cache.stats(), {'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'size': 0, 'maxsize': 2})
+
+
+class TestPreviewRoute(unittest.TestCase):
+    """미리보기 엔드포인트 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.app = create_app('testing')
+        self.client = self.app.test_client()
+        get_preview_cache().clear()
+    
+    def test_preview_uses_shared_cache(self):
+        """반복 요청은 워커 공유 캐시에서 응답"""
+        payload = {'base_salary': 2_500_000, 'dependents': 2}
+        first = self.client.post('/input/preview', json=payload).get_json()
+        second = self.client.post('/input/preview', json=payload).get_json()
+        self.assertTrue(first['success'])
+        self.assertEqual(first['payroll_data'], second['payroll_data'])
+        
+        stats = self.client.get('/input/preview/stats').get_json()['stats']
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+    
+    def test_preview_invalid_input(self):
+        """숫자가 아닌 입력은 400"""
+        response = self.client.post('/input/preview', json={'base_salary': '삼백만원'})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.get_json()['success'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""입사/퇴사 월 일할 계산 테스트"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.calculator import PayrollCalculator, RESULT_COLUMNS
+from payroll_generator.proration import prorate_roster
+
+
+class TestProration(unittest.TestCase):
+    """일할 계산 테스트 (2025년 3월, 31일)"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = PayrollCalculator('2025-03')
+        self.roster = pd.DataFrame({
+            '이름': ['재직', '1일입사', '중도입사', '중도퇴사', '말일퇴사', '다음달입사', '전월퇴사', '날짜오류'],
+            '입사일': ['2020-01-01', '2025-03-01', '2025-03-16', '2019-05-01', '2021-07-01',
+                    '2025-04-02', '2018-01-01', '미정'],
+            '퇴사일': [None, None, None, '2025-03-10', '2025-03-31', None, '2025-02-28', None],
+            '기본급': [3_100_000] * 8,
+            '연장근무시간': [0, 0, 4, 0, 0, 0, 0, 0],
+            '연장근무단가': [0, 0, 20_000, 0, 0, 0, 0, 0],
+            '상여금': [0, 0, 0, 500_000, 0, 0, 0, 0],
+            '부양가족수': [1] * 8,
+        })
+        self.prorated = prorate_roster(self.roster, '2025-03').set_index('이름')
+    
+    def test_worked_days_and_amounts(self):
+        """근무일수만큼 기본급 일할, 상여금/연장근무는 그대로"""
+        self.assertEqual(self.prorated['근무일수'].tolist(), [31, 31, 16, 10, 31, 0, 0, 31])
+        self.assertEqual(self.prorated['기본급'].tolist(),
+                         [3_100_000, 3_100_000, 1_600_000, 1_000_000, 3_100_000, 0, 0, 3_100_000])
+        self.assertEqual(self.prorated.loc['중도퇴사', '상여금'], 500_000)
+        self.assertEqual(self.prorated['보수월액'].tolist(), [3_100_000] * 8)
+    
+    def test_mixed_date_formats(self):
+        """날짜 형식이 섞인 컬럼도 값마다 해석해 일할"""
+        roster = self.roster.copy()
+        roster.loc[1::2, '입사일'] = roster.loc[1::2, '입사일'].str.replace('-', '/')
+        roster['퇴사일'] = roster['퇴사일'].str.replace('-', '.')
+        prorated = prorate_roster(roster, '2025-03').set_index('이름')
+        self.assertEqual(prorated['근무일수'].tolist(), self.prorated['근무일수'].tolist())
+        self.assertEqual(prorated['기본급'].tolist(), self.prorated['기본급'].tolist())
+    
+    def test_insurance_eligibility(self):
+        """입사월/퇴사월 보험 부과 여부"""
+        flags = self.prorated[['국민연금부과', '건강보험부과', '고용보험부과']]
+        self.assertEqual(flags.loc['재직'].tolist(), [1, 1, 1])
+        self.assertEqual(flags.loc['1일입사'].tolist(), [1, 1, 1])
+        self.assertEqual(flags.loc['중도입사'].tolist(), [0, 0, 1])
+        self.assertEqual(flags.loc['중도퇴사'].tolist(), [1, 0, 1])
+        self.assertEqual(flags.loc['말일퇴사'].tolist(), [1, 1, 1])
+        self.assertEqual(flags.loc['다음달입사'].tolist(), [0, 0, 0])
+        self.assertEqual(flags.loc['날짜오류'].tolist(), [1, 1, 1])
+    
+    def test_calculation(self):
+        """일할 명부 계산 (보수월액 기준 국민연금, 행 단위/일괄 결과 동일)"""
+        batch = self.calculator.calculate_batch(self.prorated)
+        for name, employee in self.prorated.iterrows():
+            expected = self.calculator.calculate_deductions(employee.to_dict())
+            self.assertEqual([expected[col] for col in RESULT_COLUMNS], batch.loc[name].tolist(), name)
+        
+        full = self.calculator.calculate_deductions({'기본급': 3_100_000})
+        leaver = batch.loc['중도퇴사']
+        self.assertEqual(leaver['국민연금'], full['국민연금'])
+        self.assertEqual(leaver['건강보험'], 0)
+        self.assertEqual(leaver['장기요양'], 0)
+        self.assertEqual(leaver['고용보험'], self.calculator.calculate_insurance(1_000_000, 'employment_insurance'))
+        self.assertEqual(batch.loc['재직'].tolist(), batch.loc['1일입사'].tolist())
+        self.assertEqual(batch.loc['다음달입사', '실수령액'], 0)
+    
+    def test_existing_flags_kept(self):
+        """기존 부과 여부 0은 유지"""
+        roster = self.roster.assign(고용보험부과=[0] + [None] * 7)
+        prorated = prorate_roster(roster, '2025-03')
+        self.assertEqual(prorated['고용보험부과'].tolist(), [0, 1, 1, 1, 1, 0, 0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""급여 계산 결과 타입 테스트"""
+
+import pickle
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.calculator import PayrollCalculator, RESULT_COLUMNS
+from payroll_generator.result import PayrollResult, RESULT_DTYPE, results_to_array
+from tests.test_calculator import make_roster
+
+
+class TestPayrollResult(unittest.TestCase):
+    """PayrollResult 딕셔너리 호환성 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = PayrollCalculator()
+        self.employee = {'기본급': 3_200_000, '연장근무시간': 12, '연장근무단가': 20_000,
+                         '상여금': 300_000, '부양가족수': 2}
+    
+    def test_dict_compatible(self):
+        """한글 키 조회/반복/비교가 결과 딕셔너리와 동일"""
+        expected = self.calculator.calculate_deductions(self.employee)
+        result = self.calculator.calculate_result(self.employee)
+        
+        self.assertEqual(result, expected)
+        self.assertEqual(list(result), RESULT_COLUMNS)
+        self.assertEqual(result['실수령액'], expected['실수령액'])
+        self.assertEqual(result.get('없는키', 0), 0)
+        self.assertEqual(result.to_dict(), expected)
+        self.assertEqual(result.net_pay, expected['실수령액'])
+        with self.assertRaises(KeyError):
+            result['없는키']
+    
+    def test_slots(self):
+        """__slots__ 객체 (인스턴스 딕셔너리 없음), 피클 가능"""
+        result = self.calculator.calculate_result(self.employee)
+        self.assertFalse(hasattr(result, '__dict__'))
+        self.assertEqual(pickle.loads(pickle.dumps(result)).as_tuple(), result.as_tuple())
+    
+    def test_integer_fields(self):
+        """필드는 원 단위 정수"""
+        result = PayrollResult.from_mapping({'기본급': 1_000_000.0, '연장근무수당': 22_500.5})
+        self.assertIsInstance(result.base_salary, int)
+        self.assertEqual(result.overtime_pay, 22_500)
+        self.assertEqual(result.net_pay, 0)
+
+
+class TestBatchRecordArray(unittest.TestCase):
+    """일괄 계산 구조화 배열 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = PayrollCalculator()
+        self.df = make_roster(300, seed=7)
+    
+    def test_array_matches_records(self):
+        """구조화 배열이 딕셔너리 결과와 동일"""
+        records = self.calculator.calculate_batch_array(self.df)
+        self.assertEqual(records.dtype, RESULT_DTYPE)
+        self.assertEqual(len(records), len(self.df))
+        
+        expected = self.calculator.calculate_batch_records(self.df)
+        np.testing.assert_array_equal(records.net_pay, [row['실수령액'] for row in expected])
+        np.testing.assert_array_equal(results_to_array(expected), records)
+    
+    def test_results_match_scalar(self):
+        """PayrollResult 리스트가 행 단위 계산과 동일"""
+        results = self.calculator.calculate_batch_results(self.df)
+        for (idx, row), result in zip(self.df.iterrows(), results):
+            self.assertEqual(result, self.calculator.calculate_deductions(row.to_dict()), f"행 {idx} 결과 불일치")
+    
+    def test_empty(self):
+        """빈 명부"""
+        self.assertEqual(len(self.calculator.calculate_batch_array(self.df.iloc[:0])), 0)
+        self.assertEqual(len(results_to_array([])), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""연도별 급여 계산 규칙 테스트"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.calculator import PayrollCalculator
+from payroll_generator.config import RATE_REGISTRY
+from payroll_generator.rules import (
+    compile_rule_set,
+    get_rule_set,
+    normalize_period,
+    resolve_effective_date
+)
+
+
+class TestRateRegistry(unittest.TestCase):
+    """요율 레지스트리/규칙 컴파일 테스트"""
+    
+    def test_normalize_period(self):
+        """기간 형식 정규화"""
+        self.assertEqual(normalize_period('2024-03'), '2024-03-01')
+        self.assertEqual(normalize_period('2024-03-15'), '2024-03-01')
+        self.assertEqual(normalize_period('2023년 12월'), '2023-12-01')
+        with self.assertRaises(ValueError):
+            normalize_period('2024-13')
+        with self.assertRaises(ValueError):
+            normalize_period('지난달')
+    
+    def test_resolve_effective_date(self):
+        """기간에 맞는 시행일 선택 (등록 이전 기간은 가장 이른 시행일)"""
+        self.assertEqual(resolve_effective_date('2023-06'), '2023-01-01')
+        self.assertEqual(resolve_effective_date('2024-01'), '2024-01-01')
+        self.assertEqual(resolve_effective_date('2025-07'), '2024-01-01')
+        self.assertEqual(resolve_effective_date('2019-01'), min(RATE_REGISTRY))
+    
+    def test_rule_set_cached_per_effective_date(self):
+        """같은 시행일의 기간은 같은 RuleSet을 공유"""
+        self.assertIs(get_rule_set('2024-02'), get_rule_set('2024-11'))
+        self.assertIsNot(get_rule_set('2023-05'), get_rule_set('2024-05'))
+        self.assertEqual(get_rule_set('2023-05').long_term_care_ratio,
+                         RATE_REGISTRY['2023-01-01']['long_term_care_ratio'])
+    
+    def test_rule_set_read_only(self):
+        """컴파일된 규칙은 수정할 수 없음"""
+        rules = get_rule_set('2024-01')
+        with self.assertRaises(TypeError):
+            rules.insurance_rates['national_pension'] = 0
+        with self.assertRaises(ValueError):
+            rules.rates[0] = 0
+    
+    def test_invalid_period_falls_back(self):
+        """잘못된 기간은 현재 요율로 계산"""
+        calculator = PayrollCalculator('잘못된 기간')
+        self.assertIs(calculator.rules, get_rule_set())
+
+
+class TestMixedPeriodBatch(unittest.TestCase):
+    """여러 기간이 섞인 일괄 계산 테스트"""
+    
+    def test_mixed_periods_match_scalar(self):
+        """기간 컬럼이 있으면 행마다 해당 기간 요율로 계산"""
+        df = pd.DataFrame({
+            '기본급': [3_000_000, 3_000_000, 4_500_000, 2_000_000],
+            '상여금': [0, 0, 500_000, 0],
+            '부양가족수': [1, 1, 2, 0],
+            '기간': ['2023-05', '2024-05', '2023년 12월', None],
+        }, index=[10, 20, 30, 40])
+        
+        batch = PayrollCalculator().calculate_batch(df)
+        self.assertEqual(list(batch.index), [10, 20, 30, 40])
+        
+        for (idx, row), record in zip(df.iterrows(), batch.to_dict('records')):
+            expected = PayrollCalculator(row['기간']).calculate_deductions(row.to_dict())
+            self.assertEqual(record, expected, f"행 {idx} 결과 불일치")
+        self.assertNotEqual(batch.loc[10, '장기요양'], batch.loc[20, '장기요양'])
+    
+    def test_compile_once_per_effective_date(self):
+        """시행일별 규칙 컴파일은 한 번만 수행"""
+        compile_rule_set.cache_clear()
+        df = pd.DataFrame({
+            '기본급': [3_000_000] * 24,
+            '부양가족수': [1] * 24,
+            '기간': [f'{year}-{month:02d}' for year in (2023, 2024) for month in range(1, 13)],
+        })
+        PayrollCalculator('2024-01').calculate_batch(df)
+        self.assertEqual(compile_rule_set.cache_info().misses, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
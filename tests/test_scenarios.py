@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""요율 변경 가정 시나리오 테스트"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.calculator import PayrollCalculator
+from payroll_generator.config import ANNUAL_INCOME_TAX_TABLE
+from payroll_generator.rules import derive_rule_set
+from payroll_generator.scenarios import evaluate_scenarios, scenario_grid, SCENARIO_TOTAL_COLUMNS
+from tests.test_calculator import make_roster
+
+
+class TestScenarioGrid(unittest.TestCase):
+    """시나리오 계산 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = PayrollCalculator()
+        self.roster = make_roster(500, seed=11)
+    
+    def expected_totals(self, overrides):
+        """시나리오 규칙으로 일괄 계산한 합계 (비교 기준)"""
+        calculator = PayrollCalculator()
+        calculator.rules = derive_rule_set(calculator.rules, overrides)
+        return calculator.calculate_batch(self.roster)[SCENARIO_TOTAL_COLUMNS].sum()
+    
+    def test_matches_batch_totals(self):
+        """시나리오별 합계가 일괄 계산 합계와 동일"""
+        scenarios = scenario_grid({
+            ('insurance_rates', 'national_pension'): [0.045, 0.0475, 0.05],
+            ('insurance_limits', 'national_pension'): [5_530_000, 6_170_000],
+            'long_term_care_ratio': [0.1295, 0.14],
+        })
+        scenarios['세율표 변경'] = {'income_tax_table': ANNUAL_INCOME_TAX_TABLE, 'local_tax_rate': 0.12}
+        
+        result = evaluate_scenarios(self.roster, scenarios, self.calculator, chunk_size=128)
+        self.assertEqual(len(result), len(scenarios) + 1)
+        self.assertEqual(list(result.columns), SCENARIO_TOTAL_COLUMNS)
+        for name, overrides in [('기준', {})] + list(scenarios.items()):
+            self.assertEqual(result.loc[name].tolist(), self.expected_totals(overrides).tolist(), name)
+    
+    def test_grid_names(self):
+        """조합별 이름과 변경 사항"""
+        scenarios = scenario_grid({
+            ('insurance_rates', 'health_insurance'): [0.035, 0.036],
+            'local_tax_rate': [0.1],
+        })
+        self.assertEqual(scenarios, {
+            'insurance_rates.health_insurance=0.035, local_tax_rate=0.1':
+                {'insurance_rates': {'health_insurance': 0.035}, 'local_tax_rate': 0.1},
+            'insurance_rates.health_insurance=0.036, local_tax_rate=0.1':
+                {'insurance_rates': {'health_insurance': 0.036}, 'local_tax_rate': 0.1},
+        })
+    
+    def test_list_scenarios(self):
+        """리스트로 준 시나리오는 순서대로 이름 부여"""
+        result = evaluate_scenarios(self.roster, [{}, {'local_tax_rate': 0.2}])
+        self.assertEqual(list(result.index), ['기준', '시나리오1', '시나리오2'])
+        self.assertEqual(result.loc['기준'].tolist(), result.loc['시나리오1'].tolist())
+    
+    def test_unknown_insurance_type(self):
+        """기준에 없는 보험 종류는 ValueError"""
+        with self.assertRaises(ValueError):
+            evaluate_scenarios(self.roster, [{'insurance_rates': {'unknown': 0.01}}])
+
+
+if __name__ == '__main__':
+    unittest.main()
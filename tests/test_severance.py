@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""퇴직금 계산 테스트"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.calculator import PayrollCalculator
+from payroll_generator.history_manager import EmployeeHistoryManager
+from payroll_generator.proration import prorate_roster
+from payroll_generator.severance import SeveranceCalculator, calculate_severance
+from tests.test_calculator import make_roster
+
+
+class TestSeveranceCalculator(unittest.TestCase):
+    """퇴직금 계산 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = SeveranceCalculator()
+        months = [f'2024-{month:02d}' for month in range(1, 13)]
+        self.history = pd.DataFrame({
+            '이름': ['A'] * 12 + ['B'] * 3,
+            '기간': months + months[-3:],
+            '총지급액': [3_000_000] * 11 + [4_000_000] + [5_000_000] * 3,
+            '상여금': [0] * 11 + [1_200_000] + [0] * 3,
+        })
+        self.leavers = pd.DataFrame({
+            '이름': ['A', 'B', 'C', 'D'],
+            '입사일': ['2020-03-01', '2024-06-01', '2019-01-01', None],
+            '퇴사일': ['2024-12-31', '2024-12-31', '2024-11-15', '2024-12-31'],
+            '기본급': [3_000_000, 5_000_000, 2_500_000, 0],
+        })
+    
+    def test_average_wage(self):
+        """3개월 임금 + 상여금 3/12 가산, 통상임금이 더 크면 통상임금 적용"""
+        result = self.calculator.calculate(self.leavers, self.history)
+        a = result.loc['A']
+        self.assertEqual(a['근속일수'], 1767)
+        self.assertEqual(a['산정기간일수'], 92)                      # 10/1 ~ 12/31
+        self.assertEqual(a['3개월임금총액'], 8_800_000)               # 상여금 제외
+        self.assertEqual(a['상여금가산액'], 300_000)                  # 1,200,000 × 3/12
+        self.assertEqual(a['1일평균임금'], 9_100_000 // 92)
+        self.assertEqual(a['1일통상임금'], 3_000_000 * 8 // 209)
+        self.assertEqual(a['퇴직금'], a['1일통상임금'] * 30 * 1767 // 365)
+    
+    def test_eligibility_and_invalid_dates(self):
+        """근속 1년 미만, 날짜 오류는 0"""
+        result = self.calculator.calculate(self.leavers, self.history)
+        self.assertEqual(result.loc['B', '퇴직금'], 0)
+        self.assertGreater(result.loc['B', '1일평균임금'], 0)
+        self.assertTrue((result.loc['D'] == 0).all())
+    
+    def test_partial_month_window(self):
+        """월 중 퇴사는 산정기간 첫 달만 일할, 퇴사 월은 이미 일할된 이력 금액 그대로"""
+        history = pd.DataFrame({
+            '이름': ['E'] * 4,
+            '기간': ['2024-09', '2024-10', '2024-11', '2024-12'],
+            '총지급액': [3_000_000, 3_100_000, 3_000_000, 1_500_000],  # 12월은 15일분
+        })
+        leavers = pd.DataFrame({'이름': ['E'], '입사일': ['2020-01-01'], '퇴사일': ['2024-12-15']})
+        result = self.calculator.calculate(leavers, history).loc['E']
+        self.assertEqual(result['산정기간일수'], 91)                  # 9/16 ~ 12/15
+        self.assertEqual(result['3개월임금총액'], 3_000_000 * 15 // 30 + 3_100_000 + 3_000_000 + 1_500_000)
+    
+    def test_prorated_leave_month(self):
+        """prorate_roster로 일할 계산해 저장한 퇴사 월을 다시 일할하지 않음"""
+        roster = pd.DataFrame({'이름': ['F'], '입사일': ['2020-01-01'], '퇴사일': ['2025-03-15'],
+                               '기본급': [3_100_000], '부양가족수': [1]})
+        periods = ['2024-12', '2025-01', '2025-02', '2025-03']
+        history = pd.concat([
+            PayrollCalculator(period).calculate_batch(prorate_roster(roster, period)).assign(이름='F', 기간=period)
+            for period in periods
+        ], ignore_index=True)
+        self.assertEqual(history['총지급액'].iloc[-1], 1_500_000)   # 3/1 ~ 3/15
+        
+        result = self.calculator.calculate(roster, history).loc['F']
+        self.assertEqual(result['3개월임금총액'], 3_100_000 * 16 // 31 + 3_100_000 * 2 + 1_500_000)
+    
+    def test_hire_in_window(self):
+        """산정기간 첫 달에 입사했으면 입사 월의 이력 금액은 재직 일수 기준으로 일할"""
+        history = pd.DataFrame({
+            '이름': ['G'] * 4,
+            '기간': ['2024-09', '2024-10', '2024-11', '2024-12'],
+            '총지급액': [1_000_000, 3_000_000, 3_000_000, 3_000_000],  # 9/21 입사, 10일분
+        })
+        leavers = pd.DataFrame({'이름': ['G'], '입사일': ['2024-09-21'], '퇴사일': ['2024-12-15']})
+        result = self.calculator.calculate(leavers, history).loc['G']
+        self.assertEqual(result['3개월임금총액'], 1_000_000 + 3_000_000 * 2 + 3_000_000)
+    
+    def test_history_file(self):
+        """직원별 이력 파일에 저장한 계산 결과로 퇴직금 계산"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manager = EmployeeHistoryManager(os.path.join(temp_dir, 'history.csv'))
+            roster = make_roster(50, seed=4)
+            for period in ['2024-10', '2024-11', '2024-12', '2024-12']:
+                manager.save_period(period, roster, PayrollCalculator(period).calculate_batch(roster))
+            history = manager.load(employees=['직원1', '직원2'])
+            self.assertEqual(len(history), 6)
+            
+            leavers = pd.DataFrame({'이름': ['직원1'], '입사일': ['2015-01-01'], '퇴사일': ['2024-12-31']})
+            result = calculate_severance(leavers, history)
+            payment = roster.loc[1, '기본급'] + roster.loc[1, '연장근무시간'] * roster.loc[1, '연장근무단가']
+            self.assertEqual(result.loc['직원1', '3개월임금총액'], payment * 3)
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    def test_history_file_subsets(self):
+        """같은 기간을 직원 일부씩 나눠 저장해도 다른 직원의 행은 유지, 같은 직원 행만 교체"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manager = EmployeeHistoryManager(os.path.join(temp_dir, 'history.csv'))
+            roster = make_roster(10, seed=5)
+            results = PayrollCalculator('2024-12').calculate_batch(roster)
+            manager.save_period('2024-12', roster.iloc[:6], results.iloc[:6])
+            manager.save_period('2024-12', roster.iloc[4:], results.iloc[4:])
+            
+            history = manager.load()
+            self.assertEqual(sorted(history['이름']), sorted(roster['이름']))
+            self.assertEqual(history.set_index('이름').loc[roster['이름'], '실수령액'].tolist(),
+                             results['실수령액'].tolist())
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    def test_history_file_duplicate_names(self):
+        """동명이인이 있는 명부는 이름 기준 이력에 저장하지 않음 (고유 컬럼을 key로 지정하면 저장)"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, 'history.csv')
+            roster = make_roster(4, seed=6)
+            results = PayrollCalculator('2024-12').calculate_batch(roster)
+            EmployeeHistoryManager(path).save_period('2024-11', roster, results)
+            
+            roster['이름'] = ['홍길동', '김철수', '홍길동', '이영희']
+            with self.assertRaises(ValueError):
+                EmployeeHistoryManager(path).save_period('2024-12', roster, results)
+            self.assertEqual(EmployeeHistoryManager(path).load()['기간'].unique().tolist(), ['2024-11'])
+            
+            roster['사번'] = ['E1', 'E2', 'E3', 'E4']
+            manager = EmployeeHistoryManager(os.path.join(temp_dir, 'by_id.csv'), key='사번')
+            manager.save_period('2024-12', roster, results)
+            self.assertEqual(manager.load(employees=['E3'])['실수령액'].tolist(), [results.loc[2, '실수령액']])
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    def test_missing_column(self):
+        """필수 컬럼이 없으면 ValueError"""
+        with self.assertRaises(ValueError):
+            self.calculator.calculate(self.leavers.drop(columns='퇴사일'), self.history)
+
+
+if __name__ == '__main__':
+    unittest.main()
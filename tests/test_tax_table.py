@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""간이세액표 엔진 테스트
+
+실제 국세청 세액표 대신 같은 형식의 작은 테스트용 표를 만들어 사용합니다.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.calculator import PayrollCalculator
+from payroll_generator.tax_table import (
+    WithholdingTable,
+    compile_withholding_table,
+    load_withholding_table
+)
+
+
+def write_sample_csv(path):
+    """테스트용 간이세액표 CSV 작성 (1,000,000원 ~ 10,000,000원, 구간 폭 5천/1만/2만원)"""
+    rows = []
+    lower = 1_000_000
+    while lower < 10_000_000:
+        width = 5_000 if lower < 1_500_000 else 10_000 if lower < 3_000_000 else 20_000
+        upper = lower + width
+        taxes = [max(0, (lower - 1_000_000) // 10 - 10_000 * dep) // 10 * 10 for dep in range(11)]
+        rows.append([lower, upper] + taxes)
+        lower = upper
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('하한,상한,' + ','.join(f'{n}명' for n in range(1, 12)) + '\n')
+        for row in rows:
+            f.write(','.join(f'"{value:,}"' for value in row) + '\n')
+    return rows
+
+
+class TestWithholdingTable(unittest.TestCase):
+    """간이세액표 컴파일/조회 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp(prefix='withholding_test_')
+        self.csv_path = os.path.join(self.temp_dir, 'withholding_table.csv')
+        self.cache_path = os.path.join(self.temp_dir, 'withholding_table.npy')
+        self.rows = write_sample_csv(self.csv_path)
+        load_withholding_table.cache_clear()
+    
+    def tearDown(self):
+        """테스트 정리"""
+        load_withholding_table.cache_clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_compile_and_cache(self):
+        """CSV 컴파일 후 int32 .npy 캐시를 메모리 매핑으로 재사용"""
+        table = compile_withholding_table(self.csv_path, self.cache_path)
+        self.assertEqual(table.dtype, np.int32)
+        self.assertEqual(table.shape, (len(self.rows), 13))
+        self.assertTrue(os.path.exists(self.cache_path))
+        
+        loaded = load_withholding_table(self.csv_path, self.cache_path)
+        self.assertIsInstance(loaded.table, np.memmap)
+        np.testing.assert_array_equal(np.asarray(loaded.table), table)
+    
+    def test_recompile_when_csv_is_newer(self):
+        """CSV가 캐시보다 최신이면 다시 컴파일"""
+        compile_withholding_table(self.csv_path, self.cache_path)
+        past = time.time() - 60
+        os.utime(self.cache_path, (past, past))
+        
+        loaded = load_withholding_table(self.csv_path, self.cache_path)
+        self.assertNotIsInstance(loaded.table, np.memmap)
+        self.assertGreater(os.path.getmtime(self.cache_path), past)
+    
+    def test_lookup(self):
+        """구간/부양가족수별 조회 (단건, 배열)"""
+        table = WithholdingTable(compile_withholding_table(self.csv_path, self.cache_path))
+        self.assertEqual(table.unit, 5_000)
+        
+        samples = [(999_999, 0), (1_000_000, 0), (1_499_999, 2), (2_345_678, 1), (9_999_999, 10), (9_999_999, 20)]
+        for salary, dependents in samples:
+            expected = 0
+            for row in self.rows:
+                if row[0] <= salary < row[1]:
+                    expected = row[2 + min(dependents, 10)]
+            self.assertEqual(table.tax(salary, dependents), expected, f"{salary}, {dependents}")
+        
+        salaries = np.array([s for s, _ in samples])
+        dependents = np.array([d for _, d in samples])
+        expected = [table.tax(s, d) for s, d in samples]
+        self.assertEqual(table.tax_array(salaries, dependents).tolist(), expected)
+    
+    def test_above_table(self):
+        """상한 초과분은 최상위 구간 세액에 초과분 산식을 더함"""
+        table = WithholdingTable(compile_withholding_table(self.csv_path, self.cache_path))
+        top = self.rows[-1][2]
+        self.assertEqual(table.tax(10_000_000, 0), top + 25_000)
+        self.assertGreater(table.tax(20_000_000, 0), table.tax(12_000_000, 0))
+        salaries = np.array([10_000_000, 12_000_000, 50_000_000, 100_000_000])
+        self.assertEqual(table.tax_array(salaries, np.zeros(4)).tolist(),
+                         [table.tax(s, 0) for s in salaries])
+    
+    def test_missing_source(self):
+        """CSV와 캐시가 모두 없으면 None"""
+        missing = os.path.join(self.temp_dir, 'missing.csv')
+        self.assertIsNone(load_withholding_table(missing, os.path.join(self.temp_dir, 'missing.npy')))
+    
+    def test_calculator_uses_table(self):
+        """간이세액표가 있으면 단건/일괄 계산 모두 세액표로 소득세 계산"""
+        calculator = PayrollCalculator()
+        calculator.withholding = WithholdingTable(compile_withholding_table(self.csv_path, self.cache_path))
+        
+        employee = {'기본급': 2_500_000, '부양가족수': 1, '상여금': 100_000}
+        result = calculator.calculate_deductions(employee)
+        self.assertEqual(result['소득세'], calculator.withholding.tax(2_600_000, 1))
+        
+        batch = calculator.calculate_batch_records(pd.DataFrame([employee]))
+        self.assertEqual(batch[0], result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""템플릿 원형 캐시 테스트"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import openpyxl
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.calculator import PayrollCalculator
+from payroll_generator.excel_handler import ExcelHandler
+from payroll_generator.template_cache import clear_template_prototypes, get_template_prototype
+from payroll_generator.templates.designs.template_design import TemplateDesign
+from payroll_generator.templates.designs.template_sample1 import TemplateSample1
+from payroll_generator.templates.designs.template_sample2 import TemplateSample2
+
+
+def sheet_state(path, index=0):
+    """저장된 명세서(index번째 시트)의 셀 값/서식 (비교용)"""
+    ws = openpyxl.load_workbook(path).worksheets[index]
+    cells = {cell.coordinate: (cell.value, cell.number_format, cell.font.b, cell.fill.fgColor.rgb)
+             for row in ws.iter_rows() for cell in row}
+    return cells, sorted(str(merged) for merged in ws.merged_cells.ranges)
+
+
+class TestTemplatePrototype(unittest.TestCase):
+    """템플릿 원형 재사용 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        clear_template_prototypes()
+        calculator = PayrollCalculator('2025-01')
+        self.employees = [
+            ({'이름': name, '주민번호': '900101-1234567', '입사일': '2020-01-01'},
+             calculator.calculate_deductions({'기본급': salary, '부양가족수': 1, '상여금': bonus}))
+            for name, salary, bonus in [('홍길동', 3_000_000, 500_000), ('김철수', 2_500_000, 0)]
+        ]
+
+    def tearDown(self):
+        """테스트 정리"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        clear_template_prototypes()
+
+    def write_all(self, write, prefix):
+        paths = []
+        for employee_data, payroll_data in self.employees:
+            path = os.path.join(self.temp_dir, f"{prefix}_{employee_data['이름']}.xlsx")
+            write(payroll_data, employee_data, path)
+            paths.append(path)
+        return paths
+
+    def assert_same_as_fresh(self, write):
+        """재사용한 원형으로 만든 명세서 = 새로 읽은 템플릿으로 만든 명세서"""
+        reused = self.write_all(write, 'reused')
+        for (employee_data, payroll_data), path in zip(self.employees, reused):
+            clear_template_prototypes()
+            fresh = os.path.join(self.temp_dir, f"fresh_{employee_data['이름']}.xlsx")
+            write(payroll_data, employee_data, fresh)
+            self.assertEqual(sheet_state(path), sheet_state(fresh))
+
+    def test_excel_handler(self):
+        """기본 템플릿 명세서"""
+        handler = ExcelHandler()
+        self.assert_same_as_fresh(
+            lambda payroll, employee, path: handler.write_payroll(payroll, path, employee, '2025-01'))
+
+    def test_designs(self):
+        """템플릿 디자인 명세서"""
+        for design in [TemplateSample1(), TemplateSample2()]:
+            self.assert_same_as_fresh(
+                lambda payroll, employee, path: design.generate_excel(payroll, employee, path, '2025-01'))
+
+    def test_loaded_once_and_restored_on_error(self):
+        """같은 파일은 한 번만 로드, 예외가 나도 원래 값으로 복원, 파일이 바뀌면 다시 로드"""
+        source = TemplateSample1()._get_template_path()
+        path = os.path.join(self.temp_dir, 'template.xlsx')
+        with open(source, 'rb') as src, open(path, 'wb') as dst:
+            dst.write(src.read())
+
+        prototype = get_template_prototype(path)
+        self.assertIs(get_template_prototype(path), prototype)
+
+        ws = prototype.workbook.active
+        original = ws['B4'].value
+        with self.assertRaises(RuntimeError):
+            with prototype.checkout() as wb:
+                wb.active['B4'] = '변경'
+                wb.active['Z99'] = '새 셀'
+                raise RuntimeError
+        self.assertEqual(ws['B4'].value, original)
+        self.assertNotIn((99, 26), ws._cells)
+
+        os.utime(path, ns=(0, 0))
+        self.assertIsNot(get_template_prototype(path), prototype)
+
+    def test_template_path_memoized(self):
+        """템플릿 경로는 한 번만 검색"""
+        TemplateDesign._template_paths.clear()
+        design = TemplateSample2()
+        path = design._get_template_path()
+        design._find_template_path = lambda: self.fail('경로를 다시 검색했습니다')
+        self.assertEqual(design._get_template_path(), path)
+        self.assertEqual(TemplateSample2()._get_template_path(), path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""템플릿 XML 직접 채우기(스탬핑) 테스트"""
+
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import openpyxl
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.calculator import PayrollCalculator
+from payroll_generator.excel_handler import ExcelHandler
+from payroll_generator.template_cache import clear_template_prototypes
+from payroll_generator.template_stamp import clear_template_stamps, get_template_stamp
+from payroll_generator.templates.designs.template_sample1 import TemplateSample1
+from payroll_generator.templates.designs.template_sample2 import TemplateSample2
+from tests.test_template_cache import sheet_state
+
+
+class TestTemplateStamp(unittest.TestCase):
+    """스탬핑 결과 = openpyxl로 만든 명세서"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        clear_template_stamps()
+        calculator = PayrollCalculator('2025-01')
+        self.employees = [
+            ({'이름': '홍길동', '주민번호': '900101-1234567', '입사일': '2020-01-01', '소속': '개발팀', '직급': ' 대리 ',
+              '식대': 200_000, '기타': '50,000원'},
+             calculator.calculate_deductions({'기본급': 3_000_000, '부양가족수': 1, '상여금': 500_000})),
+            ({'이름': '김<철수>&'}, calculator.calculate_deductions({'기본급': 2_500_000, '부양가족수': 1})),
+        ]
+    
+    def tearDown(self):
+        """테스트 정리"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        clear_template_stamps()
+        clear_template_prototypes()
+    
+    def test_same_as_openpyxl(self):
+        """스탬핑한 명세서와 openpyxl로 만든 명세서의 셀 값/서식이 같음"""
+        for design in [TemplateSample1(), TemplateSample2()]:
+            self.assertIsNotNone(design.get_template_stamp())
+            for index, (employee_data, payroll_data) in enumerate(self.employees):
+                stamped = os.path.join(self.temp_dir, f'stamped_{index}.xlsx')
+                fresh = os.path.join(self.temp_dir, f'openpyxl_{index}.xlsx')
+                for period in ['2025-01', None]:
+                    design.generate_excel(payroll_data, employee_data, stamped, period)
+                    with mock.patch('payroll_generator.template_stamp.get_template_stamp', return_value=None):
+                        design.generate_excel(payroll_data, employee_data, fresh, period)
+                    with zipfile.ZipFile(stamped) as archive:
+                        self.assertIsNone(archive.testzip())
+                    self.assertEqual(sheet_state(stamped), sheet_state(fresh))
+    
+    def test_unstampable_values(self):
+        """날짜/수식 값이나 준비하지 않은 셀은 파일을 쓰지 않고 False (openpyxl로 생성)"""
+        design = TemplateSample1()
+        stamp = design.get_template_stamp()
+        path = os.path.join(self.temp_dir, 'payslip.xlsx')
+        name_cell = design.cell_mapping['employee_name']
+        for fill in [lambda ws: ws.__setitem__(name_cell, datetime(2025, 1, 1)),
+                     lambda ws: ws.__setitem__(name_cell, '=SUM(A1:A2)'),
+                     lambda ws: ws.__setitem__('Z99', 1),
+                     lambda ws: ws.max_row]:
+            self.assertFalse(stamp.render(fill, path))
+            self.assertFalse(os.path.exists(path))
+        
+        employee_data, payroll_data = self.employees[0]
+        design.generate_excel(payroll_data, dict(employee_data, 이름=datetime(2025, 1, 1)), path, '2025-01')
+        self.assertTrue(os.path.exists(path))
+    
+    def test_reloaded_when_template_changes(self):
+        """같은 템플릿/매핑은 한 번만 준비, 템플릿 파일이 바뀌면 다시 준비"""
+        design = TemplateSample1()
+        stamp = design.get_template_stamp()
+        self.assertIs(design.get_template_stamp(), stamp)
+        
+        path = os.path.join(self.temp_dir, 'template.xlsx')
+        with open(design._get_template_path(), 'rb') as src, open(path, 'wb') as dst:
+            dst.write(src.read())
+        args = (design._stamp_key(), design._probe_template_data, design._configure_page_settings)
+        copied = get_template_stamp(path, *args)
+        self.assertIsNot(copied, stamp)
+        os.utime(path, ns=(0, 0))
+        self.assertIsNot(get_template_stamp(path, *args), copied)
+
+
+class TestPayrollWorkbook(unittest.TestCase):
+    """통합 엑셀(직원별 시트) 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        clear_template_stamps()
+        self.handler = ExcelHandler()
+        calculator = PayrollCalculator('2025-01')
+        self.employees = [
+            ({'이름': name, '주민번호': '900101-1234567', '입사일': '2020-01-01'},
+             calculator.calculate_deductions({'기본급': salary, '부양가족수': 1}))
+            for name, salary in [('홍길동', 3_000_000), ('김철수', 2_500_000), ('홍길동', 2_800_000), ('a/b', 2_000_000)]
+        ]
+        self.path = os.path.join(self.temp_dir, 'payroll.xlsx')
+    
+    def tearDown(self):
+        """테스트 정리"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        clear_template_stamps()
+        clear_template_prototypes()
+    
+    def test_same_as_individual_files(self):
+        """시트마다 직원별 파일과 셀 값/서식이 같고, 인쇄 영역은 시트마다 따로"""
+        for design_name in [None, 'template_sample1', 'template_sample2']:
+            with self.handler.open_payroll_workbook(self.path, '2025-01', design_name) as workbook:
+                for employee_data, payroll_data in self.employees:
+                    workbook.add(payroll_data, employee_data)
+            self.assertEqual(workbook.sheet_count, 4)
+            
+            with zipfile.ZipFile(self.path) as archive:
+                self.assertIsNone(archive.testzip())
+            wb = openpyxl.load_workbook(self.path)
+            self.assertEqual(wb.sheetnames, ['홍길동', '김철수', '홍길동 (2)', 'a_b'])
+            self.assertFalse(any(ws.sheet_view.tabSelected for ws in wb.worksheets[1:]))
+            if design_name:
+                self.assertEqual([ws.print_area for ws in wb.worksheets],
+                                 [f"'{title}'!$B$1:$H$28" for title in wb.sheetnames])
+            
+            for index, (employee_data, payroll_data) in enumerate(self.employees):
+                single = os.path.join(self.temp_dir, 'single.xlsx')
+                self.handler.write_payroll(payroll_data, single, employee_data, '2025-01', design_name=design_name)
+                self.assertEqual(sheet_state(self.path, index), sheet_state(single))
+    
+    def test_empty_and_aborted(self):
+        """직원이 없으면 빈 템플릿 시트 1개, 블록에서 예외가 나면 파일 삭제"""
+        with self.handler.open_payroll_workbook(self.path, '2025-01', 'template_sample1'):
+            pass
+        self.assertEqual(len(openpyxl.load_workbook(self.path).sheetnames), 1)
+        
+        employee_data, payroll_data = self.employees[0]
+        with self.assertRaises(ValueError):
+            with self.handler.open_payroll_workbook(self.path, '2025-01', 'template_sample1') as workbook:
+                workbook.add(payroll_data, employee_data)
+                workbook.add(payroll_data, dict(employee_data, 이름=datetime(2025, 1, 1)))
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""근태 기록 집계 테스트"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.timesheet import aggregate_timesheet, apply_timesheet
+
+# 2025년 3월 (3/2, 3/9 일요일)
+TIMESHEET_ROWS = [
+    ('A', '2025-03-02', '09:00', '20:00', 60),   # 휴일 10시간
+    ('A', '2025-03-03', '09:00', '13:00', 0),    # 같은 날 두 번 근무 (합계 10시간)
+    ('B', '2025-03-04', '22:00', '06:00', 0),    # 야간 8시간 (다음 날 퇴근)
+    ('A', '2025-03-03', '14:00', '20:00', 0),
+    ('C', '2025-03-10', '08:00', '16:00', 0),    # 월 ~ 토 8시간씩 (주 48시간)
+    ('C', '2025-03-11', '08:00', '16:00', 0),
+    ('C', '2025-03-12', '08:00', '16:00', 0),
+    ('C', '2025-03-13', '08:00', '16:00', 0),
+    ('C', '2025-03-14', '08:00', '16:00', 0),
+    ('C', '2025-03-15', '08:00', '16:00', 0),
+    ('C', '2025-04-01', '08:00', '16:00', 0),    # 기간 밖
+    ('B', '2025-03-05', '미입력', '18:00', 0),   # 형식 오류
+]
+
+
+class TestTimesheet(unittest.TestCase):
+    """근태 기록 집계 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'timesheet.csv')
+        self.frame = pd.DataFrame(TIMESHEET_ROWS, columns=['이름', '근무일', '출근', '퇴근', '휴게시간'])
+        self.frame.to_csv(self.path, index=False, encoding='cp949')
+    
+    def tearDown(self):
+        """테스트 정리"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_classification(self):
+        """연장/야간/휴일 분류와 환산 시간 (묶음 경계와 무관)"""
+        for chunksize in (2, 100):
+            result = aggregate_timesheet(self.path, '2025-03', chunksize=chunksize)
+            self.assertEqual(result.loc['A'].tolist(), [2, 20.0, 2.0, 0.0, 8.0, 2.0, 19.0])
+            self.assertEqual(result.loc['B'].tolist(), [1, 8.0, 0.0, 8.0, 0.0, 0.0, 4.0])
+            self.assertEqual(result.loc['C'].tolist(), [6, 48.0, 8.0, 0.0, 0.0, 0.0, 12.0])
+    
+    def test_holidays(self):
+        """지정 휴일 근로는 휴일근로"""
+        result = aggregate_timesheet(self.path, '2025-03', holidays=['2025-03-03'])
+        self.assertEqual(result.loc['A', '휴일시간'], 16.0)
+        self.assertEqual(result.loc['A', '휴일연장시간'], 4.0)
+        self.assertEqual(result.loc['A', '연장시간'], 0.0)
+    
+    def test_missing_column(self):
+        """필수 컬럼이 없으면 ValueError"""
+        self.frame.drop(columns='퇴근').to_csv(self.path, index=False)
+        with self.assertRaises(ValueError):
+            aggregate_timesheet(self.path, '2025-03')
+    
+    def test_apply_to_roster(self):
+        """근태 기록이 있는 직원만 연장근무시간 교체"""
+        roster = pd.DataFrame({'이름': ['A', 'B', 'D'], '기본급': [3_000_000] * 3, '연장근무시간': [1, 1, 5]})
+        applied = apply_timesheet(roster, aggregate_timesheet(self.path, '2025-03'))
+        self.assertEqual(applied['연장근무시간'].tolist(), [19.0, 4.0, 5.0])
+        self.assertEqual(applied['야간시간'].fillna(-1).tolist(), [0.0, 8.0, -1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""직원 명부 값 검증 테스트"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.validation import validate_roster
+from tests.test_calculator import make_roster
+
+
+class TestValidateRoster(unittest.TestCase):
+    """명부 검증 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.roster = pd.DataFrame({
+            '이름': ['정상', '금액오류', '날짜오류', '가족오류', '정상'],
+            '주민번호': ['900101-1234568', '900101-1234567', '9013011234567', '850315', np.nan],
+            '입사일': ['2020-01-01', '2021-05-01', '미정', '2022-03-01', '2023-01-01'],
+            '퇴사일': [None, None, None, '2021-01-01', None],
+            '기본급': [3_000_000, '삼백만원', 2_500_000, -1, 2_000_000],
+            '부양가족수': [1, 0, 2, 1.5, 0],
+        }, index=[10, 11, 12, 13, 14])
+    
+    def issue_codes(self, report, row):
+        """행별 (컬럼, 코드) 목록"""
+        issues = report.issues[report.issues['row'] == row]
+        return sorted(zip(issues['column'], issues['code']))
+    
+    def test_report(self):
+        """행 인덱스와 함께 오류/경고 보고"""
+        report = validate_roster(self.roster)
+        self.assertFalse(report.ok)
+        self.assertEqual(report.error_rows, [11, 12, 13])
+        self.assertEqual(self.issue_codes(report, 10), [('이름', 'duplicate_name')])
+        self.assertEqual(self.issue_codes(report, 11), [('기본급', 'not_numeric'), ('주민번호', 'rrn_checksum')])
+        self.assertEqual(self.issue_codes(report, 12), [('입사일', 'invalid_date'), ('주민번호', 'invalid_rrn')])
+        self.assertEqual(self.issue_codes(report, 13),
+                         [('기본급', 'out_of_range'), ('부양가족수', 'not_integer'), ('퇴사일', 'date_order')])
+        self.assertEqual(self.issue_codes(report, 14), [('이름', 'duplicate_name'), ('주민번호', 'empty')])
+        self.assertEqual(list(report.valid_rows(self.roster).index), [10, 14])
+    
+    def test_records_serializable(self):
+        """JSON 응답용 딕셔너리 (행 번호는 int, 빈 값은 None)"""
+        import json
+        report = validate_roster(self.roster)
+        result = json.loads(json.dumps(report.to_dict(limit=3)))
+        self.assertEqual(result['errors'], len(report.errors))
+        self.assertEqual(len(result['issues']), 3)
+        empty = [record for record in report.to_records() if record['code'] == 'empty']
+        self.assertEqual(empty[0]['row'], 14)
+        self.assertIsNone(empty[0]['value'])
+    
+    def test_duplicate_rrn(self):
+        """13자리 주민번호 중복은 오류 (숫자로 읽힌 값 포함)"""
+        roster = self.roster.iloc[[0, 4]].assign(주민번호=['900101-1234568', 9001011234568], 이름=['가', '나'])
+        report = validate_roster(roster)
+        self.assertEqual(report.error_rows, [10, 14])
+        self.assertTrue((report.errors['code'] == 'duplicate_rrn').all())
+    
+    def test_mixed_date_formats(self):
+        """한 컬럼에 날짜 형식이 섞여 있어도 값마다 해석 (오류 없음, 명세서 대상에서 빠지지 않음)"""
+        roster = self.roster.iloc[[0, 0, 0, 0]].assign(
+            이름=['가', '나', '다', '라'],
+            주민번호=['850315', '900101', '920505', '010203'],
+            입사일=['2020-01-01', '2021/05/03', '2022.03.01', pd.Timestamp('2023-01-02')],
+            퇴사일=[None, '2025/03/15', None, '2025.12.31'],
+        ).set_axis([20, 21, 22, 23])
+        report = validate_roster(roster)
+        self.assertTrue(report.issues.empty, report.issues)
+        self.assertEqual(len(report.valid_rows(roster)), 4)
+        
+        roster.loc[21, '퇴사일'] = '2020/12/31'
+        self.assertEqual(self.issue_codes(validate_roster(roster), 21), [('퇴사일', 'date_order')])
+    
+    def test_missing_column(self):
+        """필수 컬럼 누락은 행 없는 오류"""
+        report = validate_roster(self.roster.drop(columns='부양가족수'))
+        missing = report.errors[report.errors['code'] == 'missing_column']
+        self.assertEqual(missing['column'].tolist(), ['부양가족수'])
+        self.assertTrue(missing['row'].isna().all())
+    
+    def test_large_roster_clean(self):
+        """정상 명부는 오류 없음"""
+        roster = make_roster(10_000, seed=2)
+        roster['주민번호'] = [f'{800101 + i % 28:06d}' for i in range(len(roster))]
+        roster['입사일'] = pd.Timestamp('2020-01-01')
+        report = validate_roster(roster)
+        self.assertTrue(report.ok)
+        self.assertEqual(len(report.warnings), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
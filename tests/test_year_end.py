@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""연말정산 시뮬레이션 테스트"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from payroll_generator.calculator import PayrollCalculator
+from payroll_generator.config import ANNUAL_INCOME_TAX_TABLE, PERSONAL_DEDUCTION
+from payroll_generator.year_end import YearEndSettlement, collect_monthly_results
+from tests.test_calculator import make_roster
+
+
+def reference_settlement(monthly_results, dependents):
+    """한 직원의 연말정산 (행 단위 기준 구현, 정수 연산, 결정세액 10원 미만 절사)"""
+    total = sum(r['총지급액'] for r in monthly_results)
+    insurance = sum(r['국민연금'] + r['건강보험'] + r['장기요양'] + r['고용보험'] for r in monthly_results)
+    prepaid = sum(r['소득세'] for r in monthly_results)
+    
+    if total <= 5_000_000:
+        deduction = total * 70 // 100
+    elif total <= 15_000_000:
+        deduction = 3_500_000 + (total - 5_000_000) * 40 // 100
+    elif total <= 45_000_000:
+        deduction = 7_500_000 + (total - 15_000_000) * 15 // 100
+    elif total <= 100_000_000:
+        deduction = 12_000_000 + (total - 45_000_000) * 5 // 100
+    else:
+        deduction = 14_750_000 + (total - 100_000_000) * 2 // 100
+    deduction = min(deduction, 20_000_000, total)
+    
+    taxable = max(total - deduction - PERSONAL_DEDUCTION * (1 + dependents) - insurance, 0)
+    tax = 0
+    for start, end, rate, progressive in ANNUAL_INCOME_TAX_TABLE:
+        if start <= taxable < end:
+            tax = max(0, taxable * round(rate * 100) // 100 - progressive)
+    
+    credit = tax * 55 // 100 if tax <= 1_300_000 else 715_000 + (tax - 1_300_000) * 30 // 100
+    if total <= 33_000_000:
+        limit = 740_000
+    elif total <= 70_000_000:
+        limit = max(660_000, 740_000 - (total - 33_000_000) * 8 // 1000)
+    elif total <= 120_000_000:
+        limit = max(500_000, 660_000 - (total - 70_000_000) // 2)
+    else:
+        limit = max(200_000, 500_000 - (total - 120_000_000) // 2)
+    determined = max(tax - min(credit, limit), 0) // 10 * 10
+    return determined, determined - prepaid
+
+
+class TestYearEndSettlement(unittest.TestCase):
+    """연말정산 테스트"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        roster = make_roster(40, seed=5)
+        roster['기본급'] = roster['기본급'] // 4  # 일반적인 급여 수준
+        self.rosters = {}
+        for month in range(1, 13):
+            monthly = roster.copy()
+            monthly['상여금'] = roster['상여금'] if month in (6, 12) else 0
+            self.rosters[f'2024-{month:02d}'] = monthly
+        self.monthly = collect_monthly_results(self.rosters)
+        self.settlement = YearEndSettlement(2024)
+    
+    def test_matches_reference(self):
+        """행렬 계산이 직원별 행 단위 기준 구현과 동일"""
+        result = self.settlement.settle(self.monthly)
+        self.assertEqual(len(result), 40)
+        self.assertTrue((result['근무월수'] == 12).all())
+        
+        for name in result.index[:15]:
+            monthly_results = []
+            for period, roster in self.rosters.items():
+                row = roster[roster['이름'] == name].iloc[0].to_dict()
+                monthly_results.append(PayrollCalculator(period).calculate_deductions(row))
+            dependents = int(self.rosters['2024-12'].set_index('이름').loc[name, '부양가족수'])
+            determined, settlement = reference_settlement(monthly_results, dependents)
+            self.assertEqual(result.loc[name, '결정세액'], determined, name)
+            self.assertEqual(result.loc[name, '차감징수세액'], settlement, name)
+            self.assertEqual(result.loc[name, '결정지방소득세'], determined // 10 // 10 * 10, name)
+    
+    def test_partial_year_and_other_years(self):
+        """중도 입사자(일부 월)와 다른 연도 행 처리"""
+        monthly = self.monthly[~((self.monthly['이름'] == '직원0') &
+                                 self.monthly['기간'].isin(['2024-01', '2024-02', '2024-03']))]
+        other_year = self.monthly.head(5).assign(기간='2023-12')
+        result = self.settlement.settle(pd.concat([monthly, other_year], ignore_index=True))
+        
+        self.assertEqual(result.loc['직원0', '근무월수'], 9)
+        full = self.settlement.settle(self.monthly)
+        self.assertLess(result.loc['직원0', '총급여'], full.loc['직원0', '총급여'])
+        self.assertEqual(result.loc['직원1', '총급여'], full.loc['직원1', '총급여'])
+    
+    def test_build_matrix(self):
+        """직원 × 12개월 행렬 (같은 월 중복 행은 합산)"""
+        monthly = pd.concat([self.monthly, self.monthly.head(1)], ignore_index=True)
+        employees, matrix, worked = self.settlement.build_matrix(monthly)
+        self.assertEqual(matrix['총지급액'].shape, (40, 12))
+        self.assertTrue(worked.all())
+        
+        first = self.monthly.iloc[0]
+        row = employees.get_loc(first['이름'])
+        self.assertEqual(matrix['총지급액'][row, 0], 2 * first['총지급액'])
+    
+    def test_missing_columns(self):
+        """필수 컬럼이 없으면 ValueError"""
+        with self.assertRaises(ValueError):
+            self.settlement.settle(self.monthly.drop(columns=['소득세']))
+
+
+if __name__ == '__main__':
+    unittest.main()